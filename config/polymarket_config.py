@@ -4,20 +4,59 @@ Configuration settings for Polymarket Arbitrage Bot
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import ClassVar, Dict, List, Optional
 
-load_dotenv()
+from dotenv import dotenv_values
 
+# .env is parsed into a plain dict rather than exported into os.environ, so
+# importing config does not mutate the process environment.  Keys with no
+# value ("KEY" on its own line) parse as None and are dropped.
+_DOTENV: Dict[str, str] = {k: v for k, v in dotenv_values().items() if v is not None}
 
+# Merged lookup table for the class body below: variables already set in the
+# real environment win over .env, matching load_dotenv()'s default of not
+# overriding.  The class body reads ~80 keys at import time; a plain dict
+# avoids a getenv() round-trip per key.  Live changes to .env are picked up
+# by reload(), which re-reads the file.
+_ENV: Dict[str, str] = {**_DOTENV, **os.environ}
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Look up *name* in the process environment, falling back to .env.
+
+    For modules outside config that read their own settings from the
+    environment (e.g. strategy YAML overrides) now that .env values are no
+    longer exported into os.environ.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        value = _DOTENV.get(name, default)
+    return value
+
+
+def _bool(name: str, default: str) -> bool:
+    """Parse a "True"/"False" style flag from the environment snapshot."""
+    return _ENV.get(name, default).lower() == "true"
+
+
+@dataclass(slots=True)
 class PolymarketConfig:
-    """Polymarket configuration settings"""
+    """Polymarket configuration settings
+
+    Slotted dataclass: every setting is a slot on the instance, so attribute
+    reads on the hot scan path resolve through a member descriptor rather than
+    a class-dict fallback.  Deliberately not frozen — reload(), the CLI flags in
+    main.py and the dashboard mode switch all update the live singleton in place.
+    """
 
     # API Configuration
-    POLYMARKET_PRIVATE_KEY = os.getenv("POLYMARKET_PRIVATE_KEY")
-    POLYMARKET_FUNDER_ADDRESS = os.getenv("POLYMARKET_FUNDER_ADDRESS")
-    CLOB_API_URL = "https://clob.polymarket.com"
-    GAMMA_API_URL = "https://gamma-api.polymarket.com"
-    CHAIN_ID = 137  # Polygon chain ID
+    POLYMARKET_PRIVATE_KEY: Optional[str] = _ENV.get("POLYMARKET_PRIVATE_KEY")
+    POLYMARKET_FUNDER_ADDRESS: Optional[str] = _ENV.get("POLYMARKET_FUNDER_ADDRESS")
+    CLOB_API_URL: ClassVar[str] = "https://clob.polymarket.com"
+    GAMMA_API_URL: ClassVar[str] = "https://gamma-api.polymarket.com"
+    CHAIN_ID: ClassVar[int] = 137  # Polygon chain ID
 
     # Relayer API Configuration
     # Relayer keys provide unlimited relay transactions for a single wallet without tier approval.
@@ -25,9 +64,9 @@ class PolymarketConfig:
     # Docs: https://docs.polymarket.com/trading/gasless
     # When RELAYER_ENABLED=True, Relayer auth headers are injected alongside L2 CLOB headers.
     # Relayer mode takes priority over Builder mode if both are configured.
-    RELAYER_ENABLED = os.getenv("RELAYER_ENABLED", "False").lower() == "true"
-    RELAYER_API_KEY = os.getenv("RELAYER_API_KEY")
-    RELAYER_API_KEY_ADDRESS = os.getenv("RELAYER_API_KEY_ADDRESS")
+    RELAYER_ENABLED: bool = _bool("RELAYER_ENABLED", "False")
+    RELAYER_API_KEY: Optional[str] = _ENV.get("RELAYER_API_KEY")
+    RELAYER_API_KEY_ADDRESS: Optional[str] = _ENV.get("RELAYER_API_KEY_ADDRESS")
 
     # Builder Configuration
     # BUILDER_TIER controls which rate limit applies:
@@ -35,16 +74,16 @@ class PolymarketConfig:
     #   verified   — 3,000 relay transactions/day (manual approval via builder@polymarket.com)
     #   partner    — unlimited                    (enterprise / strategic partner)
     # BUILDER_ENABLED must also be True for the SDK to attach builder auth headers to orders.
-    BUILDER_ENABLED = os.getenv("BUILDER_ENABLED", "False").lower() == "true"
-    BUILDER_TIER = os.getenv(
+    BUILDER_ENABLED: bool = _bool("BUILDER_ENABLED", "False")
+    BUILDER_TIER: str = _ENV.get(
         "BUILDER_TIER", "unverified"
     ).lower()  # unverified | verified | partner
-    BUILDER_API_KEY = os.getenv("BUILDER_API_KEY")
-    BUILDER_SECRET = os.getenv("BUILDER_SECRET")
-    BUILDER_PASSPHRASE = os.getenv("BUILDER_PASSPHRASE")
+    BUILDER_API_KEY: Optional[str] = _ENV.get("BUILDER_API_KEY")
+    BUILDER_SECRET: Optional[str] = _ENV.get("BUILDER_SECRET")
+    BUILDER_PASSPHRASE: Optional[str] = _ENV.get("BUILDER_PASSPHRASE")
 
     # Per-tier daily relay transaction limits (used for logging and safe-interval calculation)
-    _TIER_DAILY_LIMITS = {
+    _TIER_DAILY_LIMITS: ClassVar[Dict[str, Optional[int]]] = {
         "unverified": 100,
         "verified": 3_000,
         "partner": None,  # None = unlimited
@@ -89,85 +128,87 @@ class PolymarketConfig:
         return f"{self.BUILDER_TIER} ({limit_str}, builder auth {enabled})"
 
     # Alert Configuration
-    ENABLE_EMAIL_ALERTS = os.getenv("ENABLE_EMAIL_ALERTS", "True").lower() == "true"
-    ENABLE_DISCORD_ALERTS = os.getenv("ENABLE_DISCORD_ALERTS", "True").lower() == "true"
+    ENABLE_EMAIL_ALERTS: bool = _bool("ENABLE_EMAIL_ALERTS", "True")
+    ENABLE_DISCORD_ALERTS: bool = _bool("ENABLE_DISCORD_ALERTS", "True")
 
     # Email Configuration (for alerts)
-    SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-    SMTP_USERNAME = os.getenv("SMTP_USERNAME", "")
-    SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
-    ALERT_EMAIL_FROM = os.getenv("ALERT_EMAIL_FROM", "noreply@example.com")
-    ALERT_EMAIL_TO = os.getenv("ALERT_EMAIL_TO", "")
+    SMTP_SERVER: str = _ENV.get("SMTP_SERVER", "smtp.gmail.com")
+    SMTP_PORT: int = int(_ENV.get("SMTP_PORT", "587"))
+    SMTP_USERNAME: str = _ENV.get("SMTP_USERNAME", "")
+    SMTP_PASSWORD: str = _ENV.get("SMTP_PASSWORD", "")
+    ALERT_EMAIL_FROM: str = _ENV.get("ALERT_EMAIL_FROM", "noreply@example.com")
+    ALERT_EMAIL_TO: str = _ENV.get("ALERT_EMAIL_TO", "")
 
     # Discord Configuration (for alerts)
-    DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
-    DISCORD_MENTION_USER = os.getenv("DISCORD_MENTION_USER", "")
+    DISCORD_WEBHOOK_URL: str = _ENV.get("DISCORD_WEBHOOK_URL", "")
+    DISCORD_MENTION_USER: str = _ENV.get("DISCORD_MENTION_USER", "")
 
     # Trading Mode
     # "paper"      - real Polymarket API prices, simulated order execution (no real money)
     # "simulation" - fully offline, synthetic market data, no API calls
-    TRADING_MODE = os.getenv("TRADING_MODE", "paper").lower()
-    PAPER_TRADING_ONLY = os.getenv("PAPER_TRADING_ONLY", "True").lower() == "true"
+    TRADING_MODE: str = _ENV.get("TRADING_MODE", "paper").lower()
+    PAPER_TRADING_ONLY: bool = _bool("PAPER_TRADING_ONLY", "True")
 
     # Strategy Selection
     # Name of the strategy to load from strategies/registry.py.
     # Set STRATEGY=<name> in .env to switch strategies without code changes.
-    STRATEGY = os.getenv("STRATEGY", "example_strategy")
+    STRATEGY: str = _ENV.get("STRATEGY", "example_strategy")
 
-    FAKE_CURRENCY_BALANCE = float(os.getenv("FAKE_CURRENCY_BALANCE", "10000.00"))
+    FAKE_CURRENCY_BALANCE: float = float(_ENV.get("FAKE_CURRENCY_BALANCE", "10000.00"))
 
     # Dashboard Configuration
-    DASHBOARD_ENABLED = os.getenv("DASHBOARD_ENABLED", "True").lower() == "true"
-    DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", "8080"))
+    DASHBOARD_ENABLED: bool = _bool("DASHBOARD_ENABLED", "True")
+    DASHBOARD_PORT: int = int(_ENV.get("DASHBOARD_PORT", "8080"))
     # Bind to localhost by default so the dashboard is not exposed to the
     # local network.  Set DASHBOARD_HOST=0.0.0.0 in .env only when you
     # intentionally want remote access (e.g., behind a reverse proxy with auth).
-    DASHBOARD_HOST = os.getenv("DASHBOARD_HOST", "127.0.0.1")
+    DASHBOARD_HOST: str = _ENV.get("DASHBOARD_HOST", "127.0.0.1")
     # Optional API key for dashboard authentication.
     # When set, all endpoints (except /api/health) require the header
     # "X-API-Key: <value>".  Leave empty to disable auth (localhost-only default).
-    DASHBOARD_API_KEY = os.getenv("DASHBOARD_API_KEY", "")
+    DASHBOARD_API_KEY: str = _ENV.get("DASHBOARD_API_KEY", "")
 
     # Logging Configuration
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_TO_FILE = os.getenv("LOG_TO_FILE", "True").lower() == "true"
+    LOG_LEVEL: str = _ENV.get("LOG_LEVEL", "INFO")
+    LOG_TO_FILE: bool = _bool("LOG_TO_FILE", "True")
 
     # ── Strategy execution ─────────────────────────────────────────────
-    MAX_POSITIONS = int(os.getenv("MAX_POSITIONS", "5"))
-    CAPITAL_SPLIT_PERCENT = float(os.getenv("CAPITAL_SPLIT_PERCENT", "0.20"))
+    MAX_POSITIONS: int = int(_ENV.get("MAX_POSITIONS", "5"))
+    CAPITAL_SPLIT_PERCENT: float = float(_ENV.get("CAPITAL_SPLIT_PERCENT", "0.20"))
 
     # Fractional Kelly multiplier (0.0–1.0).
     # Full Kelly (1.0) maximises long-run growth but produces extreme volatility.
     # 0.25 (quarter Kelly) is a common conservative starting point.
     # Kelly sizing is applied in OrderExecutor and capped at CAPITAL_SPLIT_PERCENT.
-    KELLY_FRACTION = float(os.getenv("KELLY_FRACTION", "0.25"))
+    KELLY_FRACTION: float = float(_ENV.get("KELLY_FRACTION", "0.25"))
 
     # No-signal sizing floor (fraction of balance). When an opportunity carries
     # no usable win probability (no model_prob and confidence <= 0), Kelly has
     # no edge to size on and the executor stakes this MINIMUM — never the
     # CAPITAL_SPLIT_PERCENT cap. Set to 0.0 to refuse signal-less trades.
-    MIN_POSITION_PCT = float(os.getenv("MIN_POSITION_PCT", "0.02"))
+    MIN_POSITION_PCT: float = float(_ENV.get("MIN_POSITION_PCT", "0.02"))
 
     # Maximum open positions allowed within a single market category (crypto, fed, etc.).
     # Prevents over-concentration in correlated markets.  Set to 0 to disable.
-    MAX_POSITIONS_PER_CATEGORY = int(os.getenv("MAX_POSITIONS_PER_CATEGORY", "2"))
+    MAX_POSITIONS_PER_CATEGORY: int = int(_ENV.get("MAX_POSITIONS_PER_CATEGORY", "2"))
 
     # Stop-loss: close a position when price drops this % below entry (0 = disabled).
-    STOP_LOSS_PERCENT = float(os.getenv("STOP_LOSS_PERCENT", "0.0"))
+    STOP_LOSS_PERCENT: float = float(_ENV.get("STOP_LOSS_PERCENT", "0.0"))
 
     # Minimum confidence threshold (0.0–1.0); strategy-computed, discards low-quality signals.
-    MIN_CONFIDENCE = float(os.getenv("MIN_CONFIDENCE", "0.5"))
+    MIN_CONFIDENCE: float = float(_ENV.get("MIN_CONFIDENCE", "0.5"))
 
     # Liquidity filter: skip markets below this USD volume threshold.
-    MIN_VOLUME_USD = float(os.getenv("MIN_VOLUME_USD", "1000.0"))
+    MIN_VOLUME_USD: float = float(_ENV.get("MIN_VOLUME_USD", "1000.0"))
 
     # Market categories to scan (comma-separated). Strategies may override this.
-    SCAN_CATEGORIES = [
-        c.strip()
-        for c in os.getenv("SCAN_CATEGORIES", "crypto,fed,regulatory,other").split(",")
-        if c.strip()
-    ]
+    SCAN_CATEGORIES: List[str] = field(
+        default_factory=lambda: [
+            c.strip()
+            for c in _ENV.get("SCAN_CATEGORIES", "crypto,fed,regulatory,other").split(",")
+            if c.strip()
+        ]
+    )
 
     # Scanning Configuration
     # WARNING: Each scan makes ~4 API calls (one per market category).
@@ -176,74 +217,77 @@ class PolymarketConfig:
     #   verified   — 3,000 relay tx/day → 750 scans/day → ~115,200 ms  (~2 min)
     #   partner    — unlimited          →  no hard limit → 30,000 ms   (30s default)
     # Override via SCAN_INTERVAL_MS in .env. Defaults to 30s (safe for verified/partner).
-    SCAN_INTERVAL_MS = int(os.getenv("SCAN_INTERVAL_MS", "30000"))
+    SCAN_INTERVAL_MS: int = int(_ENV.get("SCAN_INTERVAL_MS", "30000"))
 
     # Market Categories
-    ENABLE_CRYPTO_MARKETS = os.getenv("ENABLE_CRYPTO_MARKETS", "True").lower() == "true"
-    ENABLE_FED_MARKETS = os.getenv("ENABLE_FED_MARKETS", "True").lower() == "true"
-    ENABLE_REGULATORY_MARKETS = os.getenv("ENABLE_REGULATORY_MARKETS", "True").lower() == "true"
-    ENABLE_OTHER_MARKETS = os.getenv("ENABLE_OTHER_MARKETS", "True").lower() == "true"
+    ENABLE_CRYPTO_MARKETS: bool = _bool("ENABLE_CRYPTO_MARKETS", "True")
+    ENABLE_FED_MARKETS: bool = _bool("ENABLE_FED_MARKETS", "True")
+    ENABLE_REGULATORY_MARKETS: bool = _bool("ENABLE_REGULATORY_MARKETS", "True")
+    ENABLE_OTHER_MARKETS: bool = _bool("ENABLE_OTHER_MARKETS", "True")
 
     # Market Priority (1=highest, 5=lowest)
-    PRIORITY_CRYPTO = int(os.getenv("PRIORITY_CRYPTO", "1"))
-    PRIORITY_FED = int(os.getenv("PRIORITY_FED", "2"))
-    PRIORITY_REGULATORY = int(os.getenv("PRIORITY_REGULATORY", "3"))
-    PRIORITY_OTHER = int(os.getenv("PRIORITY_OTHER", "4"))
+    PRIORITY_CRYPTO: int = int(_ENV.get("PRIORITY_CRYPTO", "1"))
+    PRIORITY_FED: int = int(_ENV.get("PRIORITY_FED", "2"))
+    PRIORITY_REGULATORY: int = int(_ENV.get("PRIORITY_REGULATORY", "3"))
+    PRIORITY_OTHER: int = int(_ENV.get("PRIORITY_OTHER", "4"))
 
     # Execution Settings
     # ORDER_TYPE is intentionally absent: Polymarket's CLOB requires FOK (Fill-or-Kill)
     # for all market orders at the protocol level. The SDK hardcodes OrderType.FOK and
     # the exchange rejects any other type — it is not a user-configurable value.
-    SLIPPAGE_TOLERANCE_PERCENT = float(os.getenv("SLIPPAGE_TOLERANCE_PERCENT", "5.0"))
-    TAKER_FEE_PERCENT = float(os.getenv("TAKER_FEE_PERCENT", "2.0"))
-    MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-    RETRY_DELAY_MS = int(os.getenv("RETRY_DELAY_MS", "100"))
+    SLIPPAGE_TOLERANCE_PERCENT: float = float(_ENV.get("SLIPPAGE_TOLERANCE_PERCENT", "5.0"))
+    TAKER_FEE_PERCENT: float = float(_ENV.get("TAKER_FEE_PERCENT", "2.0"))
+    MAX_RETRIES: int = int(_ENV.get("MAX_RETRIES", "3"))
+    RETRY_DELAY_MS: int = int(_ENV.get("RETRY_DELAY_MS", "100"))
+    # In-memory order window behind the dashboard trades / execution-stats views.
+    # Older orders are already persisted via the trades table.  Restart required.
+    ORDER_HISTORY_MAX: int = int(_ENV.get("ORDER_HISTORY_MAX", "500"))
 
     # Power management (Windows only)
     # PREVENT_SLEEP=true  — blocks Windows idle sleep while the bot runs.
     # To also keep running when the lid is closed you must separately set
     # Windows Settings → Power → "When I close the lid" → "Do nothing".
-    PREVENT_SLEEP = os.getenv("PREVENT_SLEEP", "False").lower() == "true"
+    PREVENT_SLEEP: bool = _bool("PREVENT_SLEEP", "False")
 
     # SQLite — trades, positions, PnL history
-    DB_ENABLED = os.getenv("DB_ENABLED", "True").lower() == "true"
-    DB_PATH = os.getenv("DB_PATH", "./storage/trading.db")
+    DB_ENABLED: bool = _bool("DB_ENABLED", "True")
+    DB_PATH: str = _ENV.get("DB_PATH", "./storage/trading.db")
 
     # ScyllaDB — order book snapshot storage
-    SCYLLA_ENABLED = os.getenv("SCYLLA_ENABLED", "False").lower() == "true"
-    SCYLLA_HOST = os.getenv("SCYLLA_HOST", "127.0.0.1")
-    SCYLLA_PORT = int(os.getenv("SCYLLA_PORT", "9042"))
-    SCYLLA_KEYSPACE = os.getenv("SCYLLA_KEYSPACE", "polymarket")
+    SCYLLA_ENABLED: bool = _bool("SCYLLA_ENABLED", "False")
+    SCYLLA_HOST: str = _ENV.get("SCYLLA_HOST", "127.0.0.1")
+    SCYLLA_PORT: int = int(_ENV.get("SCYLLA_PORT", "9042"))
+    SCYLLA_KEYSPACE: str = _ENV.get("SCYLLA_KEYSPACE", "polymarket")
 
     # Session storage — per-strategy JSON exports for charting and algo processing
-    SESSIONS_DIR = os.getenv("SESSIONS_DIR", "./logs/sessions")
+    SESSIONS_DIR: str = _ENV.get("SESSIONS_DIR", "./logs/sessions")
 
     # Ollama — local LLM used to generate end-of-session strategy reviews
-    OLLAMA_ENABLED = os.getenv("OLLAMA_ENABLED", "False").lower() == "true"
-    OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+    OLLAMA_ENABLED: bool = _bool("OLLAMA_ENABLED", "False")
+    OLLAMA_HOST: str = _ENV.get("OLLAMA_HOST", "http://localhost:11434")
+    OLLAMA_MODEL: str = _ENV.get("OLLAMA_MODEL", "llama3.2:3b")
 
     # ── External Data APIs ────────────────────────────────────────────────────
     # Master toggle. Set False to disable all external API calls (Binance,
     # Fear & Greed, FRED). ExternalDataBus returns an empty snapshot instantly.
-    EXTERNAL_DATA_ENABLED = os.getenv("EXTERNAL_DATA_ENABLED", "True").lower() == "true"
+    EXTERNAL_DATA_ENABLED: bool = _bool("EXTERNAL_DATA_ENABLED", "True")
 
     # FRED API key (free) — https://fred.stlouisfed.org/docs/api/api_key.html
     # Leave empty to disable macro data (Fed Funds, CPI, PCE, unemployment).
     # When empty, FREDProvider.fetch_all() returns {} without making any calls.
-    FRED_API_KEY = os.getenv("FRED_API_KEY", "")
+    FRED_API_KEY: str = _ENV.get("FRED_API_KEY", "")
 
     # Comma-separated list of crypto base symbols to track via Binance.
     # Each symbol is paired with USDT for Binance requests (BTC → BTCUSDT).
     # RSI is computed for every symbol in this list (one klines call each).
-    EXTERNAL_CRYPTO_SYMBOLS = os.getenv("EXTERNAL_CRYPTO_SYMBOLS", "BTC,ETH,SOL")
+    EXTERNAL_CRYPTO_SYMBOLS: str = _ENV.get("EXTERNAL_CRYPTO_SYMBOLS", "BTC,ETH,SOL")
 
     # Cache TTLs for each data category (seconds).
     # Crypto prices update in real-time — 15s keeps data fresh without hammering Binance.
     # Fear & Greed and FRED macro update daily/monthly — 1h is more than sufficient.
-    EXTERNAL_CRYPTO_TTL_S = int(os.getenv("EXTERNAL_CRYPTO_TTL_S", "15"))
-    EXTERNAL_FNG_TTL_S = int(os.getenv("EXTERNAL_FNG_TTL_S", "3600"))
-    EXTERNAL_MACRO_TTL_S = int(os.getenv("EXTERNAL_MACRO_TTL_S", "3600"))
+    EXTERNAL_CRYPTO_TTL_S: int = int(_ENV.get("EXTERNAL_CRYPTO_TTL_S", "15"))
+    EXTERNAL_FNG_TTL_S: int = int(_ENV.get("EXTERNAL_FNG_TTL_S", "3600"))
+    EXTERNAL_MACRO_TTL_S: int = int(_ENV.get("EXTERNAL_MACRO_TTL_S", "3600"))
 
     def __repr__(self) -> str:
         """
@@ -393,6 +437,10 @@ class PolymarketConfig:
         need deterministic config values without monkey-patching the
         global singleton.
 
+        Every key must name a PolymarketConfig field; an unknown key (e.g. a
+        typo) raises TypeError instead of being silently set as a stray
+        attribute.
+
         Example::
 
             cfg = PolymarketConfig.from_dict({
@@ -401,14 +449,16 @@ class PolymarketConfig:
                 "FAKE_CURRENCY_BALANCE": 500.0,
             })
         """
-        instance = cls.__new__(cls)
-        # Copy every attribute from the live singleton as the baseline.
-        instance.__dict__.update(config.__dict__)
-        # Apply caller-supplied overrides.
-        for key, value in overrides.items():
-            setattr(instance, key, value)
-        return instance
+        # Copy every field from the live singleton as the baseline and apply
+        # caller-supplied overrides on top.
+        return replace(config, **overrides)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> PolymarketConfig:
+    """Return the process-wide PolymarketConfig, constructing it on first call."""
+    return PolymarketConfig()
 
 
 # Global config instance
-config = PolymarketConfig()
+config = get_config()
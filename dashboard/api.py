@@ -3,18 +3,21 @@ Dashboard API Module
 REST API for monitoring and controlling the trading bot
 """
 
+import functools
 import os
 import statistics as _stats
 import threading
+import time
+import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Dict, List, Literal, Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 import uvicorn
 
 from config.polymarket_config import config
@@ -49,6 +52,21 @@ def _get_backtest_db():
     return _backtest_db
 
 
+@functools.lru_cache(maxsize=1)
+def _iso_for_second(_second: int) -> str:
+    return datetime.now().isoformat()
+
+
+def _now_iso() -> str:
+    """Local wall-clock timestamp for responses, formatted at most once per second.
+
+    /api/status and /api/health are polled continuously by every open dashboard
+    tab; keying the cache on the integer monotonic second means concurrent polls
+    share one formatted string instead of each allocating a new one.
+    """
+    return _iso_for_second(int(time.monotonic()))
+
+
 def set_bot_instance(bot) -> None:
     """Register the TradingBot with the dashboard. Called once by main.py."""
     global _bot_instance
@@ -62,10 +80,34 @@ def _get_bot_instance():
         return _bot_instance
 
 
+# Dashboard pages.  "/" and "/backtest" stay explicit routes rather than a
+# StaticFiles(html=True) mount at "/" so that they keep the _auth dependency and
+# cannot shadow unmatched /api/* paths.  index.html is read once into memory;
+# backtest.html goes through FileResponse, which streams from disk in chunks.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+_INDEX_HTML_PATH = os.path.join(_STATIC_DIR, "index.html")
+_BACKTEST_HTML_PATH = os.path.join(_STATIC_DIR, "backtest.html")
+_index_html: Optional[bytes] = None
+
+
+def _load_index_html() -> Optional[bytes]:
+    """Return the cached dashboard page, reading it on first use. None if missing."""
+    global _index_html
+    if _index_html is None:
+        try:
+            with open(_INDEX_HTML_PATH, "rb") as f:
+                _index_html = f.read()
+        except FileNotFoundError:
+            return None
+    return _index_html
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager"""
     logger.info("Dashboard API starting...")
+    # Warm the page cache so the first browser hit doesn't touch the disk.
+    _load_index_html()
     yield
     logger.info("Dashboard API shutting down...")
 
@@ -79,9 +121,8 @@ app = FastAPI(
 )
 
 # Add static files mount
-static_dir = os.path.join(os.path.dirname(__file__), "static")
-if os.path.exists(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+if os.path.exists(_STATIC_DIR):
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
 
 # Add CORS middleware — restrict to localhost origins so the dashboard is not
 # reachable from arbitrary third-party websites even if the port is exposed.
@@ -120,7 +161,18 @@ _auth = Depends(verify_api_key)
 
 
 # Request/Response Models
-class BotStatusResponse(BaseModel):
+class _FrozenResponse(BaseModel):
+    """Base for read-only API responses.
+
+    Responses are built once per request and never mutated, so freezing them is
+    free; together with response_model it keeps FastAPI on pydantic-core's
+    model_dump_json() serialiser rather than a Python-level field walk.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class BotStatusResponse(_FrozenResponse):
     """Bot status response"""
 
     running: bool
@@ -135,8 +187,14 @@ class BotStatusResponse(BaseModel):
     last_update: str
 
 
-class PositionResponse(BaseModel):
-    """Position response"""
+class PositionResponse(_FrozenResponse):
+    """Position response
+
+    Built with model_construct() from trusted in-process Position objects, so
+    per-field validation is skipped on the hot /api/positions path.
+    """
+
+    model_config = ConfigDict(extra="ignore")
 
     position_id: str
     market_id: str
@@ -149,16 +207,22 @@ class PositionResponse(BaseModel):
     edge_percent: float
     entry_fee: float
     status: str
-    opened_at: Optional[str]
-    settled_at: Optional[str]
-    settlement_price: Optional[float]
+    opened_at: Optional[str] = None
+    settled_at: Optional[str] = None
+    settlement_price: Optional[float] = None
     exit_fee: float
-    gross_pnl: Optional[float]
-    realized_pnl: Optional[float]
+    gross_pnl: Optional[float] = None
+    realized_pnl: Optional[float] = None
 
 
-class TradeResponse(BaseModel):
-    """Trade response"""
+class TradeResponse(_FrozenResponse):
+    """Trade response
+
+    Built with model_construct() — inputs come from the executor's order history
+    and the session store, both written by this process.
+    """
+
+    model_config = ConfigDict(extra="ignore")
 
     order_id: str
     position_id: str
@@ -173,11 +237,11 @@ class TradeResponse(BaseModel):
     slippage_pct: float
     executed_at: str
     status: str
-    gross_pnl: Optional[float]
-    pnl: Optional[float]
+    gross_pnl: Optional[float] = None
+    pnl: Optional[float] = None
 
 
-class PnLResponse(BaseModel):
+class PnLResponse(_FrozenResponse):
     """PnL response"""
 
     total_trades: int
@@ -196,7 +260,7 @@ class PnLResponse(BaseModel):
     initial_balance: float
 
 
-class ConfigResponse(BaseModel):
+class ConfigResponse(_FrozenResponse):
     """Configuration response"""
 
     max_positions: int
@@ -251,16 +315,11 @@ def is_bot_available():
 # Dashboard Routes
 @app.get("/", response_class=HTMLResponse, dependencies=[_auth])
 async def get_dashboard():
-    """Serve the dashboard HTML page"""
-    try:
-        # Get working directory path
-        import os
-
-        dashboard_path = os.path.join(os.path.dirname(__file__), "static", "index.html")
-        with open(dashboard_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
+    """Serve the dashboard HTML page (read from disk once, then served from memory)"""
+    html = _load_index_html()
+    if html is None:
         return HTMLResponse(content="<h1>Dashboard not found</h1><p>Static files not available</p>")
+    return HTMLResponse(content=html)
 
 
 # Status Endpoints
@@ -294,7 +353,7 @@ async def get_status():
             total_pnl=pnl_summary.total_pnl,
             win_rate=pnl_summary.win_rate,
             uptime=uptime,
-            last_update=datetime.now().isoformat(),
+            last_update=_now_iso(),
         )
     except HTTPException:
         raise
@@ -316,7 +375,7 @@ async def get_health():
                 pass
         return {
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "bot_registered": bot is not None,
             "bot_running": bot.running if bot is not None else False,
             "session_trades_in_db": session_trades,
@@ -397,7 +456,7 @@ async def get_positions(status: Optional[Literal["open", "settled"]] = None):
             positions = bot.position_tracker.get_all_positions()
 
         return [
-            PositionResponse(
+            PositionResponse.model_construct(
                 position_id=p.position_id,
                 market_id=p.market_id,
                 market_slug=p.market_slug,
@@ -426,75 +485,102 @@ async def get_positions(status: Optional[Literal["open", "settled"]] = None):
 
 
 # Trade Endpoints
+def _collect_trades(bot, limit: int) -> List[TradeResponse]:
+    """Current-session orders merged with historical session trades, newest first."""
+    results: list = []
+
+    # Current session: individual BUY/SELL orders from executor (in-memory)
+    orders = bot.executor.get_order_history(limit=limit)
+    current_position_ids: set = set()
+    for o in orders:
+        current_position_ids.add(o.get("position_id", ""))
+        results.append(
+            TradeResponse.model_construct(
+                order_id=o["order_id"],
+                position_id=o["position_id"],
+                action=o["action"],
+                market_id=o["market_id"],
+                market_slug=o["market_slug"],
+                token_id=o["token_id"],
+                quantity=o["quantity"],
+                price=o["price"],
+                total=o["total"],
+                fee=o.get("fee", 0.0),
+                slippage_pct=o.get("slippage_pct", 0.0),
+                executed_at=(
+                    o["executed_at"].isoformat()
+                    if isinstance(o["executed_at"], datetime)
+                    else str(o["executed_at"])
+                ),
+                status=o["status"],
+                gross_pnl=o.get("gross_pnl"),
+                pnl=o.get("pnl"),
+            )
+        )
+
+    # Historical: completed round-trip trades from session store (survives restarts)
+    # Skip any position already in the current executor history to avoid duplicates.
+    if getattr(bot, "session_store", None) is not None:
+        session_trades = bot.session_store.get_all_trades(limit=limit)
+        for t in session_trades:
+            if t.get("position_id") in current_position_ids:
+                continue
+            results.append(
+                TradeResponse.model_construct(
+                    order_id=t["trade_id"],
+                    position_id=t["position_id"],
+                    action="SETTLED",
+                    market_id=t["market_id"],
+                    market_slug=t.get("market_slug") or "",
+                    token_id=t.get("winning_token_id") or "",
+                    quantity=float(t.get("shares") or 0),
+                    price=float(t.get("entry_price") or 0),
+                    total=float(t.get("allocated_capital") or 0),
+                    fee=float((t.get("entry_fee") or 0) + (t.get("exit_fee") or 0)),
+                    slippage_pct=0.0,
+                    executed_at=t.get("exit_time") or t.get("entry_time") or "",
+                    status=t.get("outcome") or "SETTLED",
+                    gross_pnl=t.get("gross_pnl"),
+                    pnl=t.get("net_pnl"),
+                )
+            )
+
+    # Sort newest first and cap at requested limit
+    results.sort(key=lambda x: x.executed_at or "", reverse=True)
+    return results[:limit]
+
+
+_TRADES_ADAPTER = TypeAdapter(List[TradeResponse])
+# (signature, body) of the last /api/trades response.  The dashboard polls the
+# endpoint every few seconds and almost always nothing has changed, so the
+# merged, sorted and serialised body is reused until the signature moves.
+_trades_body_cache: Optional[tuple] = None
+
+
+def _trades_signature(bot, limit: int) -> Optional[tuple]:
+    """Change counters behind /api/trades, or None when they are unavailable."""
+    orders_version = getattr(bot.executor, "orders_version", None)
+    store = getattr(bot, "session_store", None)
+    trades_version = getattr(store, "trades_version", 0) if store is not None else 0
+    if not isinstance(orders_version, int) or not isinstance(trades_version, int):
+        return None
+    return (id(bot), orders_version, id(store), trades_version, limit)
+
+
 @app.get("/api/trades", response_model=List[TradeResponse], dependencies=[_auth])
 async def get_trades(limit: int = Query(default=50, ge=1, le=500)):
     """Get recent trades — current-session order history merged with historical session trades."""
+    global _trades_body_cache
     try:
         bot = _get_bot_instance()
         if bot is None:
             return []
-
-        results: list = []
-
-        # Current session: individual BUY/SELL orders from executor (in-memory)
-        orders = bot.executor.get_order_history(limit=limit)
-        current_position_ids: set = set()
-        for o in orders:
-            current_position_ids.add(o.get("position_id", ""))
-            results.append(
-                TradeResponse(
-                    order_id=o["order_id"],
-                    position_id=o["position_id"],
-                    action=o["action"],
-                    market_id=o["market_id"],
-                    market_slug=o["market_slug"],
-                    token_id=o["token_id"],
-                    quantity=o["quantity"],
-                    price=o["price"],
-                    total=o["total"],
-                    fee=o.get("fee", 0.0),
-                    slippage_pct=o.get("slippage_pct", 0.0),
-                    executed_at=(
-                        o["executed_at"].isoformat()
-                        if isinstance(o["executed_at"], datetime)
-                        else str(o["executed_at"])
-                    ),
-                    status=o["status"],
-                    gross_pnl=o.get("gross_pnl"),
-                    pnl=o.get("pnl"),
-                )
-            )
-
-        # Historical: completed round-trip trades from session store (survives restarts)
-        # Skip any position already in the current executor history to avoid duplicates.
-        if getattr(bot, "session_store", None) is not None:
-            session_trades = bot.session_store.get_all_trades(limit=limit)
-            for t in session_trades:
-                if t.get("position_id") in current_position_ids:
-                    continue
-                results.append(
-                    TradeResponse(
-                        order_id=t["trade_id"],
-                        position_id=t["position_id"],
-                        action="SETTLED",
-                        market_id=t["market_id"],
-                        market_slug=t.get("market_slug") or "",
-                        token_id=t.get("winning_token_id") or "",
-                        quantity=float(t.get("shares") or 0),
-                        price=float(t.get("entry_price") or 0),
-                        total=float(t.get("allocated_capital") or 0),
-                        fee=float((t.get("entry_fee") or 0) + (t.get("exit_fee") or 0)),
-                        slippage_pct=0.0,
-                        executed_at=t.get("exit_time") or t.get("entry_time") or "",
-                        status=t.get("outcome") or "SETTLED",
-                        gross_pnl=t.get("gross_pnl"),
-                        pnl=t.get("net_pnl"),
-                    )
-                )
-
-        # Sort newest first and cap at requested limit
-        results.sort(key=lambda x: x.executed_at or "", reverse=True)
-        return results[:limit]
+        signature = _trades_signature(bot, limit)
+        cached = _trades_body_cache
+        if signature is None or cached is None or cached[0] != signature:
+            body = _TRADES_ADAPTER.dump_json(_collect_trades(bot, limit))
+            cached = _trades_body_cache = (signature, body)
+        return Response(content=cached[1], media_type="application/json")
 
     except HTTPException:
         raise
@@ -503,6 +589,28 @@ async def get_trades(limit: int = Query(default=50, ge=1, le=500)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/trades/stream", dependencies=[_auth])
+async def stream_trades(limit: int = Query(default=1000, ge=1, le=10_000)):
+    """Same rows as /api/trades as newline-delimited JSON, with limit up to 10,000.
+
+    Rows are merged, sorted and capped in memory first, exactly as for
+    /api/trades; only serialisation is per row, as the response is written,
+    so no single JSON body for the whole result is built.
+    """
+    try:
+        bot = _get_bot_instance()
+        trades = _collect_trades(bot, limit) if bot is not None else []
+    except Exception as e:
+        logger.error(f"Error streaming trades: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    def _ndjson():
+        for t in trades:
+            yield t.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 # Execution Stats Endpoint
 @app.get("/api/execution/stats", dependencies=[_auth])
 async def get_execution_stats():
@@ -787,7 +895,7 @@ async def get_config():
 
 
 # ── Settings Models ────────────────────────────────────────────────────
-class SettingsResponse(BaseModel):
+class SettingsResponse(_FrozenResponse):
     """
     All user-editable settings returned by GET /api/settings.
 
@@ -1100,22 +1208,22 @@ class BacktestRunRequest(BaseModel):
     category: str = "crypto"
 
 
-class BacktestRunSummary(BaseModel):
+class BacktestRunSummary(_FrozenResponse):
     run_id: str
     strategy_name: str
     started_at: str
-    finished_at: Optional[str]
+    finished_at: Optional[str] = None
     status: str
-    market_count: Optional[int]
-    trade_count: Optional[int]
-    total_return_pct: Optional[float]
-    annualized_return: Optional[float]
-    max_drawdown: Optional[float]
-    sharpe_ratio: Optional[float]
-    win_rate: Optional[float]
-    profit_factor: Optional[float]
-    consec_wins_max: Optional[int]
-    consec_losses_max: Optional[int]
+    market_count: Optional[int] = None
+    trade_count: Optional[int] = None
+    total_return_pct: Optional[float] = None
+    annualized_return: Optional[float] = None
+    max_drawdown: Optional[float] = None
+    sharpe_ratio: Optional[float] = None
+    win_rate: Optional[float] = None
+    profit_factor: Optional[float] = None
+    consec_wins_max: Optional[int] = None
+    consec_losses_max: Optional[int] = None
 
 
 class BacktestRunDetail(BacktestRunSummary):
@@ -1130,10 +1238,7 @@ class BacktestRunDetail(BacktestRunSummary):
 
 @app.get("/backtest", dependencies=[_auth])
 async def backtest_page():
-    import os
-    from fastapi.responses import FileResponse
-
-    return FileResponse(os.path.join(os.path.dirname(__file__), "static", "backtest.html"))
+    return FileResponse(_BACKTEST_HTML_PATH)
 
 
 @app.get("/api/backtest/strategies", dependencies=[_auth])
@@ -1145,8 +1250,6 @@ async def list_strategies():
 
 @app.post("/api/backtest/run", dependencies=[_auth])
 async def start_backtest(req: BacktestRunRequest):
-    import uuid
-
     from backtesting.config import BacktestConfig
     from backtesting.runner import BacktestRunner
 
@@ -1196,9 +1299,14 @@ def start_dashboard(port: int = 8080, host: str = config.DASHBOARD_HOST):
     """Start the dashboard server"""
     logger.info(f"Starting dashboard server on {host}:{port}")
 
+    # loop/http default to "auto", which already selects uvloop and httptools when
+    # they are installed (uvicorn[standard]) and falls back to asyncio/h11 where
+    # they are not (uvloop has no Windows build).  A single worker is required:
+    # the API reads the TradingBot instance from this process's memory.
     uvicorn.run(
         "dashboard.api:app",
         host=host,
         port=port,
         log_level="info",
+        access_log=False,
     )
@@ -12,10 +12,80 @@ import os
 import sqlite3
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Connection pragmas for the bot's SQLite files.  WAL lets the dashboard read
+# while the trading loop writes, and synchronous=NORMAL syncs at checkpoints
+# rather than on every commit — an application crash loses nothing, a power
+# cut can drop the last few commits but cannot corrupt the file.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+_UPSERT_POSITION_SQL = """
+    INSERT INTO positions (
+        position_id, strategy_name, market_id, market_slug, question,
+        token_id_yes, token_id_no, winning_token_id,
+        shares, entry_price, allocated_capital,
+        expected_profit, edge_percent, neg_risk,
+        category, slippage_pct, entry_fee, exit_fee,
+        status, opened_at, settled_at, settlement_price, realized_pnl
+    ) VALUES (
+        :position_id, :strategy_name, :market_id, :market_slug, :question,
+        :token_id_yes, :token_id_no, :winning_token_id,
+        :shares, :entry_price, :allocated_capital,
+        :expected_profit, :edge_percent, :neg_risk,
+        :category, :slippage_pct, :entry_fee, :exit_fee,
+        :status, :opened_at, :settled_at, :settlement_price, :realized_pnl
+    )
+    ON CONFLICT(position_id) DO UPDATE SET
+        status           = excluded.status,
+        settled_at       = excluded.settled_at,
+        settlement_price = excluded.settlement_price,
+        exit_fee         = excluded.exit_fee,
+        realized_pnl     = excluded.realized_pnl
+"""
+
+_UPSERT_TRADE_SQL = """
+    INSERT INTO trades (
+        trade_id, strategy_name, position_id, market_id, action,
+        quantity, entry_price, exit_price,
+        entry_time, exit_time,
+        pnl, pnl_percent, gross_pnl,
+        entry_fee, exit_fee, slippage_pct
+    ) VALUES (
+        :trade_id, :strategy_name, :position_id, :market_id, :action,
+        :quantity, :entry_price, :exit_price,
+        :entry_time, :exit_time,
+        :pnl, :pnl_percent, :gross_pnl,
+        :entry_fee, :exit_fee, :slippage_pct
+    )
+    ON CONFLICT(trade_id) DO UPDATE SET
+        exit_price  = excluded.exit_price,
+        exit_time   = excluded.exit_time,
+        pnl         = excluded.pnl,
+        pnl_percent = excluded.pnl_percent,
+        gross_pnl   = excluded.gross_pnl,
+        exit_fee    = excluded.exit_fee
+"""
+
+_INSERT_PNL_SQL = "INSERT INTO pnl_history (recorded_at, balance, pnl) VALUES (?, ?, ?)"
+
+
+def apply_sqlite_pragmas(conn) -> None:
+    """Apply _SQLITE_PRAGMAS to a freshly opened sqlite3 connection."""
+    for stmt in _SQLITE_PRAGMAS:
+        conn.execute(stmt)
+
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS positions (
     position_id         TEXT PRIMARY KEY,
@@ -67,11 +137,16 @@ CREATE TABLE IF NOT EXISTS pnl_history (
     pnl                 REAL NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_positions_status    ON positions(status);
+-- (status, opened_at) serves get_positions(status=...) ORDER BY opened_at
+-- without a sort step; it also covers plain status lookups, so the old
+-- single-column status index is dropped.
+DROP INDEX IF EXISTS idx_positions_status;
+CREATE INDEX IF NOT EXISTS idx_positions_status_opened ON positions(status, opened_at);
 CREATE INDEX IF NOT EXISTS idx_positions_opened    ON positions(opened_at);
 CREATE INDEX IF NOT EXISTS idx_positions_strategy  ON positions(strategy_name);
 CREATE INDEX IF NOT EXISTS idx_trades_position     ON trades(position_id);
 CREATE INDEX IF NOT EXISTS idx_trades_exit         ON trades(exit_time);
+CREATE INDEX IF NOT EXISTS idx_trades_entry        ON trades(entry_time);
 CREATE INDEX IF NOT EXISTS idx_trades_strategy     ON trades(strategy_name);
 CREATE INDEX IF NOT EXISTS idx_pnl_recorded        ON pnl_history(recorded_at);
 """
@@ -117,6 +192,7 @@ class TradeDatabase:
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
             )
             self._conn.row_factory = sqlite3.Row
+            apply_sqlite_pragmas(self._conn)
             # Migrations run first: they add any missing columns to existing
             # tables so that the subsequent executescript (which creates indexes
             # referencing those columns) does not fail on old databases.
@@ -151,42 +227,7 @@ class TradeDatabase:
         Accepts a Position dataclass (from portfolio/position_tracker.py).
         On conflict only the mutable settlement fields are updated.
         """
-        if self._conn is None:
-            return False
-        try:
-            d = position.to_dict()
-            with self._lock:
-                self._conn.execute(
-                    """
-                    INSERT INTO positions (
-                        position_id, strategy_name, market_id, market_slug, question,
-                        token_id_yes, token_id_no, winning_token_id,
-                        shares, entry_price, allocated_capital,
-                        expected_profit, edge_percent, neg_risk,
-                        category, slippage_pct, entry_fee, exit_fee,
-                        status, opened_at, settled_at, settlement_price, realized_pnl
-                    ) VALUES (
-                        :position_id, :strategy_name, :market_id, :market_slug, :question,
-                        :token_id_yes, :token_id_no, :winning_token_id,
-                        :shares, :entry_price, :allocated_capital,
-                        :expected_profit, :edge_percent, :neg_risk,
-                        :category, :slippage_pct, :entry_fee, :exit_fee,
-                        :status, :opened_at, :settled_at, :settlement_price, :realized_pnl
-                    )
-                    ON CONFLICT(position_id) DO UPDATE SET
-                        status           = excluded.status,
-                        settled_at       = excluded.settled_at,
-                        settlement_price = excluded.settlement_price,
-                        exit_fee         = excluded.exit_fee,
-                        realized_pnl     = excluded.realized_pnl
-                    """,
-                    d,
-                )
-                self._conn.commit()
-            return True
-        except Exception as e:
-            logger.warning("DB upsert_position failed: %s", e)
-            return False
+        return self.upsert_many(positions=(position,))
 
     def upsert_trade(self, trade, strategy_name: str = "") -> bool:
         """
@@ -194,41 +235,45 @@ class TradeDatabase:
         Accepts a TradeRecord dataclass (from utils/pnl_tracker.py).
         On conflict only the mutable exit fields are updated.
         """
+        return self.upsert_many(trades=(trade,), strategy_name=strategy_name)
+
+    def upsert_many(
+        self,
+        positions=(),
+        trades=(),
+        strategy_name: str = "",
+        pnl_snapshot: Optional[Tuple[float, float]] = None,
+    ) -> bool:
+        """
+        Upsert any number of positions and trades in a single transaction.
+
+        The trading loop buffers everything it opens and settles in one
+        iteration and writes it here, together with that iteration's
+        (balance, pnl) snapshot, so each pass costs one commit instead of one
+        per row.
+        """
         if self._conn is None:
             return False
+        if not positions and not trades and pnl_snapshot is None:
+            return True
         try:
-            d = trade.to_dict()
-            d["strategy_name"] = strategy_name
+            pos_rows = [p.to_dict() for p in positions]
+            trade_rows = []
+            for t in trades:
+                d = t.to_dict()
+                d["strategy_name"] = strategy_name
+                trade_rows.append(d)
             with self._lock:
-                self._conn.execute(
-                    """
-                    INSERT INTO trades (
-                        trade_id, strategy_name, position_id, market_id, action,
-                        quantity, entry_price, exit_price,
-                        entry_time, exit_time,
-                        pnl, pnl_percent, gross_pnl,
-                        entry_fee, exit_fee, slippage_pct
-                    ) VALUES (
-                        :trade_id, :strategy_name, :position_id, :market_id, :action,
-                        :quantity, :entry_price, :exit_price,
-                        :entry_time, :exit_time,
-                        :pnl, :pnl_percent, :gross_pnl,
-                        :entry_fee, :exit_fee, :slippage_pct
-                    )
-                    ON CONFLICT(trade_id) DO UPDATE SET
-                        exit_price  = excluded.exit_price,
-                        exit_time   = excluded.exit_time,
-                        pnl         = excluded.pnl,
-                        pnl_percent = excluded.pnl_percent,
-                        gross_pnl   = excluded.gross_pnl,
-                        exit_fee    = excluded.exit_fee
-                    """,
-                    d,
-                )
+                if pos_rows:
+                    self._conn.executemany(_UPSERT_POSITION_SQL, pos_rows)
+                if trade_rows:
+                    self._conn.executemany(_UPSERT_TRADE_SQL, trade_rows)
+                if pnl_snapshot is not None:
+                    self._conn.execute(_INSERT_PNL_SQL, (datetime.now().isoformat(), *pnl_snapshot))
                 self._conn.commit()
             return True
         except Exception as e:
-            logger.warning("DB upsert_trade failed: %s", e)
+            logger.warning("DB upsert_many failed: %s", e)
             return False
 
     def update_position_status(self, position_id: str, status: str) -> bool:
@@ -253,10 +298,7 @@ class TradeDatabase:
             return False
         try:
             with self._lock:
-                self._conn.execute(
-                    "INSERT INTO pnl_history (recorded_at, balance, pnl) VALUES (?, ?, ?)",
-                    (datetime.now().isoformat(), balance, pnl),
-                )
+                self._conn.execute(_INSERT_PNL_SQL, (datetime.now().isoformat(), balance, pnl))
                 self._conn.commit()
             return True
         except Exception as e:
@@ -24,7 +24,9 @@ Flow per scan cycle
 from __future__ import annotations
 
 import math
+import threading
 import time
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
@@ -65,7 +67,7 @@ class MarketDataSource(str, Enum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketCriteria:
     """
     Declares what a strategy needs from the market universe.
@@ -126,18 +128,29 @@ class MarketProvider:
     markets  = provider.get_markets(criteria)   # List[PolymarketMarket]
     """
 
-    # Cache TTL (seconds) per trading mode
+    # Cache TTL (seconds) per trading mode — used until the first scan has
+    # seen any close times, and kept as-is for modes already at the floor.
     _CACHE_TTL: dict = {
         "simulation": 5,
         "paper": 60,
         "live": 60,
     }
+    # Bounds for the adaptive TTL (a quarter of the soonest close time).
+    _ADAPTIVE_TTL_MIN_S = 5.0
+    _ADAPTIVE_TTL_MAX_S = 120.0
 
     def __init__(self, client) -> None:
         self._client = client
         self._raw_cache: list = []
         self._raw_cache_mono: float = 0.0  # time.monotonic() at last refresh
         self._last_categories: Optional[List[str]] = None
+        # TTL derived from the last refresh's close times (None = use the mode
+        # TTL).  Computed once per refresh, on the first get_markets() after it.
+        self._adaptive_ttl_s: Optional[float] = None
+        self._ttl_pending = False
+        # Background refresh started by prefetch(); joined by the next
+        # get_markets() so the scan never reads a half-written cache.
+        self._refresh_thread: Optional[threading.Thread] = None
 
     # ── public API ──────────────────────────────────────────────────────────
 
@@ -151,32 +164,90 @@ class MarketProvider:
         """
         raw = self._get_raw(criteria.categories)
         markets = self._convert_and_filter(raw, criteria)
+        if self._ttl_pending:
+            self._adaptive_ttl_s = self._ttl_from_close_times(markets)
+            self._ttl_pending = False
         self._resolve_prices(markets, criteria.price_source_preference)
         return markets
 
+    def prefetch(self, categories: List[str]) -> None:
+        """
+        Start refreshing the raw market cache in the background if it is due.
+
+        The trading loop calls this at the top of each iteration so the Gamma
+        fetch (several paged HTTP requests per category) overlaps the exit and
+        stop-loss checks instead of running after them.  The following
+        get_markets() call waits for the refresh to land, so the scan still
+        sees data that is no older than it would have been without prefetching.
+        """
+        if self._refresh_thread is not None or not self._needs_refresh(categories):
+            return
+        self._refresh_thread = threading.Thread(
+            target=self._refresh,
+            args=(list(categories),),
+            daemon=True,
+            name="market-prefetch",
+        )
+        self._refresh_thread.start()
+
     def invalidate_cache(self) -> None:
         """Force the next get_markets() call to re-fetch from the API."""
         self._raw_cache = []
         self._raw_cache_mono = 0.0
         self._last_categories = None
+        self._adaptive_ttl_s = None
 
     # ── raw-market cache ────────────────────────────────────────────────────
 
+    def _base_ttl(self) -> float:
+        return self._CACHE_TTL.get(config.TRADING_MODE, 60)
+
+    def _ttl_from_close_times(self, markets: List[PolymarketMarket]) -> Optional[float]:
+        """
+        A quarter of the time until the soonest-closing market, clamped to
+        [_ADAPTIVE_TTL_MIN_S, _ADAPTIVE_TTL_MAX_S].
+
+        A single fixed TTL either refetches needlessly when nothing is near
+        settlement or serves stale prices when something is.  Scaling by the
+        nearest close keeps the list fresh where it matters and lets it ride
+        longer otherwise.  Past close times are ignored — Gamma keeps listing
+        markets while they await resolution, and counting them would pin the
+        TTL at the floor.  Returns None (fall back to the mode TTL) when no
+        market has a future close time or the mode is already at the floor.
+        """
+        if self._base_ttl() <= self._ADAPTIVE_TTL_MIN_S:
+            return None
+        now = datetime.now(timezone.utc)
+        soonest = min(
+            (m.end_time for m in markets if m.end_time is not None and m.end_time > now),
+            default=None,
+        )
+        if soonest is None:
+            return None
+        quarter = (soonest - now).total_seconds() / 4
+        return max(self._ADAPTIVE_TTL_MIN_S, min(self._ADAPTIVE_TTL_MAX_S, quarter))
+
+    def _needs_refresh(self, categories: List[str]) -> bool:
+        ttl = self._adaptive_ttl_s or self._base_ttl()
+        stale = (time.monotonic() - self._raw_cache_mono) > ttl
+        return categories != self._last_categories or not self._raw_cache or stale
+
+    def _refresh(self, categories: List[str]) -> None:
+        logger.debug("[MarketProvider] Refreshing raw market cache (categories=%s)", categories)
+        started = time.monotonic()
+        self._raw_cache = scan_categories(self._client, categories)
+        self._raw_cache_mono = started
+        self._last_categories = categories
+        self._ttl_pending = True
+
     def _get_raw(self, categories: List[str]) -> list:
-        ttl = self._CACHE_TTL.get(config.TRADING_MODE, 60)
-        now = time.monotonic()
-        stale = (now - self._raw_cache_mono) > ttl
-        categories_changed = categories != self._last_categories
+        if self._refresh_thread is not None:
+            # scan_categories caps its own wall time, so this join is bounded.
+            self._refresh_thread.join()
+            self._refresh_thread = None
 
-        if categories_changed or not self._raw_cache or stale:
-            logger.debug(
-                f"[MarketProvider] Refreshing raw market cache "
-                f"(categories={categories}, ttl={ttl}s, "
-                f"stale={stale}, cats_changed={categories_changed})"
-            )
-            self._raw_cache = scan_categories(self._client, categories)
-            self._raw_cache_mono = now
-            self._last_categories = list(categories)
+        if self._needs_refresh(categories):
+            self._refresh(list(categories))
 
         return self._raw_cache
 
@@ -198,6 +269,10 @@ class MarketProvider:
         """
         out: List[PolymarketMarket] = []
         skipped_parse = skipped_binary = skipped_volume = skipped_time = skipped_category = 0
+        # Built once per call: criteria.categories is a list, and the gate below
+        # runs for every raw market in the listing.
+        wanted_categories = frozenset(criteria.categories)
+        now = datetime.now(timezone.utc)
 
         for raw in raw_markets:
             market = PolymarketMarket.from_api(raw)
@@ -211,7 +286,7 @@ class MarketProvider:
             # so scan_categories returns the entire market universe for those
             # categories.  Without this gate, every fetched market passes
             # through to the strategy regardless of criteria.categories.
-            if criteria.categories and market.category not in criteria.categories:
+            if wanted_categories and market.category not in wanted_categories:
                 skipped_category += 1
                 continue
 
@@ -229,7 +304,7 @@ class MarketProvider:
 
             # 3. Time-to-close gates (only if at least one bound is set)
             if criteria.max_time_to_close_s is not None or criteria.min_time_to_close_s > 0:
-                ttc = market.seconds_to_close()
+                ttc = market.seconds_to_close(now)
                 if ttc is None:
                     # Unknown close time — skip when an upper bound is required
                     if criteria.max_time_to_close_s is not None:
@@ -250,9 +325,15 @@ class MarketProvider:
 
         if skipped_parse or skipped_category or skipped_binary or skipped_volume or skipped_time:
             logger.debug(
-                f"[MarketProvider] Pre-filter: {len(raw_markets)} raw → {len(out)} kept "
-                f"(parse={skipped_parse}, category={skipped_category}, binary={skipped_binary}, "
-                f"volume={skipped_volume}, time={skipped_time} skipped)"
+                "[MarketProvider] Pre-filter: %d raw → %d kept "
+                "(parse=%d, category=%d, binary=%d, volume=%d, time=%d skipped)",
+                len(raw_markets),
+                len(out),
+                skipped_parse,
+                skipped_category,
+                skipped_binary,
+                skipped_volume,
+                skipped_time,
             )
 
         return out
@@ -274,10 +355,11 @@ class MarketProvider:
         Batching strategy
         -----------------
         GAMMA_EMBEDDED  — resolved inline (no I/O)
-        CLOB_REST       — collected and resolved after the inline pass,
-                          keeping the call pattern identical to what strategies
-                          previously did (one call per market that needs it)
-        ORDER_BOOK_MID  — same batch approach
+        CLOB_REST       — collected, then fetched with a single batched
+                          get_prices() call (CLOB /prices endpoint); tokens the
+                          batch leaves unpriced fall back to get_price()
+        ORDER_BOOK_MID  — collected, then fetched with a single batched
+                          get_order_books() call (CLOB /books endpoint)
         """
         needs_clob: List[PolymarketMarket] = []
         needs_ob: List[PolymarketMarket] = []
@@ -304,36 +386,57 @@ class MarketProvider:
                     needs_ob.append(market)
                     break
 
-        # CLOB batch (one get_price() per market that needs it)
+        # CLOB batch: one get_prices() call (CLOB /prices endpoint) for every
+        # market that needs it, instead of a REST round-trip per market.
+        # Tokens the batch did not price fall back to a single get_price().
         clob_resolved = 0
+        batch_prices: dict = {}
+        if needs_clob:
+            try:
+                batch_prices = self._client.get_prices([m.token_ids[0] for m in needs_clob])
+            except Exception as exc:
+                logger.debug("[MarketProvider] Batch CLOB price fetch failed: %s", exc)
+            if not isinstance(batch_prices, dict):
+                batch_prices = {}
         for market in needs_clob:
             try:
-                p = self._client.get_price(market.token_ids[0])
+                p = batch_prices.get(market.token_ids[0])
+                if p is None:
+                    p = self._client.get_price(market.token_ids[0])
                 if p and math.isfinite(p) and p > 0:
                     market.resolved_price = float(p)
                     clob_resolved += 1
             except Exception as exc:
-                logger.debug(f"[MarketProvider] CLOB price fetch failed for {market.slug}: {exc}")
+                logger.debug(
+                    "[MarketProvider] CLOB price fetch failed for %s: %s", market.slug, exc
+                )
 
-        # Order-book batch (one get_order_book() per market that needs it)
+        # Order-book batch (one get_order_books() call for all markets that need it)
         ob_resolved = 0
-        for market in needs_ob:
+        if needs_ob:
             try:
-                book = self._client.get_order_book(market.token_ids[0])
+                books = self._client.get_order_books([m.token_ids[0] for m in needs_ob])
+            except Exception as exc:
+                logger.debug("[MarketProvider] Batch order-book fetch failed: %s", exc)
+                books = {}
+            for market in needs_ob:
+                book = books.get(market.token_ids[0])
+                if not book:
+                    continue
                 mid = book.get("mid_price", 0.0)
                 if mid and math.isfinite(float(mid)) and float(mid) > 0:
                     market.resolved_price = float(mid)
                     ob_resolved += 1
-            except Exception as exc:
-                logger.debug(f"[MarketProvider] Order-book fetch failed for {market.slug}: {exc}")
 
         if needs_clob:
             logger.debug(
-                f"[MarketProvider] CLOB price resolution: "
-                f"{clob_resolved}/{len(needs_clob)} resolved"
+                "[MarketProvider] CLOB price resolution: %d/%d resolved",
+                clob_resolved,
+                len(needs_clob),
             )
         if needs_ob:
             logger.debug(
-                f"[MarketProvider] Order-book price resolution: "
-                f"{ob_resolved}/{len(needs_ob)} resolved"
+                "[MarketProvider] Order-book price resolution: %d/%d resolved",
+                ob_resolved,
+                len(needs_ob),
             )
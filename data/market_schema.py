@@ -6,6 +6,7 @@ by normalising all raw API dicts into a single PolymarketMarket dataclass.
 """
 
 import json as _json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -37,13 +38,16 @@ _TAG_CATEGORY_MAP: dict = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PolymarketMarket:
     """
     Normalised representation of a Polymarket market.
 
     Accepts fields from both the Gamma API (/events, /markets) and
     the CLOB API, resolving all known field name variants.
+
+    Slotted: one instance is built per listed market on every scan, and the
+    provider's filter gates read several fields from each.
     """
 
     market_id: str
@@ -105,22 +109,29 @@ class PolymarketMarket:
         # When outcomes is missing or unrecognised we leave order unchanged.
         token_ids, outcome_prices = _orient_yes_no(raw.get("outcomes"), token_ids, outcome_prices)
 
+        # Ids, slugs and token ids are re-parsed from JSON on every scan and
+        # used as dict/set keys downstream (open_market_ids, price and book
+        # caches).  Interning makes each scan reuse the same string objects, so
+        # those lookups hit the identity fast path instead of a full compare.
         return cls(
-            market_id=str(market_id),
-            slug=slug,
+            market_id=sys.intern(str(market_id)),
+            slug=sys.intern(str(slug)),
             question=question,
-            token_ids=token_ids,
+            token_ids=[sys.intern(str(t)) for t in token_ids],
             category=category,
             volume=volume,
             end_time=end_time,
             outcome_prices=outcome_prices,
         )
 
-    def seconds_to_close(self) -> Optional[float]:
-        """Return seconds until market closes, or None if end_time is unknown."""
+    def seconds_to_close(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Return seconds until market closes, or None if end_time is unknown.
+
+        Pass *now* (UTC-aware) to share one clock read across a batch of markets.
+        """
         if self.end_time is None:
             return None
-        delta = self.end_time - datetime.now(timezone.utc)
+        delta = self.end_time - (now or datetime.now(timezone.utc))
         return max(0.0, delta.total_seconds())
 
     def has_sufficient_liquidity(self, min_volume: float) -> bool:
@@ -205,23 +216,47 @@ def _parse_outcome_prices(raw: dict) -> List[float]:
         return []
 
 
+# Raw end-time string -> parsed UTC datetime.  The raw listing is re-converted
+# on every scan, so the same few thousand endDate strings would otherwise be
+# re-parsed each time.  Cleared wholesale when full so markets that have
+# rotated out of the listing do not pin entries forever.
+_END_TIME_CACHE: dict = {}
+_END_TIME_CACHE_MAX = 16384
+
+
 def _parse_end_time(raw: dict) -> Optional[datetime]:
     """Try all known end-time field names and return a UTC-aware datetime."""
     for key in ("endDate", "end_date", "end_time", "closeTime", "close_time"):
         value = raw.get(key)
         if not value:
             continue
-        try:
-            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-            # Ensure timezone-aware
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
+        text = str(value)
+        dt = _END_TIME_CACHE.get(text)
+        if dt is not None:
             return dt
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
         except (ValueError, TypeError):
             continue
+        # Ensure timezone-aware
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        if len(_END_TIME_CACHE) >= _END_TIME_CACHE_MAX:
+            _END_TIME_CACHE.clear()
+        _END_TIME_CACHE[text] = dt
+        return dt
     return None
 
 
+# Raw tag label -> category (None when unmapped), filled lazily.  Gamma reuses
+# a small tag vocabulary ("Crypto", "Bitcoin", "Politics", ...) across every
+# market, so each distinct spelling is normalised once per process instead of
+# once per tag per market per scan.  Capped so odd labels cannot grow it forever.
+_LABEL_CATEGORY: dict = {}
+_LABEL_CATEGORY_MAX = 4096
+_MISS = object()
+
+
 def _classify_category(tags: list) -> str:
     """
     Map API tags to a canonical category name.
@@ -237,9 +272,13 @@ def _classify_category(tags: list) -> str:
         else:
             continue
 
-        label = label.strip().lower()
-        if label in _TAG_CATEGORY_MAP:
-            return _TAG_CATEGORY_MAP[label]
+        category = _LABEL_CATEGORY.get(label, _MISS)
+        if category is _MISS:
+            category = _TAG_CATEGORY_MAP.get(label.strip().lower())
+            if len(_LABEL_CATEGORY) < _LABEL_CATEGORY_MAX:
+                _LABEL_CATEGORY[label] = category
+        if category is not None:
+            return category
 
     return "other"
 
@@ -46,13 +46,13 @@ LIMIT 1
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookLevel:
     price: float
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSnapshot:
     token_id: str
     captured_at: datetime
@@ -3,15 +3,24 @@ Polymarket API Client
 Wrapper around py-clob-client SDK
 """
 
+import functools
+import json as _json
 import math
 import random
+import threading
 import time as _time
-from typing import Optional, Dict
+from types import SimpleNamespace
+from typing import Dict, List, Optional
 
 import requests as _requests
-from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import MarketOrderArgs, OrderType
-from py_clob_client.order_builder.constants import BUY
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: orjson decodes the multi-MB Gamma /events pages several times
+    # faster than the stdlib.  Falls back transparently when not installed.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = _json.loads
 
 from config.polymarket_config import config
 from utils.logger import logger
@@ -19,19 +28,145 @@ from utils.logger import logger
 # Module-level Session reuses TCP connections across all PolymarketClient instances.
 # This avoids the 3-way handshake + TLS negotiation overhead on every API call.
 _http_session = _requests.Session()
-_http_session.headers.update({"Accept": "application/json"})
-
-# The py-clob-client SDK uses its own module-level httpx.Client with a 5-second
-# timeout. Under concurrent polling that timeout fires frequently as "Request exception!"
-# warnings. Replacing it with a 15-second timeout eliminates most of these.
-try:
-    import py_clob_client.http_helpers.helpers as _clob_http
-    import httpx as _httpx
-
-    _clob_http._http_client = _httpx.Client(timeout=15.0)
-    logger.debug("SDK httpx timeout extended to 15s")
-except Exception:
-    pass
+_http_session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+# One pool per host (gamma, clob, relayer, +1 spare); 16 sockets per pool covers the
+# parallel per-category scan threads plus pre-trade price checks without urllib3
+# discarding connections ("Connection pool is full") and re-handshaking TLS.
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# (connect, read) timeouts.  A short connect timeout fails fast when the host is
+# unreachable instead of stalling a scan tick; reads keep the longer budget because
+# large Gamma pages can legitimately take several seconds.
+_HTTP_TIMEOUT = (3.05, 10)
+
+_RELAYER_URL = "https://relayer-v2.polymarket.com"
+_RELAYER_ORDER_PATH = "/order"
+
+
+@functools.cache
+def _clob_sdk() -> SimpleNamespace:
+    """Import py-clob-client on first use and return the symbols this module needs.
+
+    The SDK pulls in web3/eth-account and its own httpx client, which is a
+    noticeable import cost for callers that never place an order (the dashboard,
+    backtests, config tooling).  Deferring it to the first PolymarketClient means
+    `import data.polymarket_client` stays cheap; functools.cache makes every
+    subsequent call a single dict hit.
+    """
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import BookParams, MarketOrderArgs, OrderType, RequestArgs
+    from py_clob_client.headers.headers import create_level_2_headers
+    from py_clob_client.order_builder.constants import BUY, SELL
+    from py_clob_client.utilities import order_to_json
+
+    # The SDK uses its own module-level httpx.Client with a 5-second timeout.
+    # Under concurrent polling that timeout fires frequently as "Request exception!"
+    # warnings. Replacing it with a 15-second timeout eliminates most of these.
+    try:
+        import py_clob_client.http_helpers.helpers as _clob_http
+        import httpx as _httpx
+
+        _clob_http._http_client = _httpx.Client(timeout=15.0)
+        logger.debug("SDK httpx timeout extended to 15s")
+    except Exception:
+        pass
+
+    return SimpleNamespace(
+        ClobClient=ClobClient,
+        BookParams=BookParams,
+        MarketOrderArgs=MarketOrderArgs,
+        OrderType=OrderType,
+        BUY=BUY,
+        SELL=SELL,
+        RequestArgs=RequestArgs,
+        create_level_2_headers=create_level_2_headers,
+        order_to_json=order_to_json,
+    )
+
+
+# Gamma tag ids for categories that map to a server-side filter.  Every other
+# category (regulatory, other, …) fetches the unfiltered /events listing and is
+# narrowed client-side, so those categories share one identical request.
+_GAMMA_TAG_IDS: Dict[str, str] = {"crypto": "21", "fed": "7"}
+
+# Market fields Gamma returns as JSON-encoded strings ('["0.98","0.02"]').
+_GAMMA_JSON_FIELDS = ("clobTokenIds", "outcomePrices", "outcomes")
+_GAMMA_BASE_PARAMS: Dict[str, str] = {"active": "true", "closed": "false"}
+
+# Short-lived response caches.  The market listing changes on the order of
+# seconds, and a single scan tick may ask for the same token's price / book more
+# than once (strategy evaluation, then the pre-trade slippage check).  These TTLs
+# are well under the minimum scan interval so no tick ever sees data from a
+# previous one.
+_GAMMA_CACHE_TTL_S = 1.0
+_QUOTE_CACHE_TTL_S = 0.2
+# Upper bound on cached price / book entries before the cache is flushed.
+_QUOTE_CACHE_MAX = 4096
+
+# Maximum token ids per POST to the CLOB /books batch endpoint.
+_BOOKS_BATCH_SIZE = 100
+
+
+def _level_float(v) -> float:
+    # Some SDK versions return price/size as nested dicts e.g. {"value": "0.50"}
+    if isinstance(v, dict):
+        v = v.get("value") or v.get("price") or next(iter(v.values()), 0)
+    try:
+        return float(v) if v else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _normalise_levels(levels_raw) -> list:
+    # Comprehension rather than an append loop: this runs for every level of
+    # every book fetched, so the per-item loop overhead is worth shaving.
+    return [
+        (
+            {
+                "price": _level_float(lvl.get("price", 0)),
+                "size": _level_float(lvl.get("size", 0)),
+            }
+            if isinstance(lvl, dict)
+            else {
+                "price": _level_float(getattr(lvl, "price", 0)),
+                "size": _level_float(getattr(lvl, "size", 0)),
+            }
+        )
+        for lvl in levels_raw
+    ]
+
+
+def _normalise_book(book, levels: int) -> dict:
+    """Convert an SDK order book (dict or OrderBookSummary) to the client's book dict."""
+    raw_bids = book.get("bids", []) if isinstance(book, dict) else getattr(book, "bids", [])
+    raw_asks = book.get("asks", []) if isinstance(book, dict) else getattr(book, "asks", [])
+
+    # Bug 3 fix: compute mid from the normalised book instead of making
+    # a second get_midpoint() HTTP call.  That second call returned data
+    # from a different instant than the bids/asks, so the mid didn't
+    # correspond to the spread snapshot stored alongside it.  Computing
+    # locally keeps mid, bid1, ask1 and depth all from the same fetch.
+    # Slice before normalising — levels beyond `levels` are discarded anyway.
+    norm_bids = _normalise_levels((raw_bids or [])[:levels])
+    norm_asks = _normalise_levels((raw_asks or [])[:levels])
+    if norm_bids and norm_asks:
+        mid_price = (norm_bids[0]["price"] + norm_asks[0]["price"]) / 2.0
+    elif norm_bids:
+        mid_price = norm_bids[0]["price"]
+    elif norm_asks:
+        mid_price = norm_asks[0]["price"]
+    else:
+        mid_price = 0.0
+    return {"bids": norm_bids, "asks": norm_asks, "mid_price": mid_price}
+
+
+def _copy_book(book: dict) -> dict:
+    """Shallow copy of a cached book so callers cannot mutate the cache entry's lists.
+
+    The level dicts inside the lists are still shared with the cache entry, so
+    callers must not mutate individual levels.
+    """
+    return {"bids": list(book["bids"]), "asks": list(book["asks"]), "mid_price": book["mid_price"]}
 
 
 def _with_retry(fn, retries: int = None, delays: tuple = None):
@@ -93,6 +228,15 @@ class PolymarketClient:
         self._sim_markets: list = []  # cache for the current sim market set
         self._sim_price_index: dict = {}  # token_id → yes_price (O(1) lookup)
         self._relayer_headers: Optional[Dict[str, str]] = None  # set in relayer mode
+        # In-flight Gamma listings keyed by tag id (None = unfiltered) so that
+        # concurrent get_all_markets() calls needing the same listing share one fetch.
+        self._gamma_inflight: Dict[Optional[str], tuple] = {}
+        self._gamma_inflight_lock = threading.Lock()
+        # TTL caches: tag id → (monotonic ts, markets); token id → (ts, price);
+        # (token id, levels) → (ts, book)
+        self._gamma_cache: Dict[Optional[str], tuple] = {}
+        self._price_cache: Dict[str, tuple] = {}
+        self._book_cache: Dict[tuple, tuple] = {}
 
         if self._simulation:
             self.client = None
@@ -138,7 +282,7 @@ class PolymarketClient:
                 builder_config = BuilderConfig(local_builder_creds=builder_creds)
 
                 # Initialize SDK client with credentials
-                self.client = ClobClient(
+                self.client = _clob_sdk().ClobClient(
                     host=self.host,
                     chain_id=self.chain_id,
                     key=self.private_key,
@@ -190,7 +334,7 @@ class PolymarketClient:
             return
 
         try:
-            self.client = ClobClient(
+            self.client = _clob_sdk().ClobClient(
                 host=self.host,
                 chain_id=self.chain_id,
                 key=self.private_key,
@@ -217,7 +361,7 @@ class PolymarketClient:
     def _initialize_standard_mode(self):
         """Initialize without builder credentials (unverified mode)"""
         try:
-            self.client = ClobClient(
+            self.client = _clob_sdk().ClobClient(
                 host=self.host,
                 chain_id=self.chain_id,
                 key=self.private_key,
@@ -235,7 +379,7 @@ class PolymarketClient:
                 f"ClobClient unavailable (no valid private key) — price fetching disabled: {e}"
             )
 
-    def get_all_markets(self, category: Optional[str] = None) -> list:  # noqa: C901
+    def get_all_markets(self, category: Optional[str] = None) -> list:
         """
         Get all active markets from Gamma API with pagination.
 
@@ -261,24 +405,67 @@ class PolymarketClient:
             )
             return self._sim_markets
 
-        import json as _json
+        return self._fetch_gamma_shared(_GAMMA_TAG_IDS.get(category), category)
 
-        tag_map = {"crypto": "21", "fed": "7"}
+    def _fetch_gamma_shared(self, tag_id: Optional[str], category: Optional[str]) -> list:
+        """
+        Coalesce concurrent fetches of the same Gamma listing into one request chain.
+
+        scan_categories() calls get_all_markets() for every category in parallel,
+        and all untagged categories (regulatory, other) page through exactly the
+        same /events listing.  The first caller for a tag id performs the fetch;
+        callers arriving while it is in flight wait for it and receive their own
+        copy of the result list instead of repeating every page request.  A
+        completed listing is reused for _GAMMA_CACHE_TTL_S seconds.
+        """
+        cached = self._gamma_cache.get(tag_id)
+        if cached is not None and _time.monotonic() - cached[0] < _GAMMA_CACHE_TTL_S:
+            return list(cached[1])
+
+        with self._gamma_inflight_lock:
+            flight = self._gamma_inflight.get(tag_id)
+            leader = flight is None
+            if leader:
+                flight = (threading.Event(), [])
+                self._gamma_inflight[tag_id] = flight
+
+        done, result = flight
+        if leader:
+            try:
+                result.extend(self._fetch_gamma_markets(tag_id, category))
+                self._gamma_cache[tag_id] = (_time.monotonic(), result)
+            finally:
+                with self._gamma_inflight_lock:
+                    self._gamma_inflight.pop(tag_id, None)
+                done.set()
+        else:
+            done.wait()
+            logger.debug(f"Reused in-flight Gamma listing for category '{category}'")
+        return list(result)
+
+    def _fetch_gamma_markets(  # noqa: C901
+        self, tag_id: Optional[str], category: Optional[str]
+    ) -> list:
+        """Page through Gamma /events for one tag id and flatten to active markets."""
         all_markets: list = []
         page_size = 100
         offset = 0
+        url = f"{config.GAMMA_API_URL}/events"
+
+        # Built once per fetch; only "offset" changes between pages.
+        params = {**_GAMMA_BASE_PARAMS, "limit": page_size}
+        if tag_id is not None:
+            params["tag_id"] = tag_id
 
         while True:
-            params = {"active": "true", "closed": "false", "limit": page_size, "offset": offset}
-            if category in tag_map:
-                params["tag_id"] = tag_map[category]
+            params["offset"] = offset
 
             try:
                 response = _with_retry(
                     lambda: _http_session.get(
-                        f"{config.GAMMA_API_URL}/events",
+                        url,
                         params=params,
-                        timeout=10,
+                        timeout=_HTTP_TIMEOUT,
                     )
                 )
             except _requests.exceptions.Timeout:
@@ -301,7 +488,7 @@ class PolymarketClient:
                 break
 
             try:
-                events = response.json()
+                events = _json_loads(response.content)
             except ValueError as e:
                 logger.error(
                     f"Failed to parse Gamma API response for category '{category}' "
@@ -321,12 +508,16 @@ class PolymarketClient:
                     if not market.get("active") or market.get("closed"):
                         continue
                     market["tags"] = event_tags
-                    clob = market.get("clobTokenIds")
-                    if isinstance(clob, str):
-                        try:
-                            market["clobTokenIds"] = _json.loads(clob)
-                        except Exception:
-                            market["clobTokenIds"] = []
+                    # Gamma double-encodes these list fields as JSON strings.
+                    # Decode them once here, per fetch, rather than on every
+                    # scan that re-converts the cached listing.
+                    for key in _GAMMA_JSON_FIELDS:
+                        value = market.get(key)
+                        if isinstance(value, str):
+                            try:
+                                market[key] = _json_loads(value)
+                            except Exception:
+                                market[key] = []
                     page_markets.append(market)
 
             all_markets.extend(page_markets)
@@ -357,12 +548,12 @@ class PolymarketClient:
             response = _with_retry(
                 lambda: _http_session.get(
                     f"{config.GAMMA_API_URL}/markets?token_id={market_id}",
-                    timeout=10,
+                    timeout=_HTTP_TIMEOUT,
                 )
             )
 
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
 
             logger.error(f"Error fetching market {market_id}: {response.status_code}")
             return {}
@@ -385,6 +576,9 @@ class PolymarketClient:
             return self._sim_price_index.get(token_id, 0.0)
         if self.client is None:
             return 0.0
+        cached = self._price_cache.get(token_id)
+        if cached is not None and _time.monotonic() - cached[0] < _QUOTE_CACHE_TTL_S:
+            return cached[1]
         try:
             result = self.client.get_price(token_id, side="BUY")
             # CLOB client may return a dict {"price": "0.97"}, a str, or a float
@@ -396,6 +590,7 @@ class PolymarketClient:
             if not math.isfinite(raw):
                 logger.warning(f"Non-finite price {raw!r} for {token_id} — treating as 0")
                 return 0.0
+            self._store_quote(self._price_cache, token_id, raw)
             return raw
         except Exception as e:
             err_str = str(e)
@@ -406,6 +601,68 @@ class PolymarketClient:
                 logger.error(f"Error fetching price for {token_id}: {e}")
             return 0.0
 
+    def get_prices(self, token_ids: List[str]) -> Dict[str, float]:
+        """
+        Get BUY-side prices for many tokens via the CLOB batch /prices endpoint.
+
+        Same semantics as get_price() per token, but one POST per
+        _BOOKS_BATCH_SIZE tokens instead of one GET each.  Prices still fresh
+        in the quote cache are served without a request.
+
+        Returns:
+            Dict of token_id → price.  Tokens the exchange did not price, or
+            whose batch failed, are omitted — callers fall back to get_price().
+        """
+        if self._simulation:
+            # Omit unknown tokens rather than pricing them at 0.0, matching
+            # the live contract: callers fall back to get_price(), which a
+            # strategy may have replaced (showcase_demo's synthetic prices).
+            index = self._sim_price_index
+            return {tid: index[tid] for tid in token_ids if tid in index}
+        if self.client is None or not token_ids:
+            return {}
+
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        now = _time.monotonic()
+        for tid in dict.fromkeys(token_ids):
+            cached = self._price_cache.get(tid)
+            if cached is not None and now - cached[0] < _QUOTE_CACHE_TTL_S:
+                prices[tid] = cached[1]
+            else:
+                missing.append(tid)
+
+        BookParams = _clob_sdk().BookParams
+        for i in range(0, len(missing), _BOOKS_BATCH_SIZE):
+            chunk = missing[i : i + _BOOKS_BATCH_SIZE]
+            try:
+                result = self.client.get_prices([BookParams(token_id=t, side="BUY") for t in chunk])
+            except Exception as e:
+                logger.warning(f"Batch price fetch failed for {len(chunk)} tokens: {e}")
+                continue
+            if not isinstance(result, dict):
+                continue
+            # Response shape: {token_id: {"BUY": "0.97"}, ...}
+            for tid in chunk:
+                entry = result.get(tid)
+                raw = entry.get("BUY") if isinstance(entry, dict) else entry
+                try:
+                    price = float(raw)
+                except (TypeError, ValueError):
+                    continue
+                if not math.isfinite(price):
+                    continue
+                self._store_quote(self._price_cache, tid, price)
+                prices[tid] = price
+        return prices
+
+    @staticmethod
+    def _store_quote(cache: dict, key, value) -> None:
+        """Insert into a quote TTL cache, flushing it once it grows past _QUOTE_CACHE_MAX."""
+        if len(cache) >= _QUOTE_CACHE_MAX:
+            cache.clear()
+        cache[key] = (_time.monotonic(), value)
+
     def get_order_book(self, token_id: str, levels: int = 5) -> dict:
         """
         Get order book for a token.
@@ -426,59 +683,14 @@ class PolymarketClient:
 
         if self.client is None:
             return {"bids": [], "asks": [], "mid_price": 0.0}
+        cache_key = (token_id, levels)
+        cached = self._book_cache.get(cache_key)
+        if cached is not None and _time.monotonic() - cached[0] < _QUOTE_CACHE_TTL_S:
+            return _copy_book(cached[1])
         try:
-            book = self.client.get_order_book(token_id)
-            raw_bids = book.get("bids", []) if isinstance(book, dict) else getattr(book, "bids", [])
-            raw_asks = book.get("asks", []) if isinstance(book, dict) else getattr(book, "asks", [])
-
-            def _to_float(v) -> float:
-                # Some SDK versions return price/size as nested dicts e.g. {"value": "0.50"}
-                if isinstance(v, dict):
-                    v = v.get("value") or v.get("price") or next(iter(v.values()), 0)
-                try:
-                    return float(v) if v else 0.0
-                except (TypeError, ValueError):
-                    return 0.0
-
-            def _normalise(levels_raw):
-                out = []
-                for lvl in levels_raw:
-                    if isinstance(lvl, dict):
-                        out.append(
-                            {
-                                "price": _to_float(lvl.get("price", 0)),
-                                "size": _to_float(lvl.get("size", 0)),
-                            }
-                        )
-                    else:
-                        out.append(
-                            {
-                                "price": _to_float(getattr(lvl, "price", 0)),
-                                "size": _to_float(getattr(lvl, "size", 0)),
-                            }
-                        )
-                return out
-
-            # Bug 3 fix: compute mid from the normalised book instead of making
-            # a second get_midpoint() HTTP call.  That second call returned data
-            # from a different instant than the bids/asks, so the mid didn't
-            # correspond to the spread snapshot stored alongside it.  Computing
-            # locally keeps mid, bid1, ask1 and depth all from the same fetch.
-            norm_bids = _normalise(raw_bids)[:levels]
-            norm_asks = _normalise(raw_asks)[:levels]
-            if norm_bids and norm_asks:
-                mid_price = (norm_bids[0]["price"] + norm_asks[0]["price"]) / 2.0
-            elif norm_bids:
-                mid_price = norm_bids[0]["price"]
-            elif norm_asks:
-                mid_price = norm_asks[0]["price"]
-            else:
-                mid_price = 0.0
-            return {
-                "bids": norm_bids,
-                "asks": norm_asks,
-                "mid_price": mid_price,
-            }
+            result = _normalise_book(self.client.get_order_book(token_id), levels)
+            self._store_quote(self._book_cache, cache_key, result)
+            return _copy_book(result)
         except Exception as e:
             err_str = str(e)
             if "No orderbook" in err_str or "404" in err_str:
@@ -494,12 +706,65 @@ class PolymarketClient:
                 logger.error(f"Error fetching order book for {token_id}: {e}")
             return {"bids": [], "asks": [], "mid_price": 0.0}
 
+    def get_order_books(self, token_ids: List[str], levels: int = 5) -> Dict[str, dict]:
+        """
+        Get order books for many tokens in as few HTTP round-trips as possible.
+
+        Uses the CLOB batch /books endpoint (POSTs up to _BOOKS_BATCH_SIZE token
+        ids per request) instead of one get_order_book() call per token.  Books
+        still fresh in the quote cache are served without a request.
+
+        Args:
+            token_ids: Token IDs to fetch.
+            levels:    Number of bid/ask levels to keep per book (default 5).
+
+        Returns:
+            Dict of token_id → book in the same shape as get_order_book().
+            Tokens with no book (resolved / delisted) or whose batch failed are
+            omitted; callers should treat a missing key as "no data".
+        """
+        if self._simulation:
+            return {tid: self.get_order_book(tid, levels=levels) for tid in token_ids}
+        if self.client is None or not token_ids:
+            return {}
+
+        books: Dict[str, dict] = {}
+        missing: List[str] = []
+        now = _time.monotonic()
+        for tid in dict.fromkeys(token_ids):
+            cached = self._book_cache.get((tid, levels))
+            if cached is not None and now - cached[0] < _QUOTE_CACHE_TTL_S:
+                books[tid] = _copy_book(cached[1])
+            else:
+                missing.append(tid)
+
+        BookParams = _clob_sdk().BookParams
+        for i in range(0, len(missing), _BOOKS_BATCH_SIZE):
+            chunk = missing[i : i + _BOOKS_BATCH_SIZE]
+            try:
+                summaries = self.client.get_order_books([BookParams(token_id=t) for t in chunk])
+            except Exception as e:
+                logger.warning(f"Batch order book fetch failed for {len(chunk)} tokens: {e}")
+                continue
+            for summary in summaries or []:
+                tid = (
+                    summary.get("asset_id")
+                    if isinstance(summary, dict)
+                    else getattr(summary, "asset_id", None)
+                )
+                if not tid:
+                    continue
+                book = _normalise_book(summary, levels)
+                self._store_quote(self._book_cache, (tid, levels), book)
+                books[tid] = _copy_book(book)
+        return books
+
     def create_market_order(
         self,
         token_id: str,
         amount: float,
         price: Optional[float] = None,
-        side: str = BUY,
+        side: str = "BUY",
         neg_risk: bool = False,
     ) -> dict:
         """
@@ -547,14 +812,17 @@ class PolymarketClient:
             logger.warning("ClobClient not initialized — order not submitted")
             return {}
 
+        sdk = _clob_sdk()
+        fok = sdk.OrderType.FOK
+
         # ── Phase 1: Sign the order locally (no exchange side-effects) ────────
         try:
-            order_args = MarketOrderArgs(
+            order_args = sdk.MarketOrderArgs(
                 token_id=token_id,
                 amount=amount,
                 price=price or 0,
                 side=side,
-                order_type=OrderType.FOK,
+                order_type=fok,
             )
             signed_order = self.client.create_market_order(order_args)
         except Exception as e:
@@ -568,26 +836,18 @@ class PolymarketClient:
                 # merged with RELAYER_API_KEY / RELAYER_API_KEY_ADDRESS headers so
                 # that orders are attributed to the relayer account (unlimited relay
                 # transactions, no tier approval required).
-                import json as _json
-                from py_clob_client.headers.headers import create_level_2_headers
-                from py_clob_client.clob_types import RequestArgs
-                from py_clob_client.utilities import order_to_json
-
-                _RELAYER_URL = "https://relayer-v2.polymarket.com"
-                _ORDER_PATH = "/order"
-
                 # neg_risk must match the actual market type — see docstring.
-                body = order_to_json(
-                    signed_order, self.client.creds.api_key, OrderType.FOK, neg_risk
-                )
+                body = sdk.order_to_json(signed_order, self.client.creds.api_key, fok, neg_risk)
                 serialized = _json.dumps(body, separators=(",", ":"), ensure_ascii=False)
-                req_args = RequestArgs(
+                req_args = sdk.RequestArgs(
                     method="POST",
-                    request_path=_ORDER_PATH,
+                    request_path=_RELAYER_ORDER_PATH,
                     body=body,
                     serialized_body=serialized,
                 )
-                l2_headers = create_level_2_headers(self.client.signer, self.client.creds, req_args)
+                l2_headers = sdk.create_level_2_headers(
+                    self.client.signer, self.client.creds, req_args
+                )
                 # Content-Type is required; the relayer will reject/misparse the body without it.
                 merged_headers = {
                     "Content-Type": "application/json",
@@ -597,10 +857,10 @@ class PolymarketClient:
 
                 def _submit_via_relayer():
                     resp = _http_session.post(
-                        f"{_RELAYER_URL}{_ORDER_PATH}",
+                        f"{_RELAYER_URL}{_RELAYER_ORDER_PATH}",
                         headers=merged_headers,
                         data=serialized,
-                        timeout=10,
+                        timeout=_HTTP_TIMEOUT,
                     )
                     if not resp.ok:
                         raise RuntimeError(
@@ -610,7 +870,7 @@ class PolymarketClient:
 
                 response = _with_retry(_submit_via_relayer)
             else:
-                response = _with_retry(lambda: self.client.post_order(signed_order, OrderType.FOK))
+                response = _with_retry(lambda: self.client.post_order(signed_order, fok))
         except Exception as e:
             # All retries exhausted — the order was NOT successfully submitted.
             logger.error(f"Order submission failed for {token_id} after all retries: {e}")
@@ -661,12 +921,13 @@ class PolymarketClient:
             logger.warning("ClobClient not initialized — limit order not submitted")
             return {}
 
+        sdk = _clob_sdk()
+
         # ── Phase 1: sign the order locally ──────────────────────────────────
         try:
             from py_clob_client.clob_types import LimitOrderArgs
-            from py_clob_client.order_builder.constants import BUY as _BUY, SELL as _SELL
 
-            order_side = _BUY if side.upper() == "BUY" else _SELL
+            order_side = sdk.BUY if side.upper() == "BUY" else sdk.SELL
             order_args = LimitOrderArgs(
                 token_id=token_id,
                 price=price,
@@ -686,7 +947,7 @@ class PolymarketClient:
 
         # ── Phase 2: submit with GTC order type ──────────────────────────────
         try:
-            response = _with_retry(lambda: self.client.post_order(signed_order, OrderType.GTC))
+            response = _with_retry(lambda: self.client.post_order(signed_order, sdk.OrderType.GTC))
         except Exception as exc:
             logger.error(f"Limit order submission failed for {token_id} after all retries: {exc}")
             return {}
@@ -785,10 +1046,10 @@ class PolymarketClient:
             response = _http_session.get(
                 f"{config.CLOB_API_URL}/data/positions",
                 params={"user": self.funder_address},
-                timeout=10,
+                timeout=_HTTP_TIMEOUT,
             )
             if response.status_code == 200:
-                return response.json() or []
+                return _json_loads(response.content) or []
             logger.debug(f"get_user_positions: API returned {response.status_code}")
             return []
         except Exception as e:
@@ -3,14 +3,34 @@ Polymarket Data Models
 Strategy-agnostic database models for the trading bot.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum
-from sqlalchemy.orm import declarative_base
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, func
+from sqlalchemy.orm import declarative_base, validates
 import enum
 
+from utils.serialization import DictRowMixin, iso
+
 Base = declarative_base()
 
 
+def _enum_str(enum_cls, value):
+    """Validate *value* against *enum_cls* and return the plain string stored in the DB.
+
+    Member names ("DETECTED") are accepted as well as values, since that is
+    what the former sa.Enum columns stored.
+    """
+    if value is None:
+        return None
+    try:
+        return enum_cls(value).value
+    except ValueError:
+        if isinstance(value, str) and value in enum_cls.__members__:
+            return enum_cls[value].value
+        raise
+
+
 class TradeStatus(str, enum.Enum):
     """Lifecycle status of a trade opportunity or position."""
 
@@ -28,7 +48,7 @@ class PositionStatus(str, enum.Enum):
     CLOSED = "closed"
 
 
-class TradeOpportunity(Base):
+class TradeOpportunity(DictRowMixin, Base):
     """
     A single trade opportunity produced by any strategy.
 
@@ -37,6 +57,7 @@ class TradeOpportunity(Base):
     """
 
     __tablename__ = "trade_opportunities"
+    __table_args__ = (Index("ix_opp_status_detected", "status", "detected_at"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String(100), nullable=False, index=True)
@@ -54,32 +75,82 @@ class TradeOpportunity(Base):
     edge_percent = Column(Float, nullable=False)
     confidence = Column(Float, nullable=True)
     detected_at = Column(DateTime, nullable=False, index=True)
-    status = Column(Enum(TradeStatus), default=TradeStatus.DETECTED, nullable=False)
+    # Plain VARCHAR rather than sa.Enum: no CHECK constraint and no per-row enum
+    # lookup on load.  The @validates hook below keeps writes to TradeStatus values.
+    status = Column(String(16), default=TradeStatus.DETECTED.value, nullable=False)
     executed_at = Column(DateTime, nullable=True)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "market_id": self.market_id,
-            "market_slug": self.market_slug,
-            "question": self.question,
-            "category": self.category,
-            "winning_token_id": self.winning_token_id,
-            "winning_price": self.current_price,
-            "side": self.side,
-            "opportunity_type": self.opportunity_type,
-            "edge_percent": self.edge_percent,
-            "confidence": self.confidence,
-            "detected_at": self.detected_at.isoformat() if self.detected_at else None,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
-            "status": self.status.value if self.status else None,
-        }
-
-
-class TradePosition(Base):
+    _DICT_SPEC = (
+        "id",
+        "market_id",
+        "market_slug",
+        "question",
+        "category",
+        "winning_token_id",
+        ("winning_price", "current_price", None),
+        "side",
+        "opportunity_type",
+        "edge_percent",
+        "confidence",
+        ("detected_at", iso),
+        ("executed_at", iso),
+        "status",
+    )
+
+    @validates("status")
+    def _validate_status(self, _key, value):
+        return _enum_str(TradeStatus, value)
+
+
+@dataclass(slots=True)
+class Opportunity(DictRowMixin):
+    """
+    In-memory trade opportunity returned by scan_for_opportunities().
+
+    Strategies build one per qualifying market on every scan, and candidates
+    are ranked, executed or dropped without ever being persisted.  A slotted
+    dataclass avoids the SQLAlchemy instrumentation a TradeOpportunity carries
+    per instance; call to_model() to get one when a row must be stored.
+
+    The trailing fields are the optional hooks the executor and position
+    tracker read via getattr() (Kelly inputs, capital override, exit time).
+    """
+
+    market_id: str
+    market_slug: str
+    question: str
+    category: str
+    token_id_yes: str
+    token_id_no: str
+    winning_token_id: str
+    current_price: float
+    edge_percent: float
+    confidence: Optional[float] = None
+    side: str = "YES"
+    opportunity_type: str = "single"
+    detected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    status: str = TradeStatus.DETECTED.value
+    executed_at: Optional[datetime] = None
+    id: Optional[int] = None
+    expires_at: Optional[datetime] = None
+    model_prob: Optional[float] = None
+    override_capital: Optional[float] = None
+    neg_risk: bool = False
+
+    _DICT_SPEC = TradeOpportunity._DICT_SPEC
+
+    def to_model(self) -> TradeOpportunity:
+        """Build the persistable TradeOpportunity row for this candidate."""
+        return TradeOpportunity(
+            **{c.name: getattr(self, c.name) for c in TradeOpportunity.__table__.columns}
+        )
+
+
+class TradePosition(DictRowMixin, Base):
     """Persisted record of an open or closed position."""
 
     __tablename__ = "trade_positions"
+    __table_args__ = (Index("ix_pos_status_opened", "status", "opened_at"),)
 
     id = Column(String(100), primary_key=True)
     market_id = Column(String(100), nullable=False, index=True)
@@ -91,7 +162,7 @@ class TradePosition(Base):
     current_price = Column(Float, nullable=True)
     expected_pnl = Column(Float, nullable=False)
     edge_percent = Column(Float, nullable=False)
-    status = Column(Enum(PositionStatus), default=PositionStatus.OPEN, nullable=False)
+    status = Column(String(16), default=PositionStatus.OPEN.value, nullable=False)
     opened_at = Column(
         DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True
     )
@@ -99,27 +170,30 @@ class TradePosition(Base):
     settlement_price = Column(Float, nullable=True)
     realized_pnl = Column(Float, nullable=True)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "market_id": self.market_id,
-            "market_slug": self.market_slug,
-            "question": self.question,
-            "token_id": self.token_id,
-            "shares": self.shares,
-            "entry_price": self.entry_price,
-            "current_price": self.current_price,
-            "expected_pnl": self.expected_pnl,
-            "edge_percent": self.edge_percent,
-            "status": self.status.value if self.status else None,
-            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
-            "settled_at": self.settled_at.isoformat() if self.settled_at else None,
-            "settlement_price": self.settlement_price,
-            "realized_pnl": self.realized_pnl,
-        }
-
-
-class FakeCurrency(Base):
+    _DICT_SPEC = (
+        "id",
+        "market_id",
+        "market_slug",
+        "question",
+        "token_id",
+        "shares",
+        "entry_price",
+        "current_price",
+        "expected_pnl",
+        "edge_percent",
+        "status",
+        ("opened_at", iso),
+        ("settled_at", iso),
+        "settlement_price",
+        "realized_pnl",
+    )
+
+    @validates("status")
+    def _validate_status(self, _key, value):
+        return _enum_str(PositionStatus, value)
+
+
+class FakeCurrency(DictRowMixin, Base):
     """Paper trading balance."""
 
     __tablename__ = "fake_currency"
@@ -131,21 +205,21 @@ class FakeCurrency(Base):
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "balance": self.balance,
-            "deployed": self.deployed,
-            "pending_returns": self.pending_returns,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    _DICT_SPEC = (
+        "id",
+        "balance",
+        "deployed",
+        "pending_returns",
+        ("created_at", iso),
+        ("updated_at", iso),
+    )
 
 
-class TradeAuditRecord(Base):
+class TradeAuditRecord(DictRowMixin, Base):
     """Immutable audit record for every completed trade."""
 
     __tablename__ = "trade_records"
+    __table_args__ = (Index("ix_audit_status_opened", "status", "opened_at"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     market_id = Column(String(100), nullable=False, index=True)
@@ -157,33 +231,36 @@ class TradeAuditRecord(Base):
     pnl = Column(Float, nullable=False)
     pnl_percent = Column(Float, nullable=False)
     edge_percent = Column(Float, nullable=False)
-    status = Column(Enum(TradeStatus), nullable=False)
+    status = Column(String(16), nullable=False)
     opened_at = Column(
         DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True
     )
     settled_at = Column(DateTime, nullable=True)
     settlement_price = Column(Float, nullable=True)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "market_id": self.market_id,
-            "market_slug": self.market_slug,
-            "token_id": self.token_id,
-            "shares": self.shares,
-            "entry_price": self.entry_price,
-            "exit_price": self.exit_price,
-            "pnl": self.pnl,
-            "pnl_percent": self.pnl_percent,
-            "edge_percent": self.edge_percent,
-            "status": self.status.value if self.status else None,
-            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
-            "settled_at": self.settled_at.isoformat() if self.settled_at else None,
-            "settlement_price": self.settlement_price,
-        }
-
-
-class MarketCache(Base):
+    _DICT_SPEC = (
+        "id",
+        "market_id",
+        "market_slug",
+        "token_id",
+        "shares",
+        "entry_price",
+        "exit_price",
+        "pnl",
+        "pnl_percent",
+        "edge_percent",
+        "status",
+        ("opened_at", iso),
+        ("settled_at", iso),
+        "settlement_price",
+    )
+
+    @validates("status")
+    def _validate_status(self, _key, value):
+        return _enum_str(TradeStatus, value)
+
+
+class MarketCache(DictRowMixin, Base):
     """Short-lived cache for market price snapshots."""
 
     __tablename__ = "market_cache"
@@ -200,16 +277,36 @@ class MarketCache(Base):
     )
     expires_at = Column(DateTime, nullable=False)
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "market_id": self.market_id,
-            "yes_price": self.yes_price,
-            "no_price": self.no_price,
-            "mid_price": self.mid_price,
-            "cached_at": self.cached_at.isoformat() if self.cached_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-        }
+    _DICT_SPEC = (
+        "id",
+        "market_id",
+        "yes_price",
+        "no_price",
+        "mid_price",
+        ("cached_at", iso),
+        ("expires_at", iso),
+    )
+
+
+_STATUS_TABLES = (TradeOpportunity, TradePosition, TradeAuditRecord)
+
+
+def normalise_legacy_status(engine) -> None:
+    """
+    Rewrite status values left by the former sa.Enum columns to enum values.
+
+    sa.Enum stored member names ("DETECTED"), the String columns store values
+    ("detected"); without this, status filters and the ix_*_status_* indexes
+    would silently miss legacy rows.  Idempotent — a no-op once migrated.
+    """
+    with engine.begin() as conn:
+        for model in _STATUS_TABLES:
+            table = model.__table__
+            conn.execute(
+                table.update()
+                .where(table.c.status != func.lower(table.c.status))
+                .values(status=func.lower(table.c.status))
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +25,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from config.polymarket_config import config
+from data.database import apply_sqlite_pragmas
 from utils.logger import logger
 
 
@@ -98,11 +99,24 @@ class SessionStore:
         "ALTER TABLE session_trades ADD COLUMN slippage_pct REAL DEFAULT 0.0",
     ]
 
+    # Match the read paths: per-session trade lists ordered by entry_time,
+    # cross-session trade history newest-first, and per-strategy session lists.
+    _CREATE_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS idx_session_trades_session "
+        "ON session_trades(session_id, entry_time)",
+        "CREATE INDEX IF NOT EXISTS idx_session_trades_entry ON session_trades(entry_time)",
+        "CREATE INDEX IF NOT EXISTS idx_sessions_strategy_start "
+        "ON strategy_sessions(strategy_name, start_time)",
+    )
+
     def __init__(self, db_path: str, sessions_dir: str):
         self._db_path = db_path
         self._sessions_dir = Path(sessions_dir)
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.Lock()
+        # Bumped whenever session_trades gains a row; lets the dashboard reuse
+        # its last /api/trades response while nothing has been recorded.
+        self.trades_version = 0
 
     def connect(self) -> bool:
         """Open the SQLite connection and create tables if needed. Returns False on failure."""
@@ -110,10 +124,13 @@ class SessionStore:
             self._sessions_dir.mkdir(parents=True, exist_ok=True)
             self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
             self._conn.row_factory = sqlite3.Row
+            apply_sqlite_pragmas(self._conn)
             with self._lock:
                 self._conn.execute(self._CREATE_SESSIONS_TABLE)
                 self._conn.execute(self._CREATE_TRADES_TABLE)
                 self._migrate()
+                for stmt in self._CREATE_INDEXES:
+                    self._conn.execute(stmt)
                 self._conn.commit()
             logger.info(
                 "SessionStore connected (db=%s, export_dir=%s)",
@@ -257,6 +274,7 @@ class SessionStore:
                     ),
                 )
                 self._conn.commit()
+                self.trades_version += 1
         except Exception as exc:
             logger.warning("SessionStore.record_settled_trade failed: %s", exc)
 
@@ -3,19 +3,32 @@ Database Initialization
 Initialize SQLite database with all required tables
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from data.polymarket_models import Base
+from data.database import apply_sqlite_pragmas
+from data.polymarket_models import Base, normalise_legacy_status
 from utils.logger import logger
 
 
 def init_db():
     """Initialize database with all tables"""
     try:
-        engine = create_engine("sqlite:///polymarket.db", echo=False)
+        engine = create_engine(
+            "sqlite:///polymarket.db",
+            echo=False,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            connect_args={"check_same_thread": False},
+        )
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_conn, _record):
+            apply_sqlite_pragmas(dbapi_conn)
 
         # Create all tables
         Base.metadata.create_all(engine)
+        normalise_legacy_status(engine)
 
         # Create session factory
         Session = sessionmaker(bind=engine)
@@ -3,9 +3,11 @@ Order Executor Module
 Handles order execution with paper trading
 """
 
+import logging
 import math
 from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Optional, Dict, List
 
 from py_clob_client.order_builder.constants import SELL
@@ -107,8 +109,14 @@ class OrderExecutor:
         self.position_tracker = position_tracker
         self.currency_tracker = currency_tracker
         self.polymarket_client = polymarket_client
-        # Bounded deque: keeps the last 500 orders, O(1) append and bounded memory.
-        self.order_history: deque = deque(maxlen=500)
+        # Bounded deque: keeps the last ORDER_HISTORY_MAX orders, O(1) append and
+        # bounded memory.  Evicted orders are not lost — every fill is already
+        # persisted to the trades table — and the running stats drop them too.
+        self.order_history: deque = deque(maxlen=self._history_maxlen())
+        self._reset_stats()
+        # Bumped on every change to order_history and never reset, so readers
+        # (the dashboard) can tell whether anything changed since they last looked.
+        self.orders_version = 0
 
         if config.PAPER_TRADING_ONLY:
             logger.info("Order executor initialized — PAPER mode (no real money trades)")
@@ -134,6 +142,14 @@ class OrderExecutor:
             True if successful
         """
         try:
+            # Guard first: invalid price means we cannot safely size the position,
+            # so reject before doing any sizing work.
+            if not opportunity.current_price or opportunity.current_price <= 0:
+                logger.error(
+                    f"Invalid price {opportunity.current_price!r} for {position_id} — aborting buy"
+                )
+                return False
+
             # Fixed-size override: strategies that manage their own order sizing
             # (e.g. limit-order market makers) attach an override_capital attribute
             # to the opportunity.  When present it is used directly, bypassing Kelly.
@@ -156,13 +172,6 @@ class OrderExecutor:
                     no_signal_fraction=getattr(config, "MIN_POSITION_PCT", 0.0),
                 )
 
-            # Guard: invalid price means we cannot safely size the position
-            if not opportunity.current_price or opportunity.current_price <= 0:
-                logger.error(
-                    f"Invalid price {opportunity.current_price!r} for {position_id} — aborting buy"
-                )
-                return False
-
             # ── Pre-trade slippage estimate from real order book ───────────
             # Fetch the live order book and walk the ask side to estimate how
             # much price impact our order will have given current liquidity.
@@ -180,14 +189,15 @@ class OrderExecutor:
                     slippage_pct = slip_est["slippage_pct"]
 
                     total_liquidity = liquidity_available_usd(order_book, side="BUY")
-                    logger.debug(
-                        f"Pre-trade estimate for {position_id}: "
-                        f"VWAP=${slip_est['vwap']:.4f} "
-                        f"(best ask=${slip_est['best_price']:.4f}), "
-                        f"estimated slippage={slippage_pct:.3f}%, "
-                        f"book liquidity=${total_liquidity:.2f}, "
-                        f"levels consumed={slip_est['levels_consumed']}"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Pre-trade estimate for {position_id}: "
+                            f"VWAP=${slip_est['vwap']:.4f} "
+                            f"(best ask=${slip_est['best_price']:.4f}), "
+                            f"estimated slippage={slippage_pct:.3f}%, "
+                            f"book liquidity=${total_liquidity:.2f}, "
+                            f"levels consumed={slip_est['levels_consumed']}"
+                        )
 
                     if slip_est["insufficient_liquidity"]:
                         logger.warning(
@@ -337,13 +347,15 @@ class OrderExecutor:
                 expected_profit=expected_profit,
             )
 
-            # Send alert
-            alert_manager.send_position_opened_alert(
-                position_id=position_id,
-                market_id=opportunity.market_slug,
-                quantity=shares,
-                price=opportunity.current_price,
-            )
+            # Send alert — skipped outright when no transport is configured, so the
+            # payload dict and message formatting never run on the common path.
+            if alert_manager.enabled:
+                alert_manager.send_position_opened_alert(
+                    position_id=position_id,
+                    market_id=opportunity.market_slug,
+                    quantity=shares,
+                    price=opportunity.current_price,
+                )
 
             # Record order
             order_record = {
@@ -362,15 +374,16 @@ class OrderExecutor:
                 "status": "FILLED",
                 "trading_mode": config.TRADING_MODE,
             }
-            self.order_history.append(order_record)
-
-            fee_str = f" | fee ${entry_fee:.2f}" if entry_fee > 0 else ""
-            slip_str = f" | slippage {slippage_pct:+.2f}%" if abs(slippage_pct) > 0.01 else ""
-            logger.info(
-                f"✅ Buy order executed: {position_id} - "
-                f"{shares:.4f} shares @ ${opportunity.current_price:.4f} "
-                f"(Total: ${capital_to_allocate:.2f}{fee_str}{slip_str})"
-            )
+            self._record_order(order_record)
+
+            if logger.isEnabledFor(logging.INFO):
+                fee_str = f" | fee ${entry_fee:.2f}" if entry_fee > 0 else ""
+                slip_str = f" | slippage {slippage_pct:+.2f}%" if abs(slippage_pct) > 0.01 else ""
+                logger.info(
+                    f"✅ Buy order executed: {position_id} - "
+                    f"{shares:.4f} shares @ ${opportunity.current_price:.4f} "
+                    f"(Total: ${capital_to_allocate:.2f}{fee_str}{slip_str})"
+                )
 
             return True
 
@@ -545,15 +558,16 @@ class OrderExecutor:
                 "pnl": pnl,
                 "trading_mode": config.TRADING_MODE,
             }
-            self.order_history.append(order_record)
-
-            fee_str = f" | fees ${total_fees:.2f}" if total_fees > 0 else ""
-            logger.info(
-                f"✅ Position settled: {position_id} - "
-                f"Exit: ${settlement_price:.4f}, "
-                f"Gross: ${(position.gross_pnl or 0.0):.2f}, "
-                f"Net PnL: ${(pnl or 0.0):.2f}{fee_str}"
-            )
+            self._record_order(order_record)
+
+            if logger.isEnabledFor(logging.INFO):
+                fee_str = f" | fees ${total_fees:.2f}" if total_fees > 0 else ""
+                logger.info(
+                    f"✅ Position settled: {position_id} - "
+                    f"Exit: ${settlement_price:.4f}, "
+                    f"Gross: ${(position.gross_pnl or 0.0):.2f}, "
+                    f"Net PnL: ${(pnl or 0.0):.2f}{fee_str}"
+                )
 
             return pnl
 
@@ -562,60 +576,101 @@ class OrderExecutor:
             alert_manager.send_error_alert(str(e), f"Position settlement failed for {position_id}")
             return None
 
+    # ── Order history ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _history_maxlen() -> int:
+        value = getattr(config, "ORDER_HISTORY_MAX", None)
+        return value if isinstance(value, int) and value > 0 else 500
+
+    def _reset_stats(self):
+        """Zero the running aggregates behind get_execution_stats()."""
+        self._seq = 0
+        self._buy_count = 0
+        self._filled_count = 0
+        self._filled_volume = 0.0
+        self._fees_total = 0.0
+        self._buy_slippage_sum = 0.0
+        # Sliding-window max of BUY slippage over order_history: (seq, value)
+        # pairs with strictly decreasing values, so the front is the max.
+        self._slippage_max: deque = deque()
+
+    def _stat_delta(self, order: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one order's contribution to the aggregates."""
+        if order["action"] == "BUY":
+            self._buy_count += sign
+            self._buy_slippage_sum += sign * order.get("slippage_pct", 0.0)
+        if order["status"] == "FILLED":
+            self._filled_count += sign
+            self._filled_volume += sign * order["total"]
+        self._fees_total += sign * order.get("fee", 0.0)
+
+    def _record_order(self, order: Dict):
+        """Append to order_history and keep the execution-stats aggregates in step.
+
+        order_history is bounded, so an append may evict the oldest record;
+        its contribution is subtracted here so the stats always describe
+        exactly the orders still in the window.
+        """
+        if len(self.order_history) == self.order_history.maxlen:
+            self._stat_delta(self.order_history[0], -1)
+            if (
+                self._slippage_max
+                and self._slippage_max[0][0] <= self._seq - self.order_history.maxlen
+            ):
+                self._slippage_max.popleft()
+
+        self.order_history.append(order)
+        self._stat_delta(order, 1)
+        self.orders_version += 1
+
+        if order["action"] == "BUY":
+            slip = order.get("slippage_pct", 0.0)
+            while self._slippage_max and self._slippage_max[-1][1] <= slip:
+                self._slippage_max.pop()
+            self._slippage_max.append((self._seq, slip))
+        self._seq += 1
+
     def get_order_history(self, limit: Optional[int] = None) -> List[Dict]:
         """Get order history (newest first; orders are appended chronologically)."""
         if limit is not None and limit > 0:
-            items = list(self.order_history)[-limit:]
-        else:
-            items = list(self.order_history)
-        items.reverse()
-        return items
+            return list(islice(reversed(self.order_history), limit))
+        return list(reversed(self.order_history))
 
     def get_recent_orders(self, limit: int = 10) -> List[Dict]:
         """Get recent orders"""
         return self.get_order_history(limit)
 
     def get_execution_stats(self) -> Dict:
-        """Get execution statistics including fee totals and slippage."""
-        total_orders = len(self.order_history)
-
-        buy_count = sell_count = filled_count = 0
-        total_volume = 0.0
-        total_fees = 0.0
-        slippage_values = []
+        """Get execution statistics including fee totals and slippage.
 
-        for o in self.order_history:
-            if o["action"] == "BUY":
-                buy_count += 1
-            else:
-                sell_count += 1
-            if o["status"] == "FILLED":
-                filled_count += 1
-                total_volume += o["total"]
-            total_fees += o.get("fee", 0.0)
-            slip = o.get("slippage_pct", 0.0)
-            if o["action"] == "BUY":
-                slippage_values.append(slip)
+        O(1): every figure is a running aggregate maintained by _record_order().
+        """
+        total_orders = len(self.order_history)
+        buy_count = self._buy_count
+        filled_count = self._filled_count
 
         # avg_slippage: mean signed value (negative = fills were better than expected on average).
         # max_slippage: worst adverse fill (largest positive slippage seen across all orders).
-        avg_slippage = sum(slippage_values) / len(slippage_values) if slippage_values else 0.0
-        max_slippage = max((v for v in slippage_values if v > 0), default=0.0)
+        avg_slippage = self._buy_slippage_sum / buy_count if buy_count else 0.0
+        max_slippage = max(self._slippage_max[0][1], 0.0) if self._slippage_max else 0.0
 
         return {
             "total_orders": total_orders,
             "buy_orders": buy_count,
-            "sell_orders": sell_count,
+            "sell_orders": total_orders - buy_count,
             "filled_orders": filled_count,
             "failed_orders": total_orders - filled_count,
             "fill_rate": (filled_count / total_orders * 100) if total_orders > 0 else 0.0,
-            "total_volume": total_volume,
-            "total_fees_paid": total_fees,
+            "total_volume": self._filled_volume,
+            "total_fees_paid": self._fees_total,
             "avg_slippage_pct": avg_slippage,
             "max_slippage_pct": max_slippage,
         }
 
     def reset(self):
         """Reset executor"""
-        self.order_history = deque(maxlen=500)
+        self.order_history = deque(maxlen=self._history_maxlen())
+        self._reset_stats()
+        self.orders_version += 1
         logger.info("Order executor reset")
@@ -39,7 +39,7 @@ from data.session_store import SessionStore
 from strategies.registry import load_strategy
 from strategies.base import BaseStrategy
 from portfolio.paper_portfolio import PaperPortfolio
-from portfolio.position_tracker import Position, PositionTracker
+from portfolio.position_tracker import Position, PositionTracker, new_position_id
 from execution.order_executor import OrderExecutor
 from utils.logger import logger
 from utils.pnl_tracker import PnLTracker
@@ -47,8 +47,6 @@ from utils.alerts import alert_manager
 from utils.session_reviewer import SessionReviewer
 from config.polymarket_config import config
 
-import dashboard.api
-
 
 class TradingBot:
     """Main trading bot orchestrator."""
@@ -81,6 +79,13 @@ class TradingBot:
                 logger.warning("SQLite DB unavailable — data will not be persisted")
                 self.db = None
 
+        # DB writes produced during one loop iteration (settled and newly
+        # opened rows, plus the balance snapshot), flushed in one transaction
+        # at the end of that iteration by _flush_db_writes().
+        self._pending_positions: list = []
+        self._pending_trades: list = []
+        self._pending_snapshot: Optional[tuple] = None
+
         # Restore any open positions that were live when the process last exited.
         # Must happen after position_tracker, pnl_tracker, and currency_tracker
         # are all constructed but before the trading loop starts.
@@ -292,6 +297,9 @@ class TradingBot:
                 host=config.DASHBOARD_HOST,
                 port=port,
                 log_level="warning",
+                # The dashboard polls several endpoints every few seconds; an access
+                # log record per request is pure overhead for the trading process.
+                access_log=False,
             )
             uvicorn.Server(uvicorn_config).run()
         except Exception as e:
@@ -323,6 +331,10 @@ class TradingBot:
                 if port != original_port:
                     logger.warning(f"Port {original_port} in use, using port {port}")
                 logger.info(f"Dashboard: http://localhost:{port}")
+                # Imported here so headless runs (--no-dashboard) never load
+                # FastAPI/pydantic and the dashboard's module-level setup.
+                import dashboard.api
+
                 dashboard.api.set_bot_instance(self)
                 threading.Thread(target=self._start_dashboard, args=(port,), daemon=True).start()
                 # Brief pause to let uvicorn finish binding before the process
@@ -430,9 +442,10 @@ class TradingBot:
             # Re-read scan interval each iteration so hot-reloading config.SCAN_INTERVAL_MS
             # takes effect without a restart.
             scan_interval = config.SCAN_INTERVAL_MS / 1000
+            # Lazy %-args: nothing is formatted unless DEBUG is enabled, and the
+            # log record already carries its own timestamp.
             logger.debug(
-                f"Loop #{iteration} — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} "
-                f"| strategy={config.STRATEGY} mode={config.TRADING_MODE}"
+                "Loop #%d | strategy=%s mode=%s", iteration, config.STRATEGY, config.TRADING_MODE
             )
 
             # Monotonic deadline: next iteration fires scan_interval seconds after
@@ -440,9 +453,19 @@ class TradingBot:
             next_tick = time.monotonic() + scan_interval
 
             try:
+                # Kick off the market-list refresh first so its HTTP round trips
+                # overlap the exit and stop-loss checks; the scan joins it.
+                self.market_provider.prefetch(self.strategy.get_market_criteria().categories)
+
                 # Fetch open positions once per iteration — shared by exits, stops, and scan.
                 open_positions = self.position_tracker.get_open_positions()
-                price_cache: dict = {}
+                # One batched price request for every open position, shared by
+                # exits and stop-losses; any token it misses is fetched singly.
+                price_cache: dict = (
+                    self.client.get_prices([p.winning_token_id for p in open_positions])
+                    if open_positions
+                    else {}
+                )
 
                 self._check_strategy_exits(open_positions, price_cache)
                 self._check_stop_losses(open_positions, price_cache)
@@ -454,6 +477,8 @@ class TradingBot:
                 alert_manager.send_error_alert(
                     str(e), f"Error in trading loop iteration #{iteration}"
                 )
+            finally:
+                self._flush_db_writes()
 
             # Sleep only the remaining time in this interval; never negative.
             remaining = next_tick - time.monotonic()
@@ -510,11 +535,7 @@ class TradingBot:
 
                 settled = self.position_tracker.get_position(pos.position_id)
                 if self.db and settled:
-                    self.db.upsert_position(settled)
-                    for trade in self.pnl_tracker.trades:
-                        if trade.position_id == pos.position_id and trade.exit_time:
-                            self.db.upsert_trade(trade, strategy_name=config.STRATEGY)
-                            break
+                    self._persist_settled(settled)
                 if (
                     self.session_store is not None
                     and self._session_id is not None
@@ -536,6 +557,31 @@ class TradingBot:
 
     # ── Stop-loss ──────────────────────────────────────────────────────
 
+    def _persist_settled(self, position) -> None:
+        """Queue a settled position and its closed trade for this iteration's flush."""
+        self._pending_positions.append(position)
+        trade = self.pnl_tracker.get_closed_trade(position.position_id)
+        if trade is not None:
+            self._pending_trades.append(trade)
+
+    def _flush_db_writes(self) -> None:
+        """
+        Write everything the iteration queued in one transaction.
+
+        An explicit transaction spanning the whole iteration would hold the
+        SQLite write lock across network calls and block SessionStore, which
+        writes to the same file through its own connection mid-iteration.
+        Buffering the rows and committing once at the end gives the same
+        single commit without that contention.
+        """
+        if self.db is None:
+            return
+        positions, trades = self._pending_positions, self._pending_trades
+        snapshot = self._pending_snapshot
+        self._pending_positions, self._pending_trades = [], []
+        self._pending_snapshot = None
+        self.db.upsert_many(positions, trades, config.STRATEGY, pnl_snapshot=snapshot)
+
     def _check_stop_losses(self, open_positions: list, price_cache: dict):
         """
         Generic stop-loss: close a position if its price has dropped
@@ -544,7 +590,9 @@ class TradingBot:
         open_positions: pre-fetched snapshot from run().
         price_cache: prices already fetched by _check_strategy_exits are reused here.
         """
-        if config.STOP_LOSS_PERCENT <= 0:
+        # Read once per pass: a hot-reload takes effect on the next tick.
+        stop_loss_pct = config.STOP_LOSS_PERCENT
+        if stop_loss_pct <= 0:
             return
         for pos in open_positions:
             try:
@@ -554,7 +602,7 @@ class TradingBot:
                 if current_price <= 0:
                     continue
                 drop_pct = (pos.entry_price - current_price) / pos.entry_price * 100
-                if drop_pct >= config.STOP_LOSS_PERCENT:
+                if drop_pct >= stop_loss_pct:
                     logger.warning(
                         f"Stop-loss triggered: {pos.position_id} — "
                         f"entry ${pos.entry_price:.4f}, now ${current_price:.4f} "
@@ -563,7 +611,7 @@ class TradingBot:
                     self.executor.execute_sell(pos.position_id, current_price, reason="stop_loss")
                     settled = self.position_tracker.get_position(pos.position_id)
                     if self.db and settled:
-                        self.db.upsert_position(settled)
+                        self._persist_settled(settled)
                     if (
                         self.session_store is not None
                         and self._session_id is not None
@@ -621,6 +669,10 @@ class TradingBot:
                 cat = p.category or "other"
                 category_counts[cat] = category_counts.get(cat, 0) + 1
 
+            # Read once per scan pass rather than per opportunity; a hot-reload
+            # via /api/settings takes effect on the next pass.
+            max_per_category = config.MAX_POSITIONS_PER_CATEGORY
+
             for opp in best:
                 if opp.market_id in open_market_ids:
                     logger.debug(f"Already have open position for: {opp.market_id}")
@@ -631,19 +683,17 @@ class TradingBot:
                     break
 
                 # Category concentration gate.
-                if config.MAX_POSITIONS_PER_CATEGORY > 0:
+                if max_per_category > 0:
                     opp_cat = getattr(opp, "category", None) or "other"
-                    if category_counts.get(opp_cat, 0) >= config.MAX_POSITIONS_PER_CATEGORY:
+                    if category_counts.get(opp_cat, 0) >= max_per_category:
                         logger.info(
                             f"Category concentration limit reached for '{opp_cat}' "
-                            f"({category_counts[opp_cat]}/{config.MAX_POSITIONS_PER_CATEGORY}) "
+                            f"({category_counts[opp_cat]}/{max_per_category}) "
                             f"— skipping {opp.market_slug}"
                         )
                         continue
 
-                position_id = (
-                    f"{opp.market_id}_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}"
-                )
+                position_id = new_position_id(opp.market_id)
                 success = self.executor.execute_buy(opp, position_id)
 
                 if success:
@@ -651,13 +701,15 @@ class TradingBot:
                     opp_cat = getattr(opp, "category", None) or "other"
                     category_counts[opp_cat] = category_counts.get(opp_cat, 0) + 1
                     logger.info(f"Position opened: {position_id}")
+                    # Rows are queued and written with the rest of this
+                    # iteration's changes by _flush_db_writes().
                     if self.db:
                         pos = self.position_tracker.get_position(position_id)
                         if pos:
-                            self.db.upsert_position(pos)
+                            self._pending_positions.append(pos)
                         trade = self.pnl_tracker.open_positions.get(position_id)
                         if trade:
-                            self.db.upsert_trade(trade, strategy_name=config.STRATEGY)
+                            self._pending_trades.append(trade)
 
                     alert_manager.send_opportunity_detected_alert(
                         market_id=opp.market_slug,
@@ -702,7 +754,7 @@ class TradingBot:
         logger.info(f"Win Rate: {pnl_summary.win_rate:.1f}%")
 
         if self.db:
-            self.db.add_pnl_snapshot(balance=balance, pnl=pnl_summary.total_pnl)
+            self._pending_snapshot = (balance, pnl_summary.total_pnl)
 
     def _print_final_report(self):
         logger.info("\n" + "=" * 70)
@@ -3,23 +3,37 @@ Paper trading balance tracker.
 Manages simulated capital allocation and returns across open positions.
 """
 
+import itertools
 import threading
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Dict
 
 from config.polymarket_config import config
 from utils.logger import logger
 
+# Ledger amounts are held as integer units of 1e-8 dollars.  Balance and
+# deployed capital are updated by repeated add/subtract for the life of the
+# process; with floats the residue accumulates (deployed drifts away from
+# exactly 0.0 once everything has closed), with ints every step is exact.
+_MONEY_SCALE = 10**8
 
-@dataclass
+
+def _to_units(amount: float) -> int:
+    return round(amount * _MONEY_SCALE)
+
+
+# Only used when a CurrencyPosition is built without an id (callers always
+# pass one); a counter avoids a clock read per construction.
+_fallback_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
 class CurrencyPosition:
     """Tracks capital allocation for a single open position."""
 
     market_id: str
-    position_id: str = field(default_factory=lambda: str(int(datetime.now().timestamp())))
-    allocated: float = field(default=0.0)
-    returned: float = field(default=0.0)
+    position_id: str = field(default_factory=lambda: str(next(_fallback_ids)))
+    allocated_units: int = field(default=0)
 
 
 class PaperPortfolio:
@@ -34,12 +48,24 @@ class PaperPortfolio:
     def __init__(self):
         self.positions: Dict[str, CurrencyPosition] = {}
         self.starting_balance = config.FAKE_CURRENCY_BALANCE
-        self.balance = self.starting_balance
-        self.deployed = 0.0
+        self._balance = _to_units(self.starting_balance)
+        self._deployed = 0
         self._lock = threading.Lock()
 
         logger.info(f"Paper portfolio initialised — starting balance ${self.starting_balance:.2f}")
 
+    @property
+    def balance(self) -> float:
+        return self._balance / _MONEY_SCALE
+
+    @balance.setter
+    def balance(self, value: float) -> None:
+        self._balance = _to_units(value)
+
+    @property
+    def deployed(self) -> float:
+        return self._deployed / _MONEY_SCALE
+
     def allocate_to_position(self, position_id: str, market_id: str, amount: float) -> bool:
         """
         Deduct `amount` from available balance and record it as deployed capital.
@@ -48,26 +74,38 @@ class PaperPortfolio:
         - Available balance is below `amount`
         - MAX_POSITIONS open positions already exist
         """
+        units = _to_units(amount)
+        max_positions = config.MAX_POSITIONS
         with self._lock:
-            if self.balance < amount:
-                logger.warning(f"Insufficient balance: ${self.balance:.2f}, need ${amount:.2f}")
-                return False
-
-            if len(self.positions) >= config.MAX_POSITIONS:
-                logger.warning(f"Max {config.MAX_POSITIONS} positions reached")
-                return False
-
-            self.positions[position_id] = CurrencyPosition(
-                position_id=position_id,
-                market_id=market_id,
-                allocated=amount,
+            balance_units = self._balance
+            full = len(self.positions) >= max_positions
+            if balance_units >= units and not full:
+                self.positions[position_id] = CurrencyPosition(
+                    position_id=position_id,
+                    market_id=market_id,
+                    allocated_units=units,
+                )
+                self._balance -= units
+                self._deployed += units
+
+        # Rejections are logged after the lock is released, with lazy
+        # %-formatting, so a burst of refused signals neither holds up
+        # return_to_balance() nor formats messages nobody will see.
+        if balance_units < units:
+            logger.warning(
+                "Insufficient balance: $%.2f, need $%.2f", balance_units / _MONEY_SCALE, amount
             )
-            self.balance -= amount
-            self.deployed += amount
+            return False
+        if full:
+            logger.warning("Max %d positions reached", max_positions)
+            return False
 
         logger.info(
-            f"Allocated ${amount:.2f} to {position_id} "
-            f"(balance=${self.balance:.2f}, deployed=${self.deployed:.2f})"
+            "Allocated $%.2f to %s (balance=$%.2f, deployed=$%.2f)",
+            amount,
+            position_id,
+            self.balance,
+            self.deployed,
         )
         return True
 
@@ -83,13 +121,11 @@ class PaperPortfolio:
                 logger.warning(f"Position {position_id} not found in paper portfolio")
                 return False
 
-            original_allocated = self.positions[position_id].allocated
-            self.balance += return_amount
-            self.deployed -= original_allocated
-            del self.positions[position_id]
+            self._balance += _to_units(return_amount)
+            self._deployed -= self.positions.pop(position_id).allocated_units
 
         logger.info(
-            f"Returned ${return_amount:.2f} from {position_id} " f"(balance=${self.balance:.2f})"
+            "Returned $%.2f from %s (balance=$%.2f)", return_amount, position_id, self.balance
         )
         return True
 
@@ -107,8 +143,8 @@ class PaperPortfolio:
         """Reset to starting state (used in tests)."""
         with self._lock:
             self.positions = {}
-            self.balance = self.starting_balance
-            self.deployed = 0.0
+            self._balance = _to_units(self.starting_balance)
+            self._deployed = 0
         logger.info("Paper portfolio reset")
 
 
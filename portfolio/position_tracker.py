@@ -3,6 +3,7 @@ Position Tracker Module
 Tracks individual positions and settlements
 """
 
+import itertools
 import threading
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -11,10 +12,23 @@ from datetime import datetime, timezone
 from config.polymarket_config import config
 from utils.logger import logger
 from utils.pnl_tracker import PnLTracker
+from utils.serialization import DictRowMixin, iso
+
+# Position ids are "<market_id>_<stamp><seq>": the process-start stamp keeps ids
+# unique across restarts (they are primary keys in the trades DB) and the
+# counter keeps them unique within a run, so minting one needs no clock read or
+# strftime.  Same 20-digit suffix shape as the old %Y%m%d%H%M%S%f timestamp.
+_ID_STAMP = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+_id_seq = itertools.count(1)
+
+
+def new_position_id(market_id: str) -> str:
+    """Return a fresh, process-unique position id for *market_id*."""
+    return f"{market_id}_{_ID_STAMP}{next(_id_seq):06d}"
 
 
 @dataclass(slots=True)
-class Position:
+class Position(DictRowMixin):
     """Tracks a single arbitrage position"""
 
     position_id: str
@@ -46,34 +60,36 @@ class Position:
     realized_pnl: Optional[float] = None  # net PnL after fees
     gross_pnl: Optional[float] = None  # PnL before fees
 
-    def to_dict(self):
-        return {
-            "position_id": self.position_id,
-            "strategy_name": self.strategy_name,
-            "market_id": self.market_id,
-            "market_slug": self.market_slug,
-            "question": self.question,
-            "token_id_yes": self.token_id_yes,
-            "token_id_no": self.token_id_no,
-            "winning_token_id": self.winning_token_id,
-            "shares": self.shares,
-            "entry_price": self.entry_price,
-            "allocated_capital": self.allocated_capital,
-            "expected_profit": self.expected_profit,
-            "edge_percent": self.edge_percent,
-            "category": self.category,
-            "slippage_pct": self.slippage_pct,
-            "neg_risk": self.neg_risk,
-            "status": self.status,
-            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "settled_at": self.settled_at.isoformat() if self.settled_at else None,
-            "entry_fee": self.entry_fee,
-            "exit_fee": self.exit_fee,
-            "settlement_price": self.settlement_price,
-            "gross_pnl": self.gross_pnl,
-            "realized_pnl": self.realized_pnl,
-        }
+    # Serialised through DictRowMixin like the DB models: the spec compiles
+    # once into a single attrgetter, so to_dict() is one C-level fetch plus
+    # three isoformat conversions instead of 25 Python attribute loads.
+    _DICT_SPEC = (
+        "position_id",
+        "strategy_name",
+        "market_id",
+        "market_slug",
+        "question",
+        "token_id_yes",
+        "token_id_no",
+        "winning_token_id",
+        "shares",
+        "entry_price",
+        "allocated_capital",
+        "expected_profit",
+        "edge_percent",
+        "category",
+        "slippage_pct",
+        "neg_risk",
+        "status",
+        ("opened_at", iso),
+        ("expires_at", iso),
+        ("settled_at", iso),
+        "entry_fee",
+        "exit_fee",
+        "settlement_price",
+        "gross_pnl",
+        "realized_pnl",
+    )
 
 
 class PositionTracker:
@@ -92,9 +108,33 @@ class PositionTracker:
         self.positions: Dict[str, Position] = {}
         self.max_positions = config.MAX_POSITIONS
         self._lock = threading.Lock()
+        self._reset_indexes()
 
         logger.info("Position tracker initialized")
 
+    def _reset_indexes(self):
+        """Status indexes over self.positions, maintained under _lock.
+
+        The loop asks for open positions and the open count several times per
+        tick while settled positions accumulate for the whole session, so
+        status queries go through these instead of filtering every position.
+        Dicts (not sets) keep insertion order, matching self.positions.
+        """
+        self._open: Dict[str, Position] = {}
+        self._settled: Dict[str, Position] = {}
+        self._realized_pnl = 0.0
+        self._wins = 0
+        self._losses = 0
+
+    def _index_settled(self, position: Position):
+        self._settled[position.position_id] = position
+        if position.realized_pnl is not None:
+            self._realized_pnl += position.realized_pnl
+            if position.realized_pnl > 0:
+                self._wins += 1
+            else:
+                self._losses += 1
+
     def create_position(
         self,
         opportunity,
@@ -119,9 +159,7 @@ class PositionTracker:
             Position ID
         """
         if position_id is None:
-            position_id = (
-                f"{opportunity.market_id}_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}"
-            )
+            position_id = new_position_id(opportunity.market_id)
 
         expires_at = getattr(opportunity, "expires_at", None)
         neg_risk = getattr(opportunity, "neg_risk", False)
@@ -149,6 +187,7 @@ class PositionTracker:
 
         with self._lock:
             self.positions[position_id] = position
+            self._open[position_id] = position
 
         # Track in PnL tracker
         self.pnl_tracker.open_position(
@@ -161,9 +200,11 @@ class PositionTracker:
         )
 
         logger.info(
-            f"Position created: {position_id} - "
-            f"{shares:.4f} shares @ ${opportunity.current_price:.4f}, "
-            f"Expected profit: ${expected_profit:.2f}"
+            "Position created: %s - %.4f shares @ $%.4f, Expected profit: $%.2f",
+            position_id,
+            shares,
+            opportunity.current_price,
+            expected_profit,
         )
 
         return position_id
@@ -197,6 +238,7 @@ class PositionTracker:
                 logger.debug(f"Position {position_id} already {position.status} — skipping settle")
                 return None
             position.status = "SETTLING"
+            self._open.pop(position_id, None)
 
             # Snapshot the fields we need for calculation while under the lock.
             shares = position.shares
@@ -223,6 +265,7 @@ class PositionTracker:
             position.gross_pnl = gross_pnl
             position.realized_pnl = net_pnl
             position.status = "SETTLED"
+            self._index_settled(position)
 
         return net_pnl
 
@@ -234,12 +277,12 @@ class PositionTracker:
     def get_open_positions(self) -> List[Position]:
         """Get a snapshot of all open positions (safe to iterate after return)."""
         with self._lock:
-            return [p for p in self.positions.values() if p.status == "OPEN"]
+            return list(self._open.values())
 
     def get_settled_positions(self) -> List[Position]:
         """Get a snapshot of all settled positions."""
         with self._lock:
-            return [p for p in self.positions.values() if p.status == "SETTLED"]
+            return list(self._settled.values())
 
     def get_all_positions(self) -> List[Position]:
         """Get a snapshot of all positions."""
@@ -249,37 +292,29 @@ class PositionTracker:
     def get_position_count(self) -> int:
         """Get number of open positions."""
         with self._lock:
-            return sum(1 for p in self.positions.values() if p.status == "OPEN")
+            return len(self._open)
 
     def can_open_position(self) -> bool:
-        """Check if we can open a new position (single lock, single pass).
+        """Check if we can open a new position.
 
         Reads config.MAX_POSITIONS live so hot-reloads (via /api/settings or
         config.reload()) take effect immediately without a restart.
         """
         with self._lock:
-            open_count = sum(1 for p in self.positions.values() if p.status == "OPEN")
+            open_count = len(self._open)
         return open_count < config.MAX_POSITIONS
 
     def get_summary(self) -> Dict:
         """Get position summary"""
-        # Single lock acquisition + single pass over positions
+        # Settled figures are running totals; only the (MAX_POSITIONS-bounded)
+        # open set is walked, for an exact allocated-capital sum.
         with self._lock:
-            open_count = settled_count = total_count = wins = losses = 0
-            total_allocated = total_realized_pnl = 0.0
-            for p in self.positions.values():
-                total_count += 1
-                if p.status == "OPEN":
-                    open_count += 1
-                    total_allocated += p.allocated_capital
-                elif p.status == "SETTLED":
-                    settled_count += 1
-                    if p.realized_pnl is not None:
-                        total_realized_pnl += p.realized_pnl
-                        if p.realized_pnl > 0:
-                            wins += 1
-                        else:
-                            losses += 1
+            open_count = len(self._open)
+            settled_count = len(self._settled)
+            total_count = len(self.positions)
+            total_allocated = sum(p.allocated_capital for p in self._open.values())
+            total_realized_pnl = self._realized_pnl
+            wins, losses = self._wins, self._losses
 
         return {
             "open_positions": open_count,
@@ -300,9 +335,14 @@ class PositionTracker:
         """
         with self._lock:
             self.positions[position.position_id] = position
+            if position.status == "OPEN":
+                self._open[position.position_id] = position
+            elif position.status == "SETTLED":
+                self._index_settled(position)
 
     def reset(self):
         """Reset tracker"""
         with self._lock:
             self.positions = {}
+            self._reset_indexes()
         logger.info("Position tracker reset")
@@ -16,7 +16,7 @@ from typing import List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from data.external.snapshot import ExternalSnapshot
 
-from data.polymarket_models import TradeOpportunity
+from data.polymarket_models import Opportunity
 from data.market_schema import PolymarketMarket
 from data.market_provider import MarketCriteria
 
@@ -28,7 +28,7 @@ class BaseStrategy(ABC):
     Required (must override)
     ------------------------
     scan_for_opportunities  – examine pre-filtered PolymarketMarket objects,
-                              return qualifying TradeOpportunity instances
+                              return qualifying Opportunity instances
     get_best_opportunities  – rank/limit a candidate list
 
     Optional hooks (override to customise behaviour)
@@ -50,7 +50,7 @@ class BaseStrategy(ABC):
         self,
         markets: List[PolymarketMarket],
         ext: "Optional[ExternalSnapshot]" = None,  # quoted: TYPE_CHECKING guard above
-    ) -> List[TradeOpportunity]:
+    ) -> List[Opportunity]:
         """
         Examine pre-filtered, pre-priced markets and return qualifying opportunities.
 
@@ -63,13 +63,13 @@ class BaseStrategy(ABC):
                      safe to call unconditionally.
 
         Returns:
-            List of TradeOpportunity objects (may be empty).
+            List of Opportunity objects (may be empty).
         """
 
     @abstractmethod
     def get_best_opportunities(
-        self, opportunities: List[TradeOpportunity], limit: int = 5
-    ) -> List[TradeOpportunity]:
+        self, opportunities: List[Opportunity], limit: int = 5
+    ) -> List[Opportunity]:
         """
         Rank and return the top N opportunities from a candidate list.
 
@@ -98,7 +98,7 @@ class BaseStrategy(ABC):
 
         Price source preference (fastest → slowest):
           GAMMA_EMBEDDED  — price embedded in Gamma API response (zero extra calls)
-          CLOB_REST       — CLOB SDK get_price() — one call per market
+          CLOB_REST       — CLOB /prices endpoint — one batched call per scan
           ORDER_BOOK_MID  — full order-book midpoint — most expensive
 
         Example (strategy that only wants highly-liquid crypto markets closing soon):
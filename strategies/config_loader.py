@@ -23,6 +23,7 @@ from typing import Any, Dict, Optional
 
 import yaml
 
+from config.polymarket_config import getenv
 from utils.logger import logger
 
 # Root of the strategies/ package — used to locate strategy subfolders.
@@ -144,7 +145,7 @@ def load_strategy_config(strategy_name: str) -> Dict[str, Any]:
         if key not in _TYPE_MAP:
             continue
         env_key = key.upper()
-        env_val = os.environ.get(env_key)
+        env_val = getenv(env_key)
         if env_val is not None:
             cast_type = _TYPE_MAP[key]
             try:
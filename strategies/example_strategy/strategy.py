@@ -31,6 +31,7 @@ Pattern used throughout:
     self._other      = cfg.get("other", None)  # optional / new key
 """
 
+import heapq
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, TYPE_CHECKING
 
@@ -39,7 +40,7 @@ if TYPE_CHECKING:
 
 from config.polymarket_config import config
 from data.polymarket_client import PolymarketClient
-from data.polymarket_models import TradeOpportunity, TradeStatus
+from data.polymarket_models import Opportunity
 from data.market_schema import PolymarketMarket
 from data.market_provider import MarketCriteria
 from strategies.base import BaseStrategy
@@ -167,8 +168,12 @@ class ExampleStrategy(BaseStrategy):
         self,
         markets: List[PolymarketMarket],
         ext: "Optional[ExternalSnapshot]" = None,  # noqa: U100  unused
-    ) -> List[TradeOpportunity]:
+    ) -> List[Opportunity]:
+        # Per-pass invariants, read once rather than once per market.  A
+        # hot-reload of config takes effect on the next scan.
         taker_fee = config.TAKER_FEE_PERCENT
+        min_conf = max(self._min_confidence, config.MIN_CONFIDENCE)
+        now = datetime.now(timezone.utc)
         opportunities = []
 
         for market in markets:
@@ -203,21 +208,24 @@ class ExampleStrategy(BaseStrategy):
                     continue
 
                 # ── SIGNAL: timing gate ───────────────────────────────
-                time_to_close = market.seconds_to_close() or 0.0
+                time_to_close = market.seconds_to_close(now) or 0.0
                 if time_to_close > self._execute_before_close_seconds:
                     logger.debug(
-                        f"[Example] Skipping {market.slug}: closes in {time_to_close:.0f}s "
-                        f"(gate={self._execute_before_close_seconds}s)"
+                        "[Example] Skipping %s: closes in %.0fs (gate=%ss)",
+                        market.slug,
+                        time_to_close,
+                        self._execute_before_close_seconds,
                     )
                     continue
 
                 # ── SIGNAL: confidence score ──────────────────────────
                 confidence = self._calculate_confidence(yes_price, time_to_close, net_edge)
-                min_conf = max(self._min_confidence, config.MIN_CONFIDENCE)
                 if confidence < min_conf:
                     logger.debug(
-                        f"[Example] Skipping {market.slug}: confidence {confidence:.2f} "
-                        f"< {min_conf:.2f}"
+                        "[Example] Skipping %s: confidence %.2f < %.2f",
+                        market.slug,
+                        confidence,
+                        min_conf,
                     )
                     continue
 
@@ -225,11 +233,11 @@ class ExampleStrategy(BaseStrategy):
                 # expires_at drives should_exit(); set it to either the
                 # hold period or the real market close time.
                 if self._hold_seconds > 0:
-                    expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._hold_seconds)
+                    expires_at = now + timedelta(seconds=self._hold_seconds)
                 else:
                     expires_at = market.end_time  # hold until market settles
 
-                opp = TradeOpportunity(
+                opp = Opportunity(
                     market_id=market.market_id,
                     market_slug=market.slug,
                     question=market.question,
@@ -240,16 +248,18 @@ class ExampleStrategy(BaseStrategy):
                     current_price=yes_price,
                     edge_percent=net_edge,
                     confidence=confidence,
-                    detected_at=datetime.now(timezone.utc),
-                    status=TradeStatus.DETECTED,
+                    expires_at=expires_at,
                 )
-                opp.expires_at = expires_at
                 opportunities.append(opp)
 
                 logger.info(
-                    f"[Example] Opportunity: {market.slug} — "
-                    f"price=${yes_price:.4f}, net_edge={net_edge:.2f}%, "
-                    f"confidence={confidence:.2f}, ttc={time_to_close:.0f}s"
+                    "[Example] Opportunity: %s — price=$%.4f, net_edge=%.2f%%, "
+                    "confidence=%.2f, ttc=%.0fs",
+                    market.slug,
+                    yes_price,
+                    net_edge,
+                    confidence,
+                    time_to_close,
                 )
 
             except Exception as exc:
@@ -264,16 +274,18 @@ class ExampleStrategy(BaseStrategy):
     # Sort by whatever metric matters to your strategy, then slice to limit.
 
     def get_best_opportunities(
-        self, opportunities: List[TradeOpportunity], limit: int = 5
-    ) -> List[TradeOpportunity]:
+        self, opportunities: List[Opportunity], limit: int = 5
+    ) -> List[Opportunity]:
         # Rank by risk-adjusted score: edge × confidence.
         # Ties broken by higher edge (implicitly via net_edge weight).
+        # heapq.nlargest keeps only the top `cap` while scanning instead of
+        # sorting the whole candidate list; same order as sorted()[:cap].
         cap = min(limit, self._max_positions)
-        return sorted(
+        return heapq.nlargest(
+            cap,
             opportunities,
             key=lambda o: o.edge_percent * (o.confidence or 0.0),
-            reverse=True,
-        )[:cap]
+        )
 
     # ------------------------------------------------------------------
     # STEP 5 (optional) — Exit logic
@@ -308,15 +320,22 @@ class ExampleStrategy(BaseStrategy):
 
         net_edge mode          — passes when net_edge > 0
         slippage_adjusted mode — passes when net_edge > slippage_buffer
+
+        Rejections log with deferred %-args: most markets fail here, and the
+        message is only formatted when DEBUG is actually enabled.
         """
         taker_fee = config.TAKER_FEE_PERCENT
 
         if self._edge_filter_mode == "slippage_adjusted":
             if net_edge < self._slippage_buffer:
                 logger.debug(
-                    f"[Example] Skipping {market_slug}: net edge {net_edge:.2f}% "
-                    f"does not exceed slippage buffer {self._slippage_buffer:.2f}% "
-                    f"(gross {gross_edge:.2f}% - {taker_fee:.1f}% fee)"
+                    "[Example] Skipping %s: net edge %.2f%% does not exceed slippage "
+                    "buffer %.2f%% (gross %.2f%% - %.1f%% fee)",
+                    market_slug,
+                    net_edge,
+                    self._slippage_buffer,
+                    gross_edge,
+                    taker_fee,
                 )
                 return False
             return True
@@ -325,8 +344,10 @@ class ExampleStrategy(BaseStrategy):
         # must fire no trades, exactly as the README promises)
         if net_edge <= 0:
             logger.debug(
-                f"[Example] Skipping {market_slug}: gross edge {gross_edge:.2f}% "
-                f"wiped by {taker_fee:.1f}% fee"
+                "[Example] Skipping %s: gross edge %.2f%% wiped by %.1f%% fee",
+                market_slug,
+                gross_edge,
+                taker_fee,
             )
             return False
         return True
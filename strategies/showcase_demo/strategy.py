@@ -18,6 +18,7 @@ Recommended .env settings for a nice dashboard demo
 Do not use for live or real paper trading.
 """
 
+import heapq
 import random
 import threading
 from dataclasses import dataclass
@@ -30,7 +31,7 @@ if TYPE_CHECKING:
 from config.polymarket_config import config
 from data.market_provider import MarketCriteria
 from data.market_schema import PolymarketMarket
-from data.polymarket_models import TradeOpportunity, TradeStatus
+from data.polymarket_models import Opportunity
 from strategies.base import BaseStrategy
 from strategies.config_loader import load_strategy_config
 from utils.logger import logger
@@ -426,7 +427,7 @@ class ShowcaseDemo(BaseStrategy):
         self,
         markets: List[PolymarketMarket],
         ext: "Optional[ExternalSnapshot]" = None,  # noqa: U100  unused — synthetic strategy
-    ) -> List[TradeOpportunity]:
+    ) -> List[Opportunity]:
         """
         Ignore real markets; return opportunities from the synthetic pool.
         Only markets not currently held are eligible.
@@ -437,7 +438,7 @@ class ShowcaseDemo(BaseStrategy):
         candidates = [m for m in _SYNTHETIC_MARKETS if m["id"] not in active]
         random.shuffle(candidates)
 
-        opportunities: List[TradeOpportunity] = []
+        opportunities: List[Opportunity] = []
         for mkt in candidates:
             price = mkt["price"]
             if not (self._min_price <= price <= self._max_price):
@@ -447,7 +448,7 @@ class ShowcaseDemo(BaseStrategy):
             confidence = round(random.uniform(self._conf_min, self._conf_max), 3)
 
             opportunities.append(
-                TradeOpportunity(
+                Opportunity(
                     market_id=mkt["id"],
                     market_slug=mkt["slug"],
                     question=mkt["question"],
@@ -458,22 +459,19 @@ class ShowcaseDemo(BaseStrategy):
                     current_price=price,
                     edge_percent=edge,
                     confidence=confidence,
-                    detected_at=datetime.now(timezone.utc),
-                    status=TradeStatus.DETECTED,
                 )
             )
 
         return opportunities
 
     def get_best_opportunities(
-        self, opportunities: List[TradeOpportunity], limit: int = 5
-    ) -> List[TradeOpportunity]:
-        ranked = sorted(
+        self, opportunities: List[Opportunity], limit: int = 5
+    ) -> List[Opportunity]:
+        selected = heapq.nlargest(
+            limit,
             opportunities,
             key=lambda o: (o.edge_percent or 0.0) * (o.confidence or 0.5),
-            reverse=True,
         )
-        selected = ranked[:limit]
 
         # Register selected markets as active so we don't re-enter them until exit.
         with self._lock:
@@ -16,17 +16,19 @@ def print_step(step_num, title):
     print(f"{'=' * 70}\n")
 
 
-def run(command, description):
-    print(f"  Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+def run(argv, description):
+    """Run *argv* without a shell, streaming its output straight to the console.
+
+    stdout/stderr are inherited rather than captured, so long installs show
+    uv's progress live instead of buffering everything until exit.
+    """
+    print(f"  Running: {' '.join(argv)}")
+    result = subprocess.run(argv)
     if result.returncode == 0:
         print(f"  OK: {description}")
         return True
-    else:
-        print(f"  FAILED: {description}")
-        if result.stderr:
-            print(f"  {result.stderr.strip()}")
-        return False
+    print(f"  FAILED: {description}")
+    return False
 
 
 def check_uv():
@@ -57,14 +59,14 @@ def main():
     print_step(2, "Create Virtual Environment")
     venv_path = Path(".venv")
     if not venv_path.exists():
-        if not run("uv venv", "Create .venv"):
+        if not run(["uv", "venv"], "Create .venv"):
             sys.exit(1)
     else:
         print("  .venv already exists — skipping")
 
     # Step 3: Install project and dependencies
     print_step(3, "Install Project and Dependencies")
-    if not run("uv pip install -e .", "Install project (editable)"):
+    if not run(["uv", "pip", "install", "-e", "."], "Install project (editable)"):
         sys.exit(1)
     print("\n  The 'polymarket' command is now registered in your venv.")
 
@@ -72,10 +74,8 @@ def main():
     print_step(4, "Configure Environment Variables")
     if not Path(".env").exists():
         if Path(".env.template").exists():
-            run(
-                "cp .env.template .env" if os.name != "nt" else "copy .env.template .env",
-                "Create .env from template",
-            )
+            shutil.copyfile(".env.template", ".env")
+            print("  OK: Create .env from template")
         print("\n  Edit .env and set your credentials:")
         print("    POLYMARKET_PRIVATE_KEY=your_key_here")
         print("    POLYMARKET_FUNDER_ADDRESS=your_address_here")
@@ -41,36 +41,15 @@ def test_smtp_connection():
         print("\n❌ Error: SMTP_PASSWORD not configured")
         return False
 
-    # Test connection
-    print("\n🔗 Testing SMTP connection...")
-    try:
-        with smtplib.SMTP(smtp_server, smtp_port, timeout=10) as server:
-            server.starttls()
-            server.login(smtp_username, smtp_password)
-        print("✅ SMTP connection successful!")
-    except smtplib.SMTPAuthenticationError as e:
-        print(f"❌ Authentication failed: {e}")
-        print("\n💡 Common issues:")
-        print("   - For Gmail: Use App Password, not your regular password")
-        print("     Get one at: https://myaccount.google.com/apppasswords")
-        print("   - Check email and password are correct")
-        print("   - Check if 2FA is enabled (may require App Password)")
-        return False
-    except Exception as e:
-        print(f"❌ Connection failed: {e}")
-        return False
-
-    # Send test email
-    print("\n📧 Sending test email...")
-    try:
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["From"] = email_from
-        msg["To"] = email_to
-        msg["Subject"] = "[Polymarket Bot] Test Email ✅"
-
-        # Plain text body
-        body = """
+    # Build the test message up front so the login check and the send can
+    # share one SMTP session (one TLS handshake instead of two).
+    msg = MIMEMultipart("alternative")
+    msg["From"] = email_from
+    msg["To"] = email_to
+    msg["Subject"] = "[Polymarket Bot] Test Email ✅"
+
+    # Plain text body
+    body = """
 This is a test email from your Polymarket Arbitrage Bot.
 
 If you received this email, your email notifications are configured correctly! 🎉
@@ -88,33 +67,51 @@ You can now:
 - Get error alerts
 
 Time: {timestamp}
-        """.format(
-            smtp_server=smtp_server,
-            smtp_port=smtp_port,
-            smtp_username=smtp_username,
-            email_from=email_from,
-            email_to=email_to,
-            timestamp="2024-01-01T00:00:00Z",
-        )
-
-        msg.attach(MIMEText(body, "plain"))
-
-        # Send email
-        with smtplib.SMTP(smtp_server, smtp_port, timeout=10) as server:
-            server.starttls()
-            server.login(smtp_username, smtp_password)
-            server.send_message(msg)
-
-        print("✅ Test email sent successfully!")
-        print(f"\n📧 Check your inbox: {email_to}")
-        print("\n💡 Note: If email doesn't arrive, check spam folder.")
+    """.format(
+        smtp_server=smtp_server,
+        smtp_port=smtp_port,
+        smtp_username=smtp_username,
+        email_from=email_from,
+        email_to=email_to,
+        timestamp="2024-01-01T00:00:00Z",
+    )
 
-        return True
+    msg.attach(MIMEText(body, "plain"))
 
+    # Test connection
+    print("\n🔗 Testing SMTP connection...")
+    try:
+        with smtplib.SMTP(smtp_server, smtp_port, timeout=10) as server:
+            server.starttls()
+            try:
+                server.login(smtp_username, smtp_password)
+            except smtplib.SMTPAuthenticationError as e:
+                print(f"❌ Authentication failed: {e}")
+                print("\n💡 Common issues:")
+                print("   - For Gmail: Use App Password, not your regular password")
+                print("     Get one at: https://myaccount.google.com/apppasswords")
+                print("   - Check email and password are correct")
+                print("   - Check if 2FA is enabled (may require App Password)")
+                return False
+            print("✅ SMTP connection successful!")
+
+            # Send test email on the same authenticated session
+            print("\n📧 Sending test email...")
+            try:
+                server.send_message(msg)
+            except Exception as e:
+                print(f"❌ Failed to send test email: {e}")
+                return False
     except Exception as e:
-        print(f"❌ Failed to send test email: {e}")
+        print(f"❌ Connection failed: {e}")
         return False
 
+    print("✅ Test email sent successfully!")
+    print(f"\n📧 Check your inbox: {email_to}")
+    print("\n💡 Note: If email doesn't arrive, check spam folder.")
+
+    return True
+
 
 def main():
     """Main function"""
@@ -2,21 +2,25 @@
 Unit tests for AlertManager (utils/alerts.py).
 
 Covers:
-- alert_history is a bounded deque
+- The cooldown index is keyed by (type, message) and bounded
 - Rate-limiting (_should_send_alert)
 - Thread-pool dispatch for ERROR/CRITICAL alerts
 - INFO/WARNING alerts do NOT trigger email/webhook
+- enabled reflects configured senders; position-opened message format
 - _send_email_safe / _send_webhook_safe swallow exceptions
+- WebhookSender posts through the shared keep-alive session
+- EmailSender.send_alert fills the prebuilt text/HTML templates
 """
 
 import threading
-from collections import deque
-from datetime import datetime, timedelta
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from utils.alerts import AlertManager, AlertSeverity, AlertType
+from utils.email_sender import EmailSender
+from utils.webhook_sender import WebhookSender
 
 
 @pytest.fixture
@@ -31,25 +35,33 @@ def manager():
     return m
 
 
-# ── alert_history structure ────────────────────────────────────────────────
+# ── cooldown index ─────────────────────────────────────────────────────────
 
 
-class TestAlertHistoryIsDeque:
-    def test_history_type(self, manager):
-        assert isinstance(manager.alert_history, deque)
+class TestCooldownIndex:
+    def test_track_alert_records_key(self, manager):
+        manager._track_alert(AlertType.GENERAL_INFO, "hello")
+        assert list(manager._last_sent) == [(AlertType.GENERAL_INFO, "hello")]
 
-    def test_history_maxlen(self, manager):
-        assert manager.alert_history.maxlen == 1000
+    def test_repeat_alert_does_not_grow_index(self, manager):
+        for _ in range(3):
+            manager._track_alert(AlertType.GENERAL_INFO, "hello")
+        assert len(manager._last_sent) == 1
 
-    def test_history_bounded(self, manager):
-        """Appending beyond maxlen does not grow the deque."""
+    def test_index_bounded(self, manager):
+        """Tracking beyond the cap evicts the least recently sent key."""
         for i in range(1100):
             manager._track_alert(AlertType.GENERAL_INFO, f"msg-{i}")
-        assert len(manager.alert_history) == 1000
+        assert len(manager._last_sent) == 1000
+        assert (AlertType.GENERAL_INFO, "msg-0") not in manager._last_sent
+        assert (AlertType.GENERAL_INFO, "msg-1099") in manager._last_sent
 
-    def test_track_alert_appends(self, manager):
-        manager._track_alert(AlertType.GENERAL_INFO, "hello")
-        assert len(manager.alert_history) == 1
+    def test_expired_entries_swept_first(self, manager):
+        old = time.monotonic() - manager.cooldown_period - 1
+        with manager._history_lock:
+            manager._last_sent = {(AlertType.GENERAL_INFO, f"old-{i}"): old for i in range(1000)}
+        manager._track_alert(AlertType.GENERAL_INFO, "fresh")
+        assert list(manager._last_sent) == [(AlertType.GENERAL_INFO, "fresh")]
 
 
 # ── rate limiting ──────────────────────────────────────────────────────────
@@ -74,11 +86,9 @@ class TestShouldSendAlert:
 
     def test_expired_cooldown_allows_resend(self, manager):
         """An entry older than cooldown_period is treated as expired → alert allowed."""
-        old_ts = datetime.now() - timedelta(seconds=manager.cooldown_period + 1)
+        old_ts = time.monotonic() - manager.cooldown_period - 1
         with manager._history_lock:
-            manager.alert_history.append(
-                {"type": AlertType.GENERAL_INFO, "message": "msg", "timestamp": old_ts}
-            )
+            manager._last_sent[(AlertType.GENERAL_INFO, "msg")] = old_ts
         assert manager._should_send_alert(AlertType.GENERAL_INFO, "msg") is True
 
 
@@ -156,6 +166,22 @@ class TestDispatch:
         assert mock_executor.submit.call_count == 1
         assert mock_executor.submit.call_args[0][0] == m._send_webhook_safe
 
+    def test_enabled_tracks_senders(self, manager):
+        assert manager.enabled is False
+        manager.webhook_sender = MagicMock()
+        assert manager.enabled is True
+
+    def test_position_opened_message(self, manager):
+        with patch.object(manager, "create_alert") as create:
+            manager.send_position_opened_alert("p1", "some-market", 12.5, 0.97)
+        _, title, message, severity, data = create.call_args[0]
+        assert title == "Position Opened: p1"
+        assert message == (
+            "Position ID: p1\nMarket: some-market\nQuantity: 12.5\nEntry Price: $0.9700"
+        )
+        assert severity == AlertSeverity.INFO
+        assert data["price"] == 0.97
+
 
 # ── _send_*_safe exception handling ───────────────────────────────────────
 
@@ -214,4 +240,35 @@ class TestThreadSafety:
             t.join()
 
         assert errors == [], f"Errors during concurrent tracking: {errors}"
-        assert len(manager.alert_history) <= 1000
+        assert len(manager._last_sent) <= 1000
+
+
+# ── webhook transport ──────────────────────────────────────────────────────
+
+
+class TestWebhookSession:
+    def test_consecutive_posts_share_session(self):
+        sender = WebhookSender("https://discord.test/webhook")
+        with patch("utils.webhook_sender._http_session") as session:
+            session.post.return_value = MagicMock(status_code=204)
+            assert sender._post({"embeds": []})
+            assert sender._post({"embeds": []})
+        assert session.post.call_count == 2
+
+
+# ── email bodies ───────────────────────────────────────────────────────────
+
+
+class TestEmailAlertBodies:
+    def test_send_alert_fills_both_templates(self):
+        sender = EmailSender.__new__(EmailSender)
+        sender.send_email = MagicMock(return_value=True)
+        sender.send_alert(
+            {"severity": "ERROR", "title": "T", "message": "a\nb", "data": '{"k": 1}'}
+        )
+        subject, body, html = sender.send_email.call_args[0]
+        assert subject == "❌ [ERROR] T"
+        assert body.endswith("a\nb\n\nAdditional Information:\n  k: 1")
+        assert '<div class="message">a<br>b</div>' in html
+        assert "<li><strong>k:</strong> 1</li>" in html
+        assert "{" not in html.split("</style>")[1]
@@ -154,3 +154,43 @@ class TestReloadIdempotent:
         _reload(cfg, env)
         assert cfg.SCAN_INTERVAL_MS == 45000
         assert cfg.MAX_POSITIONS == 3
+
+
+# ── slots ──────────────────────────────────────────────────────────────────
+
+
+class TestConfigSlots:
+    def test_config_no_instance_dict(self):
+        cfg = _config()
+        assert not hasattr(cfg, "__dict__")
+
+    def test_instances_do_not_share_scan_categories(self):
+        a, b = _config(), _config()
+        a.SCAN_CATEGORIES.append("sports")
+        assert "sports" not in b.SCAN_CATEGORIES
+
+    def test_unknown_attribute_rejected(self):
+        cfg = _config()
+        with pytest.raises(AttributeError):
+            cfg.NOT_A_SETTING = 1
+
+
+class TestGetenv:
+    def test_process_env_wins_over_dotenv(self):
+        from config import polymarket_config as pc
+
+        with (
+            patch.dict(pc._DOTENV, {"GETENV_KEY": "from-file"}),
+            patch.dict("os.environ", {"GETENV_KEY": "from-shell"}),
+        ):
+            assert pc.getenv("GETENV_KEY") == "from-shell"
+
+    def test_falls_back_to_dotenv_then_default(self):
+        from config import polymarket_config as pc
+
+        with (
+            patch.dict(pc._DOTENV, {"GETENV_KEY": "from-file"}),
+            patch.dict("os.environ", {}, clear=True),
+        ):
+            assert pc.getenv("GETENV_KEY") == "from-file"
+            assert pc.getenv("GETENV_MISSING", "dflt") == "dflt"
@@ -3,8 +3,9 @@ Unit tests for dashboard/api.py — FastAPI endpoints.
 Tests run against the FastAPI app via httpx's AsyncClient (no real server needed).
 """
 
+import json
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from types import SimpleNamespace
 from datetime import datetime
 
@@ -89,6 +90,26 @@ def client_with_bot():
     set_bot_instance(None)
 
 
+# ---------------------------------------------------------------------------
+# / (dashboard page)
+# ---------------------------------------------------------------------------
+
+
+class TestDashboardPage:
+    def test_index_served_as_html(self, client_no_bot):
+        resp = client_no_bot.get("/")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/html")
+
+    def test_index_read_from_disk_once(self, client_no_bot):
+        import dashboard.api as api_mod
+
+        client_no_bot.get("/")
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            assert client_no_bot.get("/").status_code == 200
+        assert api_mod._index_html is not None
+
+
 # ---------------------------------------------------------------------------
 # /api/health
 # ---------------------------------------------------------------------------
@@ -406,6 +427,47 @@ class TestTrades:
         assert data[0]["action"] == "BUY"
         assert data[1]["action"] == "SETTLED"
 
+    def test_trades_stream_ndjson(self, client_with_bot):
+        client, bot = client_with_bot
+        bot.executor.get_order_history.return_value = [
+            {
+                "order_id": f"p{i}_BUY",
+                "position_id": f"p{i}",
+                "action": "BUY",
+                "market_id": "mkt",
+                "market_slug": "slug",
+                "token_id": "tok",
+                "quantity": 1.0,
+                "price": 0.9,
+                "total": 0.9,
+                "executed_at": datetime(2026, 1, 1, 12, 0, i),
+                "status": "FILLED",
+            }
+            for i in range(3)
+        ]
+        resp = client.get("/api/trades/stream?limit=1000")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [r["order_id"] for r in rows] == ["p2_BUY", "p1_BUY", "p0_BUY"]
+
+    def test_trades_stream_empty_no_bot(self, client_no_bot):
+        resp = client_no_bot.get("/api/trades/stream")
+        assert resp.status_code == 200
+        assert resp.text == ""
+
+    def test_trades_body_reused_until_versions_change(self, client_with_bot):
+        client, bot = client_with_bot
+        bot.executor.orders_version = 1
+        bot.session_store.trades_version = 0
+        assert client.get("/api/trades").json() == []
+        assert client.get("/api/trades").json() == []
+        assert bot.executor.get_order_history.call_count == 1
+
+        bot.executor.orders_version = 2
+        client.get("/api/trades")
+        assert bot.executor.get_order_history.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # /api/config
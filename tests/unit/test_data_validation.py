@@ -146,6 +146,22 @@ class TestEndTimeFieldVariants:
         m = PolymarketMarket.from_api(raw)
         assert m.end_time is None
 
+    def test_repeated_end_date_parsed_consistently(self):
+        # Parsed end times are memoised by raw string; a cached hit must
+        # match a fresh parse, including naive strings promoted to UTC.
+        for _ in range(2):
+            m = self._market_with_key("endDate", "2030-01-01T00:00:00")
+            assert m.end_time == datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    def test_market_has_no_instance_dict(self):
+        m = PolymarketMarket.from_api(_raw_market())
+        assert not hasattr(m, "__dict__")
+
+    def test_seconds_to_close_uses_supplied_now(self):
+        m = self._market_with_key("endDate", "2030-01-01T00:00:00Z")
+        now = datetime(2029, 12, 31, 23, 59, 0, tzinfo=timezone.utc)
+        assert m.seconds_to_close(now) == 60.0
+
 
 # ---------------------------------------------------------------------------
 # Market schema — outcomePrices field parsing
@@ -346,6 +362,13 @@ class TestCategoryClassificationEdgeCases:
     def test_case_insensitive_dict_label(self):
         assert _classify_category([{"label": "CRYPTO"}]) == "crypto"
 
+    def test_repeated_labels_classified_consistently(self):
+        # Labels are memoised by raw spelling; unmapped ones must keep
+        # falling through to later tags rather than short-circuiting.
+        for _ in range(2):
+            assert _classify_category([" Politics ", {"label": " FOMC "}]) == "fed"
+            assert _classify_category([" Politics "]) == "other"
+
     def test_dict_with_name_key(self):
         assert _classify_category([{"name": "ethereum"}]) == "crypto"
 
@@ -545,6 +568,12 @@ class TestPositionDataclass:
         pos = self._make(expires_at=None)
         assert pos.to_dict()["expires_at"] is None
 
+    def test_to_dict_covers_every_field_in_order(self):
+        d = self._make().to_dict()
+        assert list(d)[:3] == ["position_id", "strategy_name", "market_id"]
+        assert set(d) == set(Position.__dataclass_fields__)
+        assert isinstance(d["opened_at"], str)
+
 
 # ---------------------------------------------------------------------------
 # Order executor — rejects invalid prices
@@ -106,3 +106,46 @@ class TestGetPositions:
         ids = {r["position_id"] for r in rows}
         assert "p1" not in ids
         assert len(ids) == 2
+
+
+class TestConnectionPragmas:
+    def test_wal_and_normal_sync(self, db):
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert db._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+class TestUpsertMany:
+    def test_batch_writes_all_trades_in_one_commit(self, db):
+        from utils.pnl_tracker import TradeRecord
+
+        trades = [
+            TradeRecord(f"t{i}", f"p{i}", "mkt-1", "BUY", 10.0, 0.95, entry_fee=0.1)
+            for i in range(3)
+        ]
+        assert db.upsert_many(trades=trades, strategy_name="s1") is True
+        rows = db.get_all_trades()
+        assert sorted(r["trade_id"] for r in rows) == ["t0", "t1", "t2"]
+        assert {r["strategy_name"] for r in rows} == {"s1"}
+
+    def test_empty_batch_is_noop(self, db):
+        assert db.upsert_many() is True
+
+    def test_pnl_snapshot_written_with_batch(self, db):
+        assert db.upsert_many(pnl_snapshot=(1010.0, 10.0)) is True
+        history = db.get_pnl_history()
+        assert [(h["balance"], h["pnl"]) for h in history] == [(1010.0, 10.0)]
+
+
+class TestIndexes:
+    def test_status_filter_uses_composite_index(self, db):
+        plan = " ".join(
+            row[3]
+            for row in db._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM positions WHERE status = ? "
+                "ORDER BY opened_at DESC",
+                ("OPEN",),
+            )
+        )
+        assert "idx_positions_status_opened" in plan
+        assert "TEMP B-TREE" not in plan
@@ -30,6 +30,10 @@ class TestFakeCurrencyTrackerInit:
     def test_positions_empty_on_init(self, tracker):
         assert tracker.positions == {}
 
+    def test_position_records_use_slots(self, tracker):
+        tracker.allocate_to_position("p1", "m1", 500.0)
+        assert not hasattr(tracker.positions["p1"], "__dict__")
+
 
 class TestAllocate:
     def test_allocate_deducts_balance(self, tracker):
@@ -104,6 +108,17 @@ class TestReturnToBalance:
             tracker.return_to_balance(f"cycle_{i}", 100.0)
         assert tracker.balance == 10_000.0  # back to starting balance
 
+    def test_fractional_round_trips_leave_no_residue(self, tracker):
+        # 0.1 + 0.2 style amounts: float add/subtract would leave deployed at
+        # ~1e-13 rather than exactly zero after everything is returned.
+        amounts = [0.1, 0.2, 33.33, 98.51, 0.07]
+        for i, amount in enumerate(amounts):
+            tracker.allocate_to_position(f"p{i}", "m1", amount)
+        for i, amount in enumerate(amounts):
+            tracker.return_to_balance(f"p{i}", amount)
+        assert tracker.deployed == 0.0
+        assert tracker.balance == 10_000.0
+
     def test_return_false_for_unknown_position(self, tracker):
         result = tracker.return_to_balance("unknown", 500.0)
         assert result is False
@@ -245,3 +245,7 @@ class TestConfigFactory:
     def test_non_overridden_fields_inherit_defaults(self):
         cfg = PolymarketConfig.from_dict({"MAX_POSITIONS": 1})
         assert cfg.PAPER_TRADING_ONLY is True  # default from .env
+
+    def test_unknown_key_raises(self):
+        with pytest.raises(TypeError):
+            PolymarketConfig.from_dict({"MAX_POSITONS": 1})
@@ -0,0 +1,79 @@
+"""
+Tests for utils/logger.py — BatchedFileHandler and TradeLogger.
+
+Covers:
+- INFO records stay buffered until max_pending is reached
+- WARNING and above are flushed immediately
+- close() flushes anything still buffered
+- TradeLogger keeps one CSV handle, writes the header once and flushes each row
+"""
+
+import logging
+
+import pytest
+
+from utils.logger import BatchedFileHandler, TradeLogger
+
+
+def _record(level=logging.INFO, msg="hello"):
+    return logging.LogRecord("t", level, __file__, 1, msg, None, None)
+
+
+@pytest.fixture
+def handler(tmp_path):
+    h = BatchedFileHandler(tmp_path / "t.log", encoding="utf-8", max_pending=3, max_delay_s=60)
+    h.setFormatter(logging.Formatter("%(message)s"))
+    yield h
+    h.close()
+
+
+def _disk(handler):
+    with open(handler.baseFilename, encoding="utf-8") as f:
+        return f.read()
+
+
+class TestBatchedFileHandler:
+    def test_info_buffered_until_max_pending(self, handler):
+        handler.handle(_record(msg="a"))
+        handler.handle(_record(msg="b"))
+        assert _disk(handler) == ""
+        handler.handle(_record(msg="c"))
+        assert _disk(handler) == "a\nb\nc\n"
+
+    def test_warning_flushes_immediately(self, handler):
+        handler.handle(_record(msg="a"))
+        handler.handle(_record(logging.WARNING, msg="w"))
+        assert _disk(handler) == "a\nw\n"
+
+    def test_close_flushes_pending(self, handler):
+        handler.handle(_record(msg="a"))
+        handler.close()
+        assert _disk(handler) == "a\n"
+
+    def test_delay_elapsed_flushes(self, handler):
+        handler.max_delay_s = 0.0
+        handler.handle(_record(msg="a"))
+        assert _disk(handler) == "a\n"
+
+
+class TestTradeLogger:
+    def test_rows_reach_disk_through_one_handle(self, tmp_path):
+        path = tmp_path / "trades.csv"
+        tl = TradeLogger(trade_file=path)
+        handle = tl._fh
+        tl.log_trade("buy", "mkt", 2.0, 0.5, reason="a, b")
+        tl.log_trade("sell", "mkt", 2.0, 0.75)
+        assert tl._fh is handle
+        rows = path.read_text().splitlines()
+        assert rows[0] == "timestamp,action,symbol,quantity,price,total,reason"
+        assert rows[1].endswith(',buy,mkt,2.0,0.5,1.0,"a, b"')
+        assert len(rows) == 3
+        tl.close()
+
+    def test_existing_file_not_given_second_header(self, tmp_path):
+        path = tmp_path / "trades.csv"
+        TradeLogger(trade_file=path).close()
+        tl = TradeLogger(trade_file=path)
+        tl.log_trade("buy", "mkt", 1.0, 0.5)
+        tl.close()
+        assert path.read_text().count("timestamp,action") == 1
@@ -0,0 +1,136 @@
+"""
+Tests for data/market_provider.py
+
+Covers:
+- The raw market list is cached per TTL and refetched when stale
+- prefetch() refreshes in the background and get_markets() joins it
+- prefetch() is a no-op while the cache is fresh
+- The TTL adapts to the soonest market close, clamped to [5s, 120s]
+- CLOB_REST prices are fetched in one batch, with per-token fallback
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data.market_provider import MarketCriteria, MarketDataSource, MarketProvider
+
+
+def _criteria():
+    return MarketCriteria(categories=["crypto"], price_source_preference=[])
+
+
+class TestRawCache:
+    def test_reused_within_ttl(self):
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.scan_categories", return_value=[{"id": "m1"}]) as scan:
+            provider.get_markets(_criteria())
+            provider.get_markets(_criteria())
+        assert scan.call_count == 1
+
+    def test_refetched_when_stale(self):
+        provider = MarketProvider(client=None)
+        with (
+            patch("data.market_provider.scan_categories", return_value=[]) as scan,
+            patch.dict(MarketProvider._CACHE_TTL, {"paper": -1, "live": -1, "simulation": -1}),
+        ):
+            provider.get_markets(_criteria())
+            provider.get_markets(_criteria())
+        assert scan.call_count == 2
+
+
+class TestPrefetch:
+    def test_get_markets_joins_inflight_refresh(self):
+        provider = MarketProvider(client=None)
+        release = threading.Event()
+        callers = []
+
+        def _scan(client, categories):
+            callers.append(threading.current_thread().name)
+            release.wait(timeout=5)
+            return [{"id": "m1"}]
+
+        with patch("data.market_provider.scan_categories", side_effect=_scan):
+            provider.prefetch(["crypto"])
+            release.set()
+            raw = provider._get_raw(["crypto"])
+
+        assert callers == ["market-prefetch"]
+        assert raw == [{"id": "m1"}]
+        assert provider._refresh_thread is None
+
+    def test_noop_when_cache_fresh(self):
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.scan_categories", return_value=[{"id": "m1"}]) as scan:
+            provider.get_markets(_criteria())
+            provider.prefetch(["crypto"])
+        assert provider._refresh_thread is None
+        assert scan.call_count == 1
+
+
+class TestAdaptiveTtl:
+    def _closing_in(self, *seconds):
+        now = datetime.now(timezone.utc)
+        return [SimpleNamespace(end_time=now + timedelta(seconds=s)) for s in seconds]
+
+    @pytest.mark.parametrize(
+        "closes, expected",
+        [
+            ((200, 10_000), 50.0),  # a quarter of the soonest close
+            ((4,), 5.0),  # floor near settlement
+            ((86_400,), 120.0),  # ceiling when nothing is close
+        ],
+    )
+    def test_quarter_of_soonest_close_clamped(self, closes, expected):
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.config") as cfg:
+            cfg.TRADING_MODE = "paper"
+            ttl = provider._ttl_from_close_times(self._closing_in(*closes))
+        assert ttl == pytest.approx(expected, abs=0.1)
+
+    def test_unknown_close_times_fall_back_to_mode_ttl(self):
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.config") as cfg:
+            cfg.TRADING_MODE = "paper"
+            assert provider._ttl_from_close_times([SimpleNamespace(end_time=None)]) is None
+
+    def test_past_close_times_ignored(self):
+        # Markets awaiting resolution must not pin the TTL at the floor.
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.config") as cfg:
+            cfg.TRADING_MODE = "paper"
+            ttl = provider._ttl_from_close_times(self._closing_in(-60, 600))
+            assert ttl == pytest.approx(120.0, abs=0.1)
+            assert provider._ttl_from_close_times(self._closing_in(-60)) is None
+
+    def test_simulation_keeps_fixed_ttl(self):
+        provider = MarketProvider(client=None)
+        with patch("data.market_provider.config") as cfg:
+            cfg.TRADING_MODE = "simulation"
+            assert provider._ttl_from_close_times(self._closing_in(86_400)) is None
+
+
+class TestClobPriceBatch:
+    def _markets(self, *tokens):
+        return [SimpleNamespace(token_ids=[t, t + "-no"], slug=t) for t in tokens]
+
+    def test_one_batch_call_for_all_markets(self):
+        client = MagicMock()
+        client.get_prices.return_value = {"a": 0.41, "b": 0.62}
+        markets = self._markets("a", "b")
+        MarketProvider(client=client)._resolve_prices(markets, [MarketDataSource.CLOB_REST])
+        client.get_prices.assert_called_once_with(["a", "b"])
+        client.get_price.assert_not_called()
+        assert [m.resolved_price for m in markets] == [0.41, 0.62]
+
+    def test_unpriced_tokens_fall_back_to_single_fetch(self):
+        client = MagicMock()
+        client.get_prices.side_effect = RuntimeError("boom")
+        client.get_price.return_value = 0.5
+        markets = self._markets("a")
+        MarketProvider(client=client)._resolve_prices(markets, [MarketDataSource.CLOB_REST])
+        client.get_price.assert_called_once_with("a")
+        assert markets[0].resolved_price == 0.5
@@ -59,6 +59,15 @@ class TestFromApiRequired:
         m = PolymarketMarket.from_api(_raw(market_id="abc-123"))
         assert m.market_id == "abc-123"
 
+    def test_ids_interned_across_parses(self):
+        # Each scan re-parses fresh JSON strings; keys must come back as the
+        # same objects so downstream dict/set lookups hit the identity path.
+        a = PolymarketMarket.from_api(_raw(market_id="".join(["mkt-", "777"])))
+        b = PolymarketMarket.from_api(_raw(market_id="".join(["mkt-", "777"])))
+        assert a.market_id is b.market_id
+        assert a.slug is b.slug
+        assert a.token_ids[0] is b.token_ids[0]
+
     def test_market_id_fallback_conditionId(self):
         raw = {"conditionId": "cond-99", "clobTokenIds": ["t1"]}
         m = PolymarketMarket.from_api(raw)
@@ -217,6 +217,45 @@ class TestStats:
         orders = executor.get_order_history(limit=1)
         assert len(orders) == 1
 
+    def test_running_stats_match_window_after_eviction(self):
+        """Aggregates must describe exactly the orders still in the bounded history."""
+        import random
+        from collections import deque
+
+        executor, *_ = _make_executor()
+        executor.order_history = deque(maxlen=8)
+        rng = random.Random(7)
+        for i in range(50):
+            executor._record_order(
+                {
+                    "action": rng.choice(["BUY", "SELL"]),
+                    "status": rng.choice(["FILLED", "FAILED"]),
+                    "total": rng.uniform(1, 100),
+                    "fee": rng.uniform(0, 1),
+                    "slippage_pct": rng.uniform(-2, 3),
+                }
+            )
+            window = list(executor.order_history)
+            buys = [o["slippage_pct"] for o in window if o["action"] == "BUY"]
+            filled = [o for o in window if o["status"] == "FILLED"]
+            stats = executor.get_execution_stats()
+            assert stats["buy_orders"] == len(buys)
+            assert stats["filled_orders"] == len(filled)
+            assert stats["total_volume"] == pytest.approx(sum(o["total"] for o in filled))
+            assert stats["total_fees_paid"] == pytest.approx(sum(o["fee"] for o in window))
+            assert stats["max_slippage_pct"] == max((v for v in buys if v > 0), default=0.0)
+
+        newest = executor.get_order_history(limit=3)
+        assert newest == list(reversed(executor.order_history))[:3]
+
+    def test_history_bound_from_config(self):
+        currency, pnl, positions = _make_deps()
+        with patch("execution.order_executor.config") as cfg:
+            cfg.PAPER_TRADING_ONLY = True
+            cfg.ORDER_HISTORY_MAX = 3
+            executor = OrderExecutor(pnl, positions, currency)
+        assert executor.order_history.maxlen == 3
+
 
 class TestExecuteSell:
     def _open(self, executor, currency, pnl, positions, pid="p1"):
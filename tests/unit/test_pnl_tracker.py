@@ -145,7 +145,7 @@ class TestHistory:
 
 
 class TestClosedTradesIndex:
-    """_closed_trades is the incremental index used by get_summary()."""
+    """_closed_trades is the incremental index used by trade-history reads."""
 
     def test_starts_empty(self, tracker):
         assert tracker._closed_trades == []
@@ -188,6 +188,54 @@ class TestClosedTradesIndex:
         assert history[0].position_id == "p1"
 
 
+class TestSummaryCache:
+    """get_summary() is built from running totals and cached until the next close."""
+
+    def test_repeated_calls_return_same_snapshot(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        tracker.close_position("p1", exit_price=1.0)
+        assert tracker.get_summary() is tracker.get_summary()
+
+    def test_close_invalidates_snapshot(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        tracker.close_position("p1", exit_price=1.0)
+        first = tracker.get_summary()
+        tracker.open_position("p2", "m2", 100.0, 0.985)
+        tracker.close_position("p2", exit_price=0.0)
+        second = tracker.get_summary()
+        assert first.total_trades == 1
+        assert second.total_trades == 2
+        assert second.losses == 1
+
+    def test_reset_clears_totals(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        tracker.close_position("p1", exit_price=1.0)
+        tracker.get_summary()
+        tracker.reset()
+        summary = tracker.get_summary()
+        assert summary.total_trades == 0
+        assert summary.total_pnl == 0.0
+
+    def test_totals_match_full_recompute(self, tracker):
+        prices = [1.0, 0.0, 1.0, 1.0, 0.0]
+        for i, px in enumerate(prices):
+            tracker.open_position(f"p{i}", "m1", 10.0, 0.9, entry_fee=0.1)
+            tracker.close_position(f"p{i}", exit_price=px, exit_fee=0.05)
+        summary = tracker.get_summary()
+        closed = tracker._closed_trades
+        assert summary.total_pnl == pytest.approx(sum(t.pnl for t in closed))
+        assert summary.gross_pnl == pytest.approx(sum(t.gross_pnl for t in closed))
+        assert summary.total_fees_paid == pytest.approx(sum(t.total_fees for t in closed))
+        assert summary.wins == 3
+
+    def test_summary_is_immutable(self, tracker):
+        import dataclasses
+
+        summary = tracker.get_summary()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            summary.total_pnl = 1.0
+
+
 class TestSlots:
     def test_trade_record_has_slots(self):
         from utils.pnl_tracker import TradeRecord
@@ -207,3 +255,23 @@ class TestSlots:
     def test_pnl_summary_no_instance_dict(self, tracker):
         summary = tracker.get_summary()
         assert not hasattr(summary, "__dict__")
+
+
+class TestGetClosedTrade:
+    def test_open_position_has_no_closed_trade(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        assert tracker.get_closed_trade("p1") is None
+
+    def test_returns_trade_after_close(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        tracker.close_position("p1", exit_price=1.0)
+        trade = tracker.get_closed_trade("p1")
+        assert trade is not None
+        assert trade.position_id == "p1"
+        assert trade.exit_time is not None
+
+    def test_reset_clears_index(self, tracker):
+        tracker.open_position("p1", "m1", 100.0, 0.985)
+        tracker.close_position("p1", exit_price=1.0)
+        tracker.reset()
+        assert tracker.get_closed_trade("p1") is None
@@ -0,0 +1,237 @@
+"""
+Tests for data/polymarket_client.py
+
+Covers:
+- get_all_markets maps categories to the right Gamma tag id
+- JSON-encoded market list fields are decoded once when a page is fetched
+- Concurrent fetches of the same Gamma listing are coalesced into one request chain
+- Each caller receives its own list (mutating one result does not affect another)
+- Listings, prices and order books are served from short TTL caches
+- get_order_books / get_prices fetch many tokens with one batched request
+"""
+
+import json
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from data.polymarket_client import PolymarketClient
+
+
+def _client():
+    """PolymarketClient with live-mode state but no SDK / network initialisation."""
+    with patch("data.polymarket_client.config") as cfg:
+        cfg.TRADING_MODE = "simulation"
+        client = PolymarketClient()
+    client._simulation = False
+    return client
+
+
+class TestGammaTagMapping:
+    def test_tagged_and_untagged_categories(self):
+        client = _client()
+        calls = []
+
+        def _fetch(tag_id, category):
+            calls.append((tag_id, category))
+            return []
+
+        with (
+            patch.object(client, "_fetch_gamma_markets", side_effect=_fetch),
+            patch("data.polymarket_client._GAMMA_CACHE_TTL_S", 0.0),
+        ):
+            for cat in ("crypto", "fed", "regulatory", "other"):
+                client.get_all_markets(category=cat)
+
+        assert calls == [
+            ("21", "crypto"),
+            ("7", "fed"),
+            (None, "regulatory"),
+            (None, "other"),
+        ]
+
+    def test_pages_share_params_except_offset(self):
+        client = _client()
+        sent = []
+        full_page = [{"markets": []}] * 100
+
+        def _get(url, params, timeout):
+            sent.append(dict(params))
+            resp = MagicMock(status_code=200)
+            resp.content = json.dumps(full_page if len(sent) == 1 else []).encode()
+            return resp
+
+        with patch("data.polymarket_client._http_session") as http:
+            http.get.side_effect = _get
+            client._fetch_gamma_markets("21", "crypto")
+
+        base = {"active": "true", "closed": "false", "limit": 100, "tag_id": "21"}
+        assert sent == [{**base, "offset": 0}, {**base, "offset": 100}]
+
+    def test_json_encoded_fields_decoded_once_at_fetch(self):
+        client = _client()
+        market = {
+            "active": True,
+            "closed": False,
+            "clobTokenIds": '["y", "n"]',
+            "outcomePrices": '["0.98", "0.02"]',
+            "outcomes": "not json",
+        }
+        resp = MagicMock(status_code=200)
+        resp.content = json.dumps([{"tags": [], "markets": [market]}]).encode()
+        with patch("data.polymarket_client._http_session") as http:
+            http.get.return_value = resp
+            (out,) = client._fetch_gamma_markets(None, "other")
+        assert out["clobTokenIds"] == ["y", "n"]
+        assert out["outcomePrices"] == ["0.98", "0.02"]
+        assert out["outcomes"] == []
+
+
+class TestGammaCoalescing:
+    def test_concurrent_untagged_fetches_share_one_request(self):
+        client = _client()
+        release = threading.Event()
+        calls = []
+
+        def _slow_fetch(tag_id, category):
+            calls.append(tag_id)
+            release.wait(timeout=5)
+            return [{"id": "m1"}]
+
+        results = {}
+
+        def _run(cat):
+            results[cat] = client.get_all_markets(category=cat)
+
+        with patch.object(client, "_fetch_gamma_markets", side_effect=_slow_fetch):
+            leader = threading.Thread(target=_run, args=("regulatory",))
+            leader.start()
+            while not calls:
+                pass
+            follower = threading.Thread(target=_run, args=("other",))
+            follower.start()
+            release.set()
+            leader.join(timeout=5)
+            follower.join(timeout=5)
+
+        assert calls == [None]
+        assert results["regulatory"] == [{"id": "m1"}]
+        assert results["other"] == [{"id": "m1"}]
+        assert results["regulatory"] is not results["other"]
+
+
+class TestResponseCaches:
+    def test_listing_reused_within_ttl(self):
+        client = _client()
+        with patch.object(client, "_fetch_gamma_markets", return_value=[{"id": "m1"}]) as fetch:
+            client.get_all_markets(category="regulatory")
+            client.get_all_markets(category="other")
+        assert fetch.call_count == 1
+
+    def test_listing_refetched_after_ttl(self):
+        client = _client()
+        with patch.object(client, "_fetch_gamma_markets", return_value=[]) as fetch:
+            with patch("data.polymarket_client._GAMMA_CACHE_TTL_S", 0.0):
+                client.get_all_markets(category="other")
+                client.get_all_markets(category="other")
+        assert fetch.call_count == 2
+
+    def test_price_reused_within_ttl(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_price.return_value = {"price": "0.97"}
+        assert client.get_price("tok") == 0.97
+        assert client.get_price("tok") == 0.97
+        assert client.client.get_price.call_count == 1
+
+    def test_failed_price_not_cached(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_price.side_effect = [RuntimeError("boom"), {"price": "0.5"}]
+        assert client.get_price("tok") == 0.0
+        assert client.get_price("tok") == 0.5
+
+    def test_order_book_reused_within_ttl(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_order_book.return_value = {
+            "bids": [{"price": "0.48", "size": "10"}],
+            "asks": [{"price": "0.52", "size": "5"}],
+        }
+        first = client.get_order_book("tok")
+        first["bids"].clear()
+        second = client.get_order_book("tok")
+        assert client.client.get_order_book.call_count == 1
+        assert second["bids"] == [{"price": 0.48, "size": 10.0}]
+        assert second["mid_price"] == 0.5
+
+
+class TestBatchOrderBooks:
+    def _summary(self, tid, bid, ask):
+        return {
+            "asset_id": tid,
+            "bids": [{"price": str(bid), "size": "10"}],
+            "asks": [{"price": str(ask), "size": "10"}],
+        }
+
+    def test_single_request_for_many_tokens(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_order_books.return_value = [
+            self._summary("a", 0.40, 0.42),
+            self._summary("b", 0.60, 0.64),
+        ]
+        books = client.get_order_books(["a", "b"])
+        assert client.client.get_order_books.call_count == 1
+        assert books["a"]["mid_price"] == pytest.approx(0.41)
+        assert books["b"]["bids"] == [{"price": 0.60, "size": 10.0}]
+
+    def test_cached_books_skip_request(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_order_book.return_value = self._summary("a", 0.40, 0.42)
+        client.get_order_book("a")
+        client.client.get_order_books.return_value = [self._summary("b", 0.60, 0.64)]
+        books = client.get_order_books(["a", "b"])
+        params = client.client.get_order_books.call_args[0][0]
+        assert [p.token_id for p in params] == ["b"]
+        assert set(books) == {"a", "b"}
+
+    def test_failed_batch_omits_tokens(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_order_books.side_effect = RuntimeError("boom")
+        assert client.get_order_books(["a"]) == {}
+
+
+class TestBatchPrices:
+    def test_single_request_for_many_tokens(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_prices.return_value = {"a": {"BUY": "0.41"}, "b": {"BUY": "0.62"}}
+        assert client.get_prices(["a", "b"]) == {"a": 0.41, "b": 0.62}
+        assert client.client.get_prices.call_count == 1
+        # Results feed the per-token cache used by get_price().
+        assert client.get_price("a") == 0.41
+        client.client.get_price.assert_not_called()
+
+    def test_unpriced_tokens_omitted(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_prices.return_value = {"a": {"BUY": "0.41"}}
+        assert client.get_prices(["a", "b"]) == {"a": 0.41}
+
+    def test_failed_batch_returns_empty(self):
+        client = _client()
+        client.client = MagicMock()
+        client.client.get_prices.side_effect = RuntimeError("boom")
+        assert client.get_prices(["a"]) == {}
+
+    def test_simulation_omits_unknown_tokens(self):
+        # Unknown tokens must be left to the get_price() fallback, not priced
+        # at 0.0 — showcase_demo patches get_price with synthetic quotes.
+        client = _client()
+        client._simulation = True
+        client._sim_price_index = {"a": 0.41}
+        assert client.get_prices(["a", "b"]) == {"a": 0.41}
@@ -1,14 +1,21 @@
 """
 Unit tests for data/polymarket_models.py
-Covers TradeStatus, TradeOpportunity, TradePosition, FakeCurrency, TradeAuditRecord,
-MarketCache, and backward-compatibility aliases.
+Covers TradeStatus, TradeOpportunity, Opportunity, TradePosition, FakeCurrency, TradeAuditRecord,
+MarketCache, backward-compatibility aliases, and normalisation of legacy sa.Enum status rows.
 """
 
 from datetime import datetime
 
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
 from data.polymarket_models import (
+    Base,
+    normalise_legacy_status,
     TradeStatus,
     PositionStatus,
+    Opportunity,
     TradeOpportunity,
     TradePosition,
     FakeCurrency,
@@ -94,6 +101,13 @@ def _make_opportunity(**kwargs):
     return TradeOpportunity(**defaults)
 
 
+def _opportunity_columns():
+    opp = _make_opportunity()
+    return {
+        c.name: getattr(opp, c.name) for c in TradeOpportunity.__table__.columns if c.name != "id"
+    }
+
+
 class TestTradeOpportunityToDict:
     def test_required_keys_present(self):
         opp = _make_opportunity()
@@ -136,6 +150,64 @@ class TestTradeOpportunityToDict:
         opp = _make_opportunity()
         assert opp.to_dict()["executed_at"] is None
 
+    def test_status_coerced_to_plain_string(self):
+        opp = _make_opportunity(status=TradeStatus.EXECUTED)
+        assert type(opp.status) is str
+        assert opp.status == "executed"
+
+    def test_unknown_status_rejected(self):
+        with pytest.raises(ValueError):
+            _make_opportunity(status="bogus")
+
+    def test_legacy_member_name_accepted(self):
+        assert _make_opportunity(status="EXECUTED").status == "executed"
+
+    def test_legacy_upper_case_row_normalised_on_init(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(TradeOpportunity.__table__.insert().values(**_opportunity_columns()))
+            conn.execute(
+                text("UPDATE trade_opportunities SET status = 'DETECTED'")
+            )  # as written by the former sa.Enum column
+        normalise_legacy_status(engine)
+        with Session(engine) as session:
+            (row,) = session.query(TradeOpportunity).filter_by(status="detected").all()
+        assert row.status == "detected"
+
+    def test_to_dicts_matches_to_dict(self):
+        rows = [_make_opportunity(id=i, executed_at=datetime(2026, 1, 2)) for i in range(3)]
+        assert TradeOpportunity.to_dicts(rows) == [r.to_dict() for r in rows]
+
+    def test_to_dicts_renames_current_price(self):
+        (d,) = TradeOpportunity.to_dicts([_make_opportunity(current_price=0.97)])
+        assert d["winning_price"] == 0.97
+        assert "current_price" not in d
+
+
+class TestOpportunity:
+    def _make(self, **kwargs):
+        fields = {
+            k: v
+            for k, v in _make_opportunity().__dict__.items()
+            if k in Opportunity.__dataclass_fields__
+        }
+        fields["status"] = "detected"
+        fields.update(kwargs)
+        return Opportunity(**fields)
+
+    def test_slotted(self):
+        assert not hasattr(self._make(), "__dict__")
+
+    def test_to_dict_matches_model(self):
+        opp = self._make(id=7)
+        assert opp.to_dict() == opp.to_model().to_dict()
+
+    def test_strategy_hooks_not_persisted(self):
+        model = self._make(model_prob=0.99, override_capital=5.0).to_model()
+        assert isinstance(model, TradeOpportunity)
+        assert not hasattr(model, "model_prob")
+
 
 # ---------------------------------------------------------------------------
 # TradePosition.to_dict()
@@ -7,7 +7,7 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 from utils.pnl_tracker import PnLTracker
-from portfolio.position_tracker import PositionTracker
+from portfolio.position_tracker import PositionTracker, new_position_id
 
 
 @pytest.fixture
@@ -74,6 +74,12 @@ class TestCreatePosition:
         assert returned_id is not None
         assert tracker.get_position(returned_id) is not None
 
+    def test_generated_ids_are_unique_and_ordered(self):
+        ids = [new_position_id("m1") for _ in range(3)]
+        assert len(set(ids)) == 3
+        assert ids == sorted(ids)
+        assert all(i.startswith("m1_") and len(i.split("_")[1]) == 20 for i in ids)
+
     def test_position_is_open(self, tracker):
         opp = make_opportunity()
         tracker.create_position(opp, 10.0, 985.0, 15.0, position_id="p1")
@@ -138,6 +144,40 @@ class TestFilters:
         assert tracker.get_position_count() == 1
 
 
+class TestStatusIndexes:
+    def test_summary_tracks_open_and_settled(self, tracker):
+        opp = make_opportunity(current_price=0.985)
+        for pid in ("a", "b", "c"):
+            tracker.create_position(opp, 100.0, 98.5, 1.5, position_id=pid)
+        tracker.settle_position("a", settlement_price=1.0)
+        tracker.settle_position("b", settlement_price=0.0)
+
+        summary = tracker.get_summary()
+        assert summary["open_positions"] == 1
+        assert summary["settled_positions"] == 2
+        assert summary["total_positions"] == 3
+        assert summary["allocated_capital"] == pytest.approx(98.5)
+        assert (summary["wins"], summary["losses"]) == (1, 1)
+        assert summary["realized_pnl"] == pytest.approx(
+            tracker.get_position("a").realized_pnl + tracker.get_position("b").realized_pnl
+        )
+
+    def test_restored_positions_indexed_by_status(self, tracker):
+        opp = make_opportunity()
+        tracker.create_position(opp, 10.0, 9.85, 0.15, position_id="p1")
+        pos = tracker.get_position("p1")
+        other = make_tracker(PnLTracker())
+        other.restore_position(pos)
+        assert other.get_open_positions() == [pos]
+        assert other.get_position_count() == 1
+
+    def test_reset_clears_indexes(self, tracker):
+        tracker.create_position(make_opportunity(), 10.0, 9.85, 0.15, position_id="p1")
+        tracker.reset()
+        assert tracker.get_open_positions() == []
+        assert tracker.get_summary()["open_positions"] == 0
+
+
 class TestCanOpenPosition:
     def test_true_when_under_limit(self, tracker):
         assert tracker.can_open_position() is True
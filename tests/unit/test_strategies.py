@@ -277,6 +277,7 @@ class TestExampleStrategy:
         ]
         result = ExampleStrategy(_make_client()).get_best_opportunities(opps, limit=3)
         assert len(result) == 3
+        assert [o.edge_percent for o in result] == [9.0, 8.0, 7.0]
 
     def test_should_exit_false_before_expiry(self):
         s = ExampleStrategy(_make_client())
@@ -2,8 +2,9 @@
 Unit tests for utils/execution_timer.py — TaskScheduler and ScheduledTask.
 """
 
+import time
 from datetime import datetime, timezone, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from utils.execution_timer import TaskScheduler, ScheduledTask
 
@@ -16,6 +17,11 @@ def _past(seconds=60) -> datetime:
     return datetime.now(timezone.utc) - timedelta(seconds=seconds)
 
 
+def _later(seconds):
+    """Run pop_ready() as if *seconds* had elapsed."""
+    return patch("utils.execution_timer.time.time", return_value=time.time() + seconds)
+
+
 class TestSchedule:
     def test_schedule_future_returns_true(self):
         scheduler = TaskScheduler()
@@ -27,6 +33,12 @@ class TestSchedule:
         result = scheduler.schedule("t1", execute_at=_past(60), callback=lambda: None)
         assert result is False
 
+    def test_schedule_judges_past_by_same_clock_as_pop_ready(self):
+        scheduler = TaskScheduler()
+        with _later(30):
+            assert scheduler.schedule("t1", execute_at=_future(10), callback=lambda: None) is False
+        assert scheduler.pending_count == 0
+
     def test_schedule_adds_to_pending(self):
         scheduler = TaskScheduler()
         scheduler.schedule("t1", execute_at=_future(60), callback=lambda: None)
@@ -89,35 +101,28 @@ class TestPopReady:
         assert scheduler.pending_count == 1
 
     def test_past_task_is_ready(self):
-        """Manually insert a past task to simulate time passing."""
+        """Advance the clock past a scheduled task to simulate time passing."""
         scheduler = TaskScheduler()
         cb = MagicMock()
-        # Directly inject an already-past task
-        scheduler._tasks["t1"] = ScheduledTask(
-            task_id="t1",
-            execute_at=_past(1),
-            callback=cb,
-            label="test",
-        )
-        ready = scheduler.pop_ready()
+        scheduler.schedule("t1", execute_at=_future(1), callback=cb, label="test")
+        with _later(5):
+            ready = scheduler.pop_ready()
         assert len(ready) == 1
         assert ready[0].task_id == "t1"
 
     def test_ready_task_removed_from_pending(self):
         scheduler = TaskScheduler()
-        scheduler._tasks["t1"] = ScheduledTask(
-            task_id="t1", execute_at=_past(1), callback=lambda: None
-        )
-        scheduler.pop_ready()
+        scheduler.schedule("t1", execute_at=_future(1), callback=lambda: None)
+        with _later(5):
+            scheduler.pop_ready()
         assert scheduler.pending_count == 0
 
     def test_only_past_tasks_returned(self):
         scheduler = TaskScheduler()
-        scheduler._tasks["past"] = ScheduledTask(
-            task_id="past", execute_at=_past(1), callback=lambda: None
-        )
+        scheduler.schedule("past", execute_at=_future(1), callback=lambda: None)
         scheduler.schedule("future", execute_at=_future(60), callback=lambda: None)
-        ready = scheduler.pop_ready()
+        with _later(5):
+            ready = scheduler.pop_ready()
         assert len(ready) == 1
         assert ready[0].task_id == "past"
         assert scheduler.pending_count == 1
@@ -125,21 +130,56 @@ class TestPopReady:
     def test_multiple_ready_tasks_all_returned(self):
         scheduler = TaskScheduler()
         for i in range(3):
-            scheduler._tasks[f"t{i}"] = ScheduledTask(
-                task_id=f"t{i}", execute_at=_past(i + 1), callback=lambda: None
-            )
-        ready = scheduler.pop_ready()
-        assert len(ready) == 3
+            scheduler.schedule(f"t{i}", execute_at=_future(3 - i), callback=lambda: None)
+        with _later(5):
+            ready = scheduler.pop_ready()
+        assert [t.task_id for t in ready] == ["t2", "t1", "t0"]  # soonest first
         assert scheduler.pending_count == 0
 
     def test_callback_is_correct_object(self):
         scheduler = TaskScheduler()
         cb = MagicMock()
-        scheduler._tasks["t1"] = ScheduledTask(task_id="t1", execute_at=_past(1), callback=cb)
-        ready = scheduler.pop_ready()
+        scheduler.schedule("t1", execute_at=_future(1), callback=cb)
+        with _later(5):
+            ready = scheduler.pop_ready()
         assert ready[0].callback is cb
 
 
+class TestStaleHeapEntries:
+    def test_rescheduled_later_does_not_fire_at_old_time(self):
+        scheduler = TaskScheduler()
+        scheduler.schedule("t1", execute_at=_future(1), callback=lambda: None)
+        scheduler.schedule("t1", execute_at=_future(60), callback=lambda: None)
+        with _later(5):
+            assert scheduler.pop_ready() == []
+        assert scheduler.pending_count == 1
+        with _later(120):
+            assert [t.task_id for t in scheduler.pop_ready()] == ["t1"]
+        assert scheduler._heap == []
+
+    def test_rescheduled_earlier_fires_once(self):
+        scheduler = TaskScheduler()
+        scheduler.schedule("t1", execute_at=_future(60), callback=lambda: None)
+        scheduler.schedule("t1", execute_at=_future(1), callback=lambda: None)
+        with _later(120):
+            assert [t.task_id for t in scheduler.pop_ready()] == ["t1"]
+
+    def test_cancelled_task_never_fires(self):
+        scheduler = TaskScheduler()
+        scheduler.schedule("t1", execute_at=_future(1), callback=lambda: None)
+        scheduler.cancel("t1")
+        with _later(5):
+            assert scheduler.pop_ready() == []
+        assert scheduler._heap == []
+
+    def test_heap_compacted_after_many_cancels(self):
+        scheduler = TaskScheduler()
+        for i in range(500):
+            scheduler.schedule(f"t{i}", execute_at=_future(60), callback=lambda: None)
+            scheduler.cancel(f"t{i}")
+        assert len(scheduler._heap) <= 2 * scheduler.pending_count + TaskScheduler._HEAP_SLACK + 1
+
+
 class TestClear:
     def test_clear_removes_all(self):
         scheduler = TaskScheduler()
@@ -180,6 +220,11 @@ class TestScheduledTask:
         assert task.callback is cb
         assert task.label == "my-task"
 
+    def test_execute_at_ts_matches_execute_at(self):
+        when = _future(30)
+        task = ScheduledTask(task_id="t1", execute_at=when, callback=lambda: None)
+        assert task.execute_at_ts == when.timestamp()
+
     def test_label_defaults_to_empty_string(self):
         task = ScheduledTask(
             task_id="t1",
@@ -5,16 +5,23 @@ Manages alert creation and dispatch via email and webhooks
 
 import atexit
 import threading
-from collections import deque
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Dict, Optional, Tuple
 from enum import Enum
 import json
 
 from utils.logger import logger
 from config.polymarket_config import config
 
+# Bound once at import so the per-trade alert does a single %-format instead of
+# rebuilding a triple-quoted f-string each call.
+_POSITION_OPENED_TITLE = "Position Opened: %s"
+_POSITION_OPENED_MESSAGE = "Position ID: %s\nMarket: %s\nQuantity: %s\nEntry Price: $%.4f"
+
+# Most distinct (type, message) pairs remembered for the cooldown check.
+_ALERT_HISTORY_MAX = 1000
+
 
 class AlertType(str, Enum):
     """Alert types"""
@@ -61,8 +68,10 @@ class AlertManager:
         self.email_enabled = config.ENABLE_EMAIL_ALERTS
         self.webhook_enabled = config.ENABLE_DISCORD_ALERTS
 
-        # Rate limiting — bounded deque so memory never grows unbounded
-        self.alert_history: deque = deque(maxlen=1000)
+        # Rate limiting — (type, message) → monotonic time it was last sent, so
+        # the cooldown check is one hash lookup.  Capped at _ALERT_HISTORY_MAX
+        # keys; see _track_alert for eviction.
+        self._last_sent: Dict[Tuple[AlertType, str], float] = {}
         self.cooldown_period = 300  # 5 minutes between similar alerts
         self._history_lock = threading.Lock()
 
@@ -80,6 +89,15 @@ class AlertManager:
         if self.email_enabled or self.webhook_enabled:
             self._initialize_senders()
 
+    @property
+    def enabled(self) -> bool:
+        """True when at least one transport (email or webhook) is configured.
+
+        Callers on the trading path check this before building per-trade INFO
+        alerts; with no transport the alert would only duplicate their own log line.
+        """
+        return self.email_sender is not None or self.webhook_sender is not None
+
     def _initialize_senders(self):
         """Initialize notification senders"""
         if self.email_enabled:
@@ -188,28 +206,29 @@ class AlertManager:
             logger.error(f"Webhook alert thread error: {exc}")
 
     def _should_send_alert(self, alert_type: AlertType, message: str) -> bool:
-        """Check if alert should be sent based on rate limiting.
-
-        Uses the bounded deque directly — no list rebuild required.  Entries
-        older than cooldown_period are simply ignored during the scan rather
-        than being purged eagerly; the deque's maxlen of 1000 bounds worst-case
-        iteration to O(1000) which is negligible.
-        """
-        now = datetime.now()
+        """Check if alert should be sent based on rate limiting."""
         with self._history_lock:
-            for entry in self.alert_history:
-                if (now - entry["timestamp"]).total_seconds() >= self.cooldown_period:
-                    continue
-                if entry["type"] == alert_type and entry["message"] == message:
-                    return False
-        return True
+            sent_at = self._last_sent.get((alert_type, message))
+        return sent_at is None or time.monotonic() - sent_at >= self.cooldown_period
 
     def _track_alert(self, alert_type: AlertType, message: str):
-        """Track alert for rate limiting"""
+        """Track alert for rate limiting.
+
+        At the cap, expired entries are swept first; if every entry is still
+        cooling down, the least recently sent one is dropped (keys are
+        re-inserted on each send, so dict order is send order).
+        """
+        key = (alert_type, message)
+        now = time.monotonic()
         with self._history_lock:
-            self.alert_history.append(
-                {"type": alert_type, "message": message, "timestamp": datetime.now()}
-            )
+            last_sent = self._last_sent
+            last_sent.pop(key, None)
+            if len(last_sent) >= _ALERT_HISTORY_MAX:
+                cutoff = now - self.cooldown_period
+                last_sent = self._last_sent = {k: t for k, t in last_sent.items() if t > cutoff}
+                if len(last_sent) >= _ALERT_HISTORY_MAX:
+                    del last_sent[next(iter(last_sent))]
+            last_sent[key] = now
 
     def send_trade_alert(
         self,
@@ -249,13 +268,8 @@ Total: ${total:.2f}
         self, position_id: str, market_id: str, quantity: float, price: float
     ):
         """Send position opened alert"""
-        title = f"Position Opened: {position_id}"
-        message = f"""
-Position ID: {position_id}
-Market: {market_id}
-Quantity: {quantity}
-Entry Price: ${price:.4f}
-"""
+        title = _POSITION_OPENED_TITLE % position_id
+        message = _POSITION_OPENED_MESSAGE % (position_id, market_id, quantity, price)
 
         data = {
             "position_id": position_id,
@@ -264,9 +278,7 @@ Entry Price: ${price:.4f}
             "price": price,
         }
 
-        self.create_alert(
-            AlertType.POSITION_OPENED, title, message.strip(), AlertSeverity.INFO, data
-        )
+        self.create_alert(AlertType.POSITION_OPENED, title, message, AlertSeverity.INFO, data)
 
     def send_position_closed_alert(
         self, position_id: str, market_id: str, exit_price: float, pnl: float
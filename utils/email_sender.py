@@ -3,14 +3,78 @@ Email Sender Module
 Handles email notifications for alerts
 """
 
+import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Optional
 from datetime import datetime
 
+from config.polymarket_config import config
 from utils.logger import logger
 
+_SEVERITY_EMOJI = {"INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌", "CRITICAL": "🚨"}
+
+# Alert bodies are built once at import and filled with str.format_map per
+# alert, rather than re-assembling ~40 lines of f-strings on every send.
+_TEXT_TEMPLATE = (
+    """
+Polymarket Arbitrage Bot Alert
+"""
+    + "=" * 50
+    + """
+
+Alert Type: {alert_type}
+Severity: {severity}
+Timestamp: {timestamp}
+
+Title: {title}
+
+{message}
+{text_extra}"""
+)
+
+_HTML_TEMPLATE = """
+<html>
+<head>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
+        .header {{ background-color: #f4f4f4; padding: 20px; }}
+        .content {{ padding: 20px; }}
+        .alert-type {{ font-weight: bold; color: #333; }}
+        .severity-INFO {{ color: #2196F3; }}
+        .severity-WARNING {{ color: #FF9800; }}
+        .severity-ERROR {{ color: #f44336; }}
+        .severity-CRITICAL {{ color: #B71C1C; }}
+        .message {{ background-color: #f9f9f9; padding: 15px; margin: 10px 0;
+            border-left: 3px solid #ccc; }}
+        .footer {{ background-color: #f4f4f4; padding: 10px; text-align: center;
+            font-size: 12px; color: #666; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h2>Polymarket Arbitrage Bot Alert</h2>
+    </div>
+    <div class="content">
+        <p><span class="alert-type">Alert Type:</span> {alert_type}</p>
+        <p><span class="alert-type">Severity:</span>
+            <span class="severity-{severity}">{severity}</span></p>
+        <p><span class="alert-type">Timestamp:</span>
+            {timestamp}</p>
+
+        <h3>{title}</h3>
+        <div class="message">{message_html}</div>
+{html_extra}
+    </div>
+    <div class="footer">
+        <p>This is an automated alert from your Polymarket Arbitrage Bot.</p>
+        <p>Please do not reply to this email.</p>
+    </div>
+</body>
+</html>
+"""
+
 
 class EmailSender:
     """
@@ -24,8 +88,6 @@ class EmailSender:
     """
 
     def __init__(self):
-        from config.polymarket_config import config
-
         self.smtp_server = config.SMTP_SERVER
         self.smtp_port = config.SMTP_PORT
         self.smtp_username = config.SMTP_USERNAME
@@ -117,91 +179,40 @@ class EmailSender:
         message = alert_data.get("message", "")
         data = alert_data.get("data")
 
-        # Create subject
-        severity_emoji = {"INFO": "ℹ️", "WARNING": "⚠️", "ERROR": "❌", "CRITICAL": "🚨"}
-        subject = f"{severity_emoji.get(severity, '⚠️')} [{severity}] {title}"
-
-        # Create email body
-        body = f"""
-Polymarket Arbitrage Bot Alert
-{'=' * 50}
-
-Alert Type: {alert_type}
-Severity: {severity}
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        subject = f"{_SEVERITY_EMOJI.get(severity, '⚠️')} [{severity}] {title}"
 
-Title: {title}
-
-{message}
-"""
-
-        # Add additional data if available
+        # Parse the optional data payload once for both bodies
+        items = ()
         if data:
             try:
-                import json
-
                 parsed_data = json.loads(data) if isinstance(data, str) else data
-                body += "\nAdditional Information:\n"
-                for key, value in parsed_data.items():
-                    body += f"  {key}: {value}\n"
+                items = tuple(parsed_data.items())
             except Exception as e:
                 logger.debug(f"Could not parse alert data: {e}")
 
-        # Create HTML version
-        html_body = f"""
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-        .header {{ background-color: #f4f4f4; padding: 20px; }}
-        .content {{ padding: 20px; }}
-        .alert-type {{ font-weight: bold; color: #333; }}
-        .severity-INFO {{ color: #2196F3; }}
-        .severity-WARNING {{ color: #FF9800; }}
-        .severity-ERROR {{ color: #f44336; }}
-        .severity-CRITICAL {{ color: #B71C1C; }}
-        .message {{ background-color: #f9f9f9; padding: 15px; margin: 10px 0;
-            border-left: 3px solid #ccc; }}
-        .footer {{ background-color: #f4f4f4; padding: 10px; text-align: center;
-            font-size: 12px; color: #666; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h2>Polymarket Arbitrage Bot Alert</h2>
-    </div>
-    <div class="content">
-        <p><span class="alert-type">Alert Type:</span> {alert_type}</p>
-        <p><span class="alert-type">Severity:</span>
-            <span class="severity-{severity}">{severity}</span></p>
-        <p><span class="alert-type">Timestamp:</span>
-            {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-
-        <h3>{title}</h3>
-        <div class="message">{message.replace(chr(10), "<br>")}</div>
-"""
-
-        if data:
-            try:
-                import json
-
-                parsed_data = json.loads(data) if isinstance(data, str) else data
-                html_body += "<h4>Additional Information:</h4><ul>"
-                for key, value in parsed_data.items():
-                    html_body += f"<li><strong>{key}:</strong> {value}</li>"
-                html_body += "</ul>"
-            except Exception:
-                pass
-
-        html_body += """
-    </div>
-    <div class="footer">
-        <p>This is an automated alert from your Polymarket Arbitrage Bot.</p>
-        <p>Please do not reply to this email.</p>
-    </div>
-</body>
-</html>
-"""
+        text_extra = html_extra = ""
+        if items:
+            text_extra = "\nAdditional Information:\n" + "".join(
+                f"  {key}: {value}\n" for key, value in items
+            )
+            html_extra = (
+                "<h4>Additional Information:</h4><ul>"
+                + "".join(f"<li><strong>{key}:</strong> {value}</li>" for key, value in items)
+                + "</ul>"
+            )
+
+        ctx = {
+            "alert_type": alert_type,
+            "severity": severity,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "title": title,
+            "message": message,
+            "message_html": message.replace("\n", "<br>"),
+            "text_extra": text_extra,
+            "html_extra": html_extra,
+        }
+        body = _TEXT_TEMPLATE.format_map(ctx)
+        html_body = _HTML_TEMPLATE.format_map(ctx)
 
         return self.send_email(subject, body.strip(), html_body)
 
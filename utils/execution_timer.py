@@ -5,9 +5,11 @@ Strategies can use this to time entries or exits without coupling
 the infrastructure to any particular strategy's logic.
 """
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List
-from datetime import datetime, timezone
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+from datetime import datetime
 
 from utils.logger import logger
 
@@ -20,6 +22,12 @@ class ScheduledTask:
     execute_at: datetime
     callback: Callable[[], None]
     label: str = ""
+    # execute_at as a POSIX timestamp, fixed at construction, so the scheduler
+    # compares floats against time.time() rather than doing datetime arithmetic.
+    execute_at_ts: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.execute_at_ts = self.execute_at.timestamp()
 
 
 class TaskScheduler:
@@ -34,8 +42,15 @@ class TaskScheduler:
             task.callback()
     """
 
+    # Rebuild the heap once stale entries outnumber live tasks by this margin.
+    _HEAP_SLACK = 64
+
     def __init__(self) -> None:
         self._tasks: Dict[str, ScheduledTask] = {}
+        # Min-heap of (execute_at epoch, task_id) so pop_ready() only touches
+        # due tasks.  Cancelled or rescheduled tasks leave stale entries behind;
+        # they are recognised by their timestamp no longer matching _tasks.
+        self._heap: List[Tuple[float, str]] = []
 
     def schedule(
         self,
@@ -48,21 +63,26 @@ class TaskScheduler:
         Register a task to fire at execute_at (UTC).
         Returns False if execute_at is already in the past.
         """
-        now = datetime.now(timezone.utc)
-        if execute_at <= now:
+        task = ScheduledTask(
+            task_id=task_id,
+            execute_at=execute_at,
+            callback=callback,
+            label=label,
+        )
+        now = time.time()
+        if task.execute_at_ts <= now:
             logger.warning(
                 "TaskScheduler: %s is already past (%s) — not scheduled",
                 task_id,
                 execute_at.isoformat(),
             )
             return False
-        self._tasks[task_id] = ScheduledTask(
-            task_id=task_id,
-            execute_at=execute_at,
-            callback=callback,
-            label=label,
-        )
-        delay = (execute_at - now).total_seconds()
+        self._tasks[task_id] = task
+        heapq.heappush(self._heap, (task.execute_at_ts, task_id))
+        if len(self._heap) > 2 * len(self._tasks) + self._HEAP_SLACK:
+            self._heap = [(t.execute_at_ts, t.task_id) for t in self._tasks.values()]
+            heapq.heapify(self._heap)
+        delay = task.execute_at_ts - now
         logger.debug("TaskScheduler: scheduled %s in %.1fs (%s)", task_id, delay, label)
         return True
 
@@ -72,14 +92,20 @@ class TaskScheduler:
 
     def pop_ready(self) -> List[ScheduledTask]:
         """
-        Return and remove all tasks whose execute_at has passed.
-        Call once per trading-loop iteration.
+        Return and remove all tasks whose execute_at has passed, soonest first.
+        Call once per trading-loop iteration; costs O(1) when nothing is due.
         """
-        now = datetime.now(timezone.utc)
-        ready = [t for t in self._tasks.values() if now >= t.execute_at]
-        for t in ready:
-            del self._tasks[t.task_id]
-            logger.debug("TaskScheduler: task %s ready (%s)", t.task_id, t.label)
+        now = time.time()
+        heap = self._heap
+        ready = []
+        while heap and heap[0][0] <= now:
+            ts, task_id = heapq.heappop(heap)
+            task = self._tasks.get(task_id)
+            if task is None or task.execute_at_ts != ts:
+                continue  # cancelled or rescheduled since this entry was pushed
+            del self._tasks[task_id]
+            logger.debug("TaskScheduler: task %s ready (%s)", task_id, task.label)
+            ready.append(task)
         return ready
 
     @property
@@ -88,3 +114,4 @@ class TaskScheduler:
 
     def clear(self) -> None:
         self._tasks.clear()
+        self._heap.clear()
@@ -3,11 +3,13 @@ Logging Utility
 Provides colored console logging and file logging with rotation
 """
 
+import atexit
 import csv
 import io
 import logging
 import sys
 import threading
+import time
 from pathlib import Path
 from datetime import datetime
 import colorlog
@@ -56,6 +58,58 @@ class UTF8ColorStreamHandler(colorlog.StreamHandler):
             self.handleError(record)
 
 
+class BatchedFileHandler(logging.FileHandler):
+    """
+    FileHandler that coalesces log lines into fewer write(2) syscalls.
+
+    logging.StreamHandler flushes after every record, so each INFO line during a
+    scan costs its own write syscall.  This handler lets the file object's buffer
+    accumulate records and flushes when any of these hold:
+
+      * the record is WARNING or above (errors reach disk immediately),
+      * `max_pending` records have been buffered since the last flush,
+      * `max_delay_s` seconds have passed since the last flush.
+
+    The delay check runs on the next emit, so during a quiet period the tail of
+    the file can lag until the next record or until logging.shutdown() at exit.
+    """
+
+    def __init__(
+        self,
+        filename,
+        encoding: str = None,
+        max_pending: int = 64,
+        max_delay_s: float = 1.0,
+    ):
+        super().__init__(filename, encoding=encoding)
+        self.max_pending = max_pending
+        self.max_delay_s = max_delay_s
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if (
+                record.levelno >= logging.WARNING
+                or self._pending >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.max_delay_s
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+
 def setup_logger(name: str, log_file: str = None) -> logging.Logger:
     """
     Set up a logger with console and file handlers
@@ -104,7 +158,7 @@ def setup_logger(name: str, log_file: str = None) -> logging.Logger:
         # Plain FileHandler — date-stamped filenames already provide daily rotation.
         # RotatingFileHandler uses os.rename() which fails on Windows when another
         # process holds the file open.
-        file_handler = logging.FileHandler(file_path, encoding="utf-8")
+        file_handler = BatchedFileHandler(file_path, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
 
         file_format = logging.Formatter(
@@ -119,19 +173,33 @@ def setup_logger(name: str, log_file: str = None) -> logging.Logger:
 class TradeLogger:
     """Specialized logger for trade events"""
 
-    def __init__(self):
+    def __init__(self, trade_file: Path = None):
         self.logger = setup_logger("trades", "trades.log")
-        logs_dir = Path(__file__).parent.parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-        self.trade_file = logs_dir / f"trade_history_{datetime.now().strftime('%Y%m%d')}.csv"
+        if trade_file is None:
+            logs_dir = Path(__file__).parent.parent / "logs"
+            logs_dir.mkdir(exist_ok=True)
+            trade_file = logs_dir / f"trade_history_{datetime.now().strftime('%Y%m%d')}.csv"
+        self.trade_file = Path(trade_file)
         self._csv_lock = threading.Lock()
 
-        # Create CSV header if file doesn't exist
-        if not self.trade_file.exists():
-            with self._csv_lock, open(self.trade_file, "w", newline="") as f:
-                csv.writer(f).writerow(
-                    ["timestamp", "action", "symbol", "quantity", "price", "total", "reason"]
-                )
+        # One append handle for the process lifetime instead of open/close per
+        # trade.  Rows are still flushed as they are written — the CSV is the
+        # trade audit record and must not lag behind a crash.
+        need_header = not self.trade_file.exists()
+        self._fh = open(self.trade_file, "a", newline="")
+        self._csv = csv.writer(self._fh)
+        if need_header:
+            self._csv.writerow(
+                ["timestamp", "action", "symbol", "quantity", "price", "total", "reason"]
+            )
+            self._fh.flush()
+        atexit.register(self.close)
+
+    def close(self):
+        """Close the trade CSV handle (registered with atexit)."""
+        with self._csv_lock:
+            if not self._fh.closed:
+                self._fh.close()
 
     def log_trade(self, action: str, symbol: str, quantity: float, price: float, reason: str = ""):
         """Log a trade to both logger and CSV"""
@@ -144,8 +212,8 @@ class TradeLogger:
         self.logger.info(message)
 
         # Append to CSV — use csv.writer so commas in field values don't corrupt columns.
-        with self._csv_lock, open(self.trade_file, "a", newline="") as f:
-            csv.writer(f).writerow(
+        with self._csv_lock:
+            self._csv.writerow(
                 [
                     datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     action,
@@ -156,6 +224,7 @@ class TradeLogger:
                     reason,
                 ]
             )
+            self._fh.flush()
 
     def log_order_rejected(self, symbol: str, reason: str):
         """Log rejected orders"""
@@ -169,7 +238,7 @@ class TradeLogger:
     ):
         """Log arbitrage opportunity detection"""
         self.logger.info(
-            f"Opportunity detected: {market_id} - " f"Price: ${price:.4f}, Edge: {edge:.2f}%"
+            "Opportunity detected: %s - Price: $%.4f, Edge: %.2f%%", market_id, price, edge
         )
 
     def log_position_opened(
@@ -182,9 +251,11 @@ class TradeLogger:
     ):
         """Log position opening"""
         self.logger.info(
-            f"Position opened: {position_id} - "
-            f"{shares:.4f} shares @ ${entry_price:.4f}, "
-            f"Expected profit: ${expected_profit:.2f}"
+            "Position opened: %s - %.4f shares @ $%.4f, Expected profit: $%.2f",
+            position_id,
+            shares,
+            entry_price,
+            expected_profit,
         )
 
     def log_position_closed(
@@ -193,15 +264,17 @@ class TradeLogger:
         """Log position closing"""
         if realized_pnl >= 0:
             self.logger.info(
-                f"Position settled: {position_id} - "
-                f"Exit: ${exit_price:.4f}, "
-                f"Profit: ${realized_pnl:.2f}"
+                "Position settled: %s - Exit: $%.4f, Profit: $%.2f",
+                position_id,
+                exit_price,
+                realized_pnl,
             )
         else:
             self.logger.warning(
-                f"Position settled: {position_id} - "
-                f"Exit: ${exit_price:.4f}, "
-                f"Loss: ${abs(realized_pnl):.2f}"
+                "Position settled: %s - Exit: $%.4f, Loss: $%.2f",
+                position_id,
+                exit_price,
+                abs(realized_pnl),
             )
 
 
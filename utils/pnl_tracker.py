@@ -60,9 +60,9 @@ class TradeRecord:
         }
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PnLSummary:
-    """PnL summary statistics"""
+    """PnL summary statistics (immutable snapshot — safe to share between callers)"""
 
     total_trades: int = 0
     wins: int = 0
@@ -115,15 +115,32 @@ class PnLTracker:
         self.current_balance = initial_balance
         self.peak_balance = initial_balance
         self.trades: List[TradeRecord] = []
-        # Closed trades kept separately so get_summary() avoids a full O(n) scan every call.
+        # Closed trades kept separately so trade-history reads avoid scanning open trades.
+        # get_summary() reads the running totals below instead of iterating this list.
         self._closed_trades: List[TradeRecord] = []
+        # position_id -> closed trade, so callers persisting a just-settled
+        # position can fetch its trade without scanning the full history.
+        self._closed_by_position: Dict[str, TradeRecord] = {}
         self.open_positions: Dict[str, TradeRecord] = {}
         self.max_drawdown = 0.0
         self.current_drawdown = 0.0
         self._lock = threading.Lock()
+        self._reset_aggregates()
 
         logger.info(f"PnL tracker initialized with ${initial_balance:.2f}")
 
+    def _reset_aggregates(self) -> None:
+        """Zero the running closed-trade totals. Caller holds _lock (or is __init__)."""
+        self._wins = 0
+        self._losses = 0
+        self._sum_pnl = 0.0
+        self._sum_gross_pnl = 0.0
+        self._sum_fees = 0.0
+        self._sum_win_pnl = 0.0
+        self._sum_loss_pnl = 0.0
+        # Last snapshot built by get_summary(); cleared by every close/reset.
+        self._summary_cache: Optional[PnLSummary] = None
+
     def open_position(
         self,
         position_id: str,
@@ -150,7 +167,9 @@ class PnLTracker:
                 f"quantity must be positive, got {quantity!r} for position {position_id}"
             )
 
-        trade_id = f"{position_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        # One clock read for both the id suffix and entry_time.
+        now = datetime.now()
+        trade_id = f"{position_id}_{now:%Y%m%d%H%M%S%f}"
 
         trade = TradeRecord(
             trade_id=trade_id,
@@ -159,7 +178,7 @@ class PnLTracker:
             action="BUY",
             quantity=quantity,
             entry_price=entry_price,
-            entry_time=datetime.now(),
+            entry_time=now,
             entry_fee=entry_fee,
             slippage_pct=slippage_pct,
         )
@@ -232,6 +251,19 @@ class PnLTracker:
             # Remove from open positions and add to the closed-trade index
             del self.open_positions[position_id]
             self._closed_trades.append(trade)
+            self._closed_by_position[position_id] = trade
+
+            # Fold the trade into the running totals so get_summary() is O(1)
+            self._sum_pnl += net_pnl
+            self._sum_gross_pnl += gross_pnl
+            self._sum_fees += total_fees
+            if net_pnl > 0:
+                self._wins += 1
+                self._sum_win_pnl += net_pnl
+            else:
+                self._losses += 1
+                self._sum_loss_pnl += net_pnl
+            self._summary_cache = None
 
         # Log result
         fee_str = f" | fees ${total_fees:.2f}" if total_fees > 0 else ""
@@ -256,63 +288,51 @@ class PnLTracker:
             PnLSummary object
         """
         with self._lock:
-            # _closed_trades is updated incrementally in close_position — O(1) per close,
-            # so this snapshot is O(k) where k = closed trades, not O(all trades).
-            closed_trades = list(self._closed_trades)
-            peak_balance = self.peak_balance
-            max_drawdown = self.max_drawdown
-            current_drawdown = self.current_drawdown
-
-        if not closed_trades:
-            return PnLSummary(
-                peak_balance=peak_balance,
-                initial_balance=self.initial_balance,
-            )
-
-        # Single pass over closed trades
-        wins_count = losses_count = 0
-        total_pnl = total_win_pnl = total_loss_pnl = 0.0
-        total_gross_pnl = total_fees = 0.0
-        for t in closed_trades:
-            total_pnl += t.pnl
-            total_gross_pnl += t.gross_pnl or 0.0
-            total_fees += t.total_fees
-            if t.pnl > 0:
-                wins_count += 1
-                total_win_pnl += t.pnl
+            if self._summary_cache is not None:
+                return self._summary_cache
+            # Running totals are folded in by close_position(), so building the
+            # snapshot is O(1) regardless of how many trades have closed.
+            total_trades = self._wins + self._losses
+            wins_count = self._wins
+            losses_count = self._losses
+            total_win_pnl = self._sum_win_pnl
+            total_loss_pnl = self._sum_loss_pnl
+
+            if not total_trades:
+                summary = PnLSummary(
+                    peak_balance=self.peak_balance,
+                    initial_balance=self.initial_balance,
+                )
             else:
-                losses_count += 1
-                total_loss_pnl += t.pnl
-
-        total_trades = len(closed_trades)
-        win_rate = wins_count / total_trades * 100
-        average_win = total_win_pnl / wins_count if wins_count else 0.0
-        average_loss = total_loss_pnl / losses_count if losses_count else 0.0
-        abs_loss = abs(total_loss_pnl)
-        profit_factor = total_win_pnl / abs_loss if abs_loss > 0 else 0.0
-
-        return PnLSummary(
-            total_trades=total_trades,
-            wins=wins_count,
-            losses=losses_count,
-            total_pnl=total_pnl,
-            gross_pnl=total_gross_pnl,
-            total_fees_paid=total_fees,
-            win_rate=win_rate,
-            average_win=average_win,
-            average_loss=average_loss,
-            profit_factor=profit_factor,
-            max_drawdown=max_drawdown,
-            current_drawdown=current_drawdown,
-            peak_balance=peak_balance,
-            initial_balance=self.initial_balance,
-        )
+                abs_loss = abs(total_loss_pnl)
+                summary = PnLSummary(
+                    total_trades=total_trades,
+                    wins=wins_count,
+                    losses=losses_count,
+                    total_pnl=self._sum_pnl,
+                    gross_pnl=self._sum_gross_pnl,
+                    total_fees_paid=self._sum_fees,
+                    win_rate=wins_count / total_trades * 100,
+                    average_win=total_win_pnl / wins_count if wins_count else 0.0,
+                    average_loss=total_loss_pnl / losses_count if losses_count else 0.0,
+                    profit_factor=total_win_pnl / abs_loss if abs_loss > 0 else 0.0,
+                    max_drawdown=self.max_drawdown,
+                    current_drawdown=self.current_drawdown,
+                    peak_balance=self.peak_balance,
+                    initial_balance=self.initial_balance,
+                )
+            self._summary_cache = summary
+            return summary
 
     def get_open_positions(self) -> List[TradeRecord]:
         """Get list of open positions"""
         with self._lock:
             return list(self.open_positions.values())
 
+    def get_closed_trade(self, position_id: str) -> Optional[TradeRecord]:
+        """Return the closed trade for *position_id*, or None if it is still open / unknown."""
+        return self._closed_by_position.get(position_id)
+
     def get_trade_history(self, limit: Optional[int] = None) -> List[TradeRecord]:
         """Get trade history"""
         with self._lock:
@@ -358,9 +378,11 @@ class PnLTracker:
             self.peak_balance = self.initial_balance
             self.trades = []
             self._closed_trades = []
+            self._closed_by_position = {}
             self.open_positions = {}
             self.max_drawdown = 0.0
             self.current_drawdown = 0.0
+            self._reset_aggregates()
 
         logger.info(f"PnL tracker reset with ${self.initial_balance:.2f}")
 
@@ -0,0 +1,59 @@
+"""
+Row serialisation helpers
+Spec-driven to_dict() shared by the SQLAlchemy models and runtime dataclasses.
+"""
+
+from operator import attrgetter
+
+
+def iso(value):
+    """ISO-8601 string for a datetime, or None when unset."""
+    return value.isoformat() if value else None
+
+
+class DictRowMixin:
+    """
+    to_dict() / to_dicts() driven by a per-class _DICT_SPEC.
+
+    Each spec entry is either an attribute name (copied as-is), a
+    (name, converter) pair, or (key, attribute, converter) when the output
+    key differs from the column.  The spec is compiled once per class into a
+    single attrgetter plus the list of columns that need conversion, so bulk
+    serialisation via to_dicts() does one C-level attribute fetch per row.
+    """
+
+    __slots__ = ()
+    _DICT_SPEC: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        keys, attrs, converters = [], [], []
+        for i, entry in enumerate(cls._DICT_SPEC):
+            if isinstance(entry, str):
+                entry = (entry, entry, None)
+            elif len(entry) == 2:
+                entry = (entry[0], entry[0], entry[1])
+            key, attr, conv = entry
+            keys.append(key)
+            attrs.append(attr)
+            if conv is not None:
+                converters.append((i, conv))
+        cls._dict_keys = tuple(keys)
+        cls._dict_getter = attrgetter(*attrs)
+        cls._dict_converters = tuple(converters)
+
+    @classmethod
+    def to_dicts(cls, rows) -> list:
+        keys = cls._dict_keys
+        getter = cls._dict_getter
+        converters = cls._dict_converters
+        out = []
+        for row in rows:
+            values = list(getter(row))
+            for i, conv in converters:
+                values[i] = conv(values[i])
+            out.append(dict(zip(keys, values)))
+        return out
+
+    def to_dict(self) -> dict:
+        return self.to_dicts((self,))[0]
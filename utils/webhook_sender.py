@@ -13,11 +13,19 @@ Embed color palette matches the dashboard design system:
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+from config.polymarket_config import config
 from utils.logger import logger
 
+# Module-level Session so consecutive alerts reuse the TCP/TLS connection to
+# discord.com instead of handshaking per POST.  One host; two sockets match
+# AlertManager's two dispatch threads.
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 # ── Design-system colors (integer form for Discord) ─────────────────
 _COLOR_GREEN = 0x3ECF8E  # profit / success / running
 _COLOR_YELLOW = 0xF5A623  # warning / loss
@@ -270,8 +278,6 @@ class WebhookSender:
     """
 
     def __init__(self, webhook_url: str, discord_username: Optional[str] = None):
-        from config.polymarket_config import config
-
         self.webhook_url = webhook_url
         self.timeout = 10
         self.retry_count = 3
@@ -344,7 +350,7 @@ class WebhookSender:
     def _post(self, payload: Dict) -> bool:
         for attempt in range(self.retry_count):
             try:
-                resp = requests.post(
+                resp = _http_session.post(
                     self.webhook_url,
                     json=payload,
                     timeout=self.timeout,